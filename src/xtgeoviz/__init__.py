@@ -1,7 +1,18 @@
-# flake8: noqa
-from xtgeoviz.frontends import xsectplotting
-from xtgeoviz.frontends.xsectplotting import xsectplot
-from xtgeoviz.plot.quickplot import quickplot
+"""The XTGeoViz package.
+
+The public functions are imported on first use (PEP 562), so that a bare
+``import xtgeoviz`` does not pull in matplotlib, scipy and xtgeo.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from xtgeoviz.frontends import xsectplotting
+    from xtgeoviz.frontends.xsectplotting import xsectplot
+    from xtgeoviz.plot.quickplot import quickplot
 
 try:
     from .version import version
@@ -9,3 +20,30 @@ try:
     __version__ = version
 except ImportError:
     __version__ = "0.0.0"
+
+# public name: (module, attribute in module, or None for the module itself)
+_LAZY_ATTRIBUTES = {
+    "xsectplotting": ("xtgeoviz.frontends.xsectplotting", None),
+    "xsectplot": ("xtgeoviz.frontends.xsectplotting", "xsectplot"),
+    "quickplot": ("xtgeoviz.plot.quickplot", "quickplot"),
+}
+
+__all__ = ["quickplot", "xsectplot", "xsectplotting"]
+
+
+def __getattr__(name):
+    try:
+        modname, attrname = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = importlib.import_module(modname)
+    if attrname is not None:
+        value = getattr(value, attrname)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
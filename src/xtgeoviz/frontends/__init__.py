@@ -1 +1,32 @@
-from .xsectplotting import xsectplot  # type: ignore # noqa
+"""The XTGeoViz frontends (scripts)"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .xsectplotting import xsectplot
+
+# imported on first use, so that 'python -m xtgeoviz.frontends.xsectplotting' does
+# not import the module twice
+_LAZY_ATTRIBUTES = {
+    "xsectplot": ".xsectplotting",
+}
+
+__all__ = ["xsectplot"]
+
+
+def __getattr__(name):
+    try:
+        modname = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(modname, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
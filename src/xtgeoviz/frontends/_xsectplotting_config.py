@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import numbers
+import os.path
+import pathlib
 import re
 from copy import deepcopy
 from typing import Optional, Union
@@ -57,7 +60,7 @@ input:
         geometry: No
         property:
             file: No
-            name: No
+            name: No  # or a list of names, plotted as layers with a plot file per name
             date: No
 
 
@@ -65,15 +68,19 @@ plotsettings:
 
     general:
         engine: matplotlib  # Alternatives not implemented yet
+        backend: agg  # matplotlib backend, agg for batch runs; No to keep current
+        fencecache: No  # folder to keep the well fences in, for later runs
 
     design:
         style: 1
-        zrange: smart1
+        zrange: smart1  # smart0, smart1, smart2 (per well), [min, max] or dict
         gridlines: both
         subtitle: ""
         legendsize: 6
         legends: True
         dpi: 100
+        simplify: No  # tolerance in pixels for thinning well paths and outlines
+        composite: No  # Yes: draw cube and grid as one image, at the plot resolution
 
     wellmap:
         otherwells: No
@@ -95,14 +102,17 @@ plotsettings:
         colors: seismic
         range: []
         interpolation: gaussian
+        smoothing: No  # gaussian sigma in cells, or [trace, depth]; as gaussianN
         alpha: 0.8
         sampling: nearest
+        dtype: float32  # image data, or uint8/uint16 to quantize within the range
 
     grid:
         colors: rainbow
         range: []
         alpha: 0.8
         zinc: 0.5
+        dtype: float32  # image data, or uint8/uint16 to quantize within the range
 
     wells:
         zonelog:
@@ -127,11 +137,40 @@ output:
     plotfolder: /tmp
     format: svg
     prefix: No
-    pdfjoin: No
+    pdfjoin: No  # file name, to write all wells as pages in one PDF (format: pdf)
     cleanup: No
+    incremental: No  # Yes: only replot wells with changed input or settings
+    savethreads: 2  # background threads writing the plot files, 0 to write in turn
+    profile: No  # Yes: write time per stage to profile.json/.csv; memory: also memory
 """
 
 
+VERBOSITIES = ("silent", "normal", "info", "debug")
+
+SMART_ZRANGES = ("smart0", "smart1", "smart2")
+
+# data types of the cube and grid images, where the integer types are quantized
+BACKDROP_DTYPES = ("float32", "float64", "uint8", "uint16")
+
+# file formats supported by matplotlib savefig() for the non-interactive backends
+OUTPUT_FORMATS = (
+    "eps",
+    "jpeg",
+    "jpg",
+    "pdf",
+    "pgf",
+    "png",
+    "ps",
+    "raw",
+    "rgba",
+    "svg",
+    "svgz",
+    "tif",
+    "tiff",
+    "webp",
+)
+
+
 class ConfigError(Exception):
     """Exception for config reading error."""
 
@@ -223,6 +262,147 @@ def data_merge(superset, subset, recursive=False):
     return superset
 
 
+def validate_config(config: dict, check_paths: bool = False) -> list:
+    """Validate a merged config, without loading any data.
+
+    Args:
+        config: The config, merged with defaults.
+        check_paths: If True, also check that the input files and folders exist.
+
+    Returns:
+        A list of problems, empty if the config is valid.
+    """
+    problems = []
+
+    if config["verbosity"] not in VERBOSITIES:
+        problems.append(
+            f"verbosity is <{config['verbosity']}>, must be one of {VERBOSITIES}"
+        )
+
+    design = config["plotsettings"]["design"]
+    zrange = design["zrange"]
+    if isinstance(zrange, str):
+        if zrange not in SMART_ZRANGES:
+            problems.append(f"design.zrange <{zrange}> is not one of {SMART_ZRANGES}")
+    elif isinstance(zrange, dict):
+        if "default" not in zrange:
+            problems.append("design.zrange as dict must have a 'default' entry")
+        problems.extend(
+            f"design.zrange for <{key}> is not a [min, max] pair"
+            for key, value in zrange.items()
+            if not _is_zpair(value)
+        )
+    elif zrange and not _is_zpair(zrange):
+        problems.append(f"design.zrange <{zrange}> is not a [min, max] pair")
+
+    fencefolder = config["plotsettings"]["general"]["fencecache"]
+    if fencefolder and not isinstance(fencefolder, str):
+        problems.append(f"general.fencecache <{fencefolder}> must be a folder or No")
+
+    simplify = design["simplify"]
+    if simplify and (not isinstance(simplify, numbers.Real) or simplify < 0):
+        problems.append(f"design.simplify <{simplify}> must be a positive number")
+
+    smoothing = config["plotsettings"]["cube"]["smoothing"]
+    if smoothing and not (
+        _is_sigma(smoothing)
+        or (
+            isinstance(smoothing, (list, tuple))
+            and len(smoothing) == 2
+            and all(_is_sigma(value) for value in smoothing)
+        )
+    ):
+        problems.append(
+            f"cube.smoothing <{smoothing}> must be a number >= 0 or a [trace, depth]"
+            " pair"
+        )
+
+    for backdrop in ("cube", "grid"):
+        dtype = config["plotsettings"][backdrop]["dtype"]
+        if dtype not in BACKDROP_DTYPES:
+            problems.append(
+                f"{backdrop}.dtype <{dtype}> is not one of {BACKDROP_DTYPES}"
+            )
+
+    if not isinstance(design["composite"], (bool, type(None))):
+        problems.append("design.composite must be Yes or No")
+
+    pnames = config["input"]["grid"]["property"]["name"]
+    if isinstance(pnames, list) and (not pnames or len(set(pnames)) < len(pnames)):
+        problems.append(f"input.grid.property.name <{pnames}> must be different names")
+
+    fmt = config["output"]["format"]
+    if str(fmt).lower() not in OUTPUT_FORMATS:
+        problems.append(f"output.format <{fmt}> is not one of {OUTPUT_FORMATS}")
+
+    if not isinstance(config["output"]["incremental"], (bool, type(None))):
+        problems.append("output.incremental must be Yes or No")
+
+    threads = config["output"]["savethreads"]
+    if not isinstance(threads, int) or threads < 0:
+        problems.append(f"output.savethreads <{threads}> must be an integer >= 0")
+
+    profile = config["output"]["profile"]
+    if profile not in (None, False, True, "memory"):
+        problems.append(f"output.profile <{profile}> must be Yes, No or 'memory'")
+
+    if check_paths:
+        problems.extend(_check_input_paths(config["input"]))
+
+    return problems
+
+
+def _is_sigma(value):
+    return (
+        isinstance(value, numbers.Real) and not isinstance(value, bool) and value >= 0
+    )
+
+
+def _is_zpair(value):
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) == 2
+        and all(isinstance(val, numbers.Real) for val in value)
+        and value[0] < value[1]
+    )
+
+
+def _check_input_paths(inputcfg):
+    """Check that files and folders given in the input section exist."""
+    problems = []
+
+    wells = inputcfg["wells"]
+    if not wells["objects"] and not wells["folder"]:
+        problems.append("input.wells needs either 'objects' or 'folder'")
+    elif not wells["objects"]:
+        folder = pathlib.Path(wells["folder"])
+        if not folder.is_dir():
+            problems.append(f"input.wells.folder <{folder}> does not exist")
+        elif not any(folder.glob(wells["wildcard"])):
+            problems.append(
+                f"input.wells: no files matching <{wells['wildcard']}> in <{folder}>"
+            )
+
+    for case, surfs in inputcfg["surfaces"].items():
+        folder = surfs["folder"]
+        if not surfs["objects"] and folder and not os.path.isdir(folder):
+            problems.append(f"input.surfaces.{case}.folder <{folder}> does not exist")
+
+    files = {
+        "input.outline": inputcfg["outline"],
+        "input.cube": inputcfg["cube"],
+        "input.grid.geometry": inputcfg["grid"]["geometry"],
+        "input.grid.property.file": inputcfg["grid"]["property"]["file"],
+    }
+    problems.extend(
+        f"{key} <{fname}> does not exist"
+        for key, fname in files.items()
+        if isinstance(fname, str) and not os.path.isfile(fname)
+    )
+
+    return problems
+
+
 def config_complete(self):
     """Improving the config to make all sorts of defaults and smart stuff."""
 
@@ -255,10 +435,16 @@ def config_complete(self):
 
     if isinstance(_zrange, str):
         if _zrange == "smart0":
-            newcfg_plt["design"]["zrange"] = _config_smart0_zrange(prm)
+            newcfg_plt["design"]["zrange"] = _config_smart0_zrange(
+                self.summary["primary"]
+            )
         elif _zrange == "smart1":
             newcfg_plt["design"]["zrange"] = _config_smart1_zrange(
-                self.wells["wlist"], prm
+                self.summary["wells"], self.summary["primary"]
+            )
+        elif _zrange == "smart2":
+            newcfg_plt["design"]["zrange"] = _config_smart2_zrange(
+                self.wells["wlist"], prm, self.summary
             )
     elif isinstance(_zrange, dict):
         # process zrange per well, with a global default
@@ -278,18 +464,25 @@ def config_complete(self):
         newcfg_plt["cube"]["range"] = [self.cube.values.min(), self.cube.values.max()]
 
     if self.grid and not newcfg_plt["grid"]["range"]:
-        newcfg_plt["grid"]["range"] = [
-            self.gridproperty.values.min(),
-            self.gridproperty.values.max(),
-        ]
+        if isinstance(self.gridproperty, dict):
+            # a range per property, plotted as layers
+            newcfg_plt["grid"]["range"] = {
+                name: [prop.values.min(), prop.values.max()]
+                for name, prop in self.gridproperty.items()
+            }
+        else:
+            newcfg_plt["grid"]["range"] = [
+                self.gridproperty.values.min(),
+                self.gridproperty.values.max(),
+            ]
 
     self.config = newcfg
 
 
 def _config_smart0_zrange(primary):
-    """If no zrange is given, try to guess from surfaces"""
-    minv = primary[0].values.min()
-    maxv = primary[-1].values.max()
+    """If no zrange is given, try to guess from surfaces (as summary table)"""
+    minv = float(primary["zmin"].iloc[0])
+    maxv = float(primary["zmax"].iloc[-1])
 
     minv = round(minv - 10, -1)
     maxv = round(maxv + 10, -1)
@@ -297,20 +490,11 @@ def _config_smart0_zrange(primary):
     return [minv, maxv]
 
 
-def _config_smart1_zrange(wlist, primary):
-    minv = primary[0].values.min()
-    maxv = primary[-1].values.max()
+def _config_smart1_zrange(wells, primary):
+    """As smart0, but the base is not deeper than the deepest well."""
+    minv, maxv = _config_smart0_zrange(primary)
 
-    minv = round(minv - 10, -1)
-    maxv = round(maxv + 10, -1)
-
-    maxwell = minv
-    for well in wlist:
-        zval = well.dataframe["Z_TVDSS"].values
-        maxw = zval.max()
-        maxw = round(maxw + 10, -1)
-        if maxw > maxwell:
-            maxwell = maxw
+    maxwell = max(minv, round(float(wells["zmax"].max()) + 10, -1))
 
     if maxwell < maxv:
         maxv = maxwell
@@ -318,6 +502,53 @@ def _config_smart1_zrange(wlist, primary):
     return [minv, maxv]
 
 
+def _config_smart2_zrange(wlist, primary, summary):
+    """As smart1, but per well, from the surfaces sampled along the well path.
+
+    The surfaces are sampled at the XY points of the well, which do not depend on
+    the zrange, as the fence of the plot does (it starts at the zmin of the plot).
+
+    Returns a dict with zrange per well name; wells where the surfaces are
+    undefined along the path get the smart1 zrange.
+    """
+    import numpy as np
+
+    from xtgeoviz.plot import _wellstore
+
+    default = _config_smart1_zrange(summary["wells"], summary["primary"])
+
+    zrange_dict = {}
+    for iwell, well in enumerate(wlist):
+        zrange_dict[well.name] = default
+
+        columns = _wellstore.well_columns(well)
+        path = np.column_stack(
+            [columns[name] for name in ("X_UTME", "Y_UTMN", "Z_TVDSS")]
+        )
+        path = path[np.isfinite(path).all(axis=1)]
+        if len(path) == 0:
+            continue
+        steps = np.hypot(*np.diff(path[:, :2], axis=0).T)
+        path = np.column_stack((path, np.concatenate(([0.0], np.cumsum(steps)))))
+
+        top = primary[0].get_randomline(path)[:, 1]
+        base = primary[-1].get_randomline(path)[:, 1]
+        if np.isnan(top).all() or np.isnan(base).all():
+            continue
+
+        minv = round(np.nanmin(top) - 10, -1)
+        maxv = round(np.nanmax(base) + 10, -1)
+        # by position, as well names may be repeated
+        maxwell = round(float(summary["wells"]["zmax"].iloc[iwell]) + 10, -1)
+        if minv < maxwell < maxv:
+            maxv = maxwell
+
+        zrange_dict[well.name] = [float(minv), float(maxv)]
+        logger.info("Smart2: set %s zrange to %s", well.name, zrange_dict[well.name])
+
+    return zrange_dict
+
+
 def _config_userdefined_zrange(wlist: list, _zrange: dict) -> dict:
     zrange_dict = {}
 
@@ -359,6 +590,9 @@ def update_plotsettings(self, cfg):
 
     self.title = cfg["title"]
 
+    self.general_backend = pcfg["general"]["backend"]
+    self.general_fencecache = pcfg["general"]["fencecache"]
+
     self.design_style = pcfg["design"]["style"]
     self.design_zrange = pcfg["design"]["zrange"]
     self.design_gridlines = pcfg["design"]["gridlines"]
@@ -366,6 +600,8 @@ def update_plotsettings(self, cfg):
     self.design_legendsize = pcfg["design"]["legendsize"]
     self.design_legends = pcfg["design"]["legends"]
     self.design_dpi = pcfg["design"]["dpi"]
+    self.design_simplify = pcfg["design"]["simplify"]
+    self.design_composite = bool(pcfg["design"]["composite"])
 
     self.wellmap_otherwells = pcfg["wellmap"]["otherwells"]
     self.wellmap_expand = pcfg["wellmap"]["expand"]
@@ -381,13 +617,16 @@ def update_plotsettings(self, cfg):
     self.cube_colors = pcfg["cube"]["colors"]
     self.cube_range = pcfg["cube"]["range"]
     self.cube_interpolation = pcfg["cube"]["interpolation"]
+    self.cube_smoothing = pcfg["cube"]["smoothing"] or None
     self.cube_alpha = pcfg["cube"]["alpha"]
     self.cube_sampling = pcfg["cube"]["sampling"]
+    self.cube_dtype = pcfg["cube"]["dtype"]
 
     self.grid_colors = pcfg["grid"]["colors"]
     self.grid_range = pcfg["grid"]["range"]
     self.grid_alpha = pcfg["grid"]["alpha"]
     self.grid_zinc = pcfg["grid"]["zinc"]
+    self.grid_dtype = pcfg["grid"]["dtype"]
 
     self.wells_zonelog_colors = pcfg["wells"]["zonelog"]["colors"]
     self.wells_zonelog_zoneshift = pcfg["wells"]["zonelog"]["zoneshift"]
@@ -401,7 +640,10 @@ def update_plotsettings(self, cfg):
     self.wells_wellcrossings_wfilter = pcfg["wells"]["wellcrossings"]["wfilter"]
 
     self.output_plotfolder = cfg["output"]["plotfolder"]
-    self.output_format = cfg["output"]["format"]
+    self.output_format = str(cfg["output"]["format"]).lower()
     self.output_prefix = cfg["output"]["prefix"]
     self.output_pdfjoin = cfg["output"]["pdfjoin"]
     self.output_cleanup = cfg["output"]["cleanup"]
+    self.output_incremental = cfg["output"]["incremental"]
+    self.output_savethreads = cfg["output"]["savethreads"]
+    self.output_profile = cfg["output"]["profile"]
@@ -5,17 +5,27 @@ from __future__ import annotations
 import logging
 import pathlib
 
+import numpy as np
+import pandas as pd
 import xtgeo
 
 logger = logging.getLogger(__name__)
 
+# the columns of the summary tables of wells and surfaces, made at load time
+SUMMARY_COLUMNS = ["xmin", "xmax", "ymin", "ymax", "zmin", "zmax"]
+
+# grid property files (Eclipse) that are read with the grid, as xtgeo requires
+GRID_PROPERTY_SUFFIXES = (".init", ".finit", ".unrst", ".funrst", ".grdecl", ".bgrdecl")
+
 
 def load_wells(self):
     """Load wells from files, return as XTGeo well objects."""
     wlist = []
+    wfiles = []
 
     if self.config["input"]["wells"]["objects"]:
         wlist = self.config["input"]["wells"]["objects"]
+        wfiles = [None] * len(wlist)
 
     else:
         wellfolder = pathlib.Path(self.config["input"]["wells"]["folder"])
@@ -29,11 +39,14 @@ def load_wells(self):
                 strict=False,
             )
             wlist.append(wobj)
+            wfiles.append(str(well))
 
         if not wlist:
             raise SystemExit("Cannot plot, no wells as input")
 
     self.wells["wlist"] = wlist
+    self.summary["wells"] = summarize_wells(wlist)
+    self.wells["files"] = wfiles  # None for wells given as objects
 
     self.wells["zonelog"] = self.config["input"]["wells"]["zonelog"]
 
@@ -64,6 +77,7 @@ def _load_surfaces_generic(self, case="primary"):
 
     if config["input"]["surfaces"][case]["objects"]:
         sdict = config["input"]["surfaces"][case]["objects"]
+        self.inputfiles.append(None)
 
     else:
         surffolder = None
@@ -82,6 +96,7 @@ def _load_surfaces_generic(self, case="primary"):
             for inum, surf in enumerate(sorted(surffolder.glob(wcard))):
                 logger.info("Read surface file: %s", surf)
                 sobjects.append(xtgeo.surface_from_file(surf))
+                self.inputfiles.append(str(surf))
 
         sdict = sobjects
 
@@ -94,6 +109,44 @@ def _load_surfaces_generic(self, case="primary"):
             srf.name = "Surface_" + str(inum)
 
     self.surfaces[case] = sdict
+    self.summary[case] = summarize_surfaces(sdict)
+
+
+def summarize_wells(wlist: list) -> pd.DataFrame:
+    """Return the XY bounding box and Z range per well, indexed by well name."""
+    rows = []
+    for well in wlist:
+        dfr = well.get_dataframe(copy=False)
+        rows.append(
+            _bounds(
+                dfr["X_UTME"].to_numpy(),
+                dfr["Y_UTMN"].to_numpy(),
+                dfr["Z_TVDSS"].to_numpy(),
+            )
+        )
+    return pd.DataFrame(
+        rows, index=[well.name for well in wlist], columns=SUMMARY_COLUMNS
+    )
+
+
+def summarize_surfaces(slist: list) -> pd.DataFrame:
+    """Return the XY bounding box and Z range per surface, in input order."""
+    rows = [
+        (srf.xmin, srf.xmax, srf.ymin, srf.ymax, srf.values.min(), srf.values.max())
+        for srf in slist
+    ]
+    return pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
+
+
+def _bounds(xval, yval, zval):
+    return (
+        np.nanmin(xval),
+        np.nanmax(xval),
+        np.nanmin(yval),
+        np.nanmax(yval),
+        np.nanmin(zval),
+        np.nanmax(zval),
+    )
 
 
 def load_surfaces(self):
@@ -109,8 +162,10 @@ def load_outline(self):
     if isinstance(outline, str):
         logger.info("Read outline: %s", outline)
         self.outline = xtgeo.polygons_from_file(outline)
+        self.inputfiles.append(outline)
     elif isinstance(outline, xtgeo.Polygons):
         self.outline = outline
+        self.inputfiles.append(None)
 
 
 def load_cube(self):
@@ -122,15 +177,17 @@ def load_cube(self):
         logger.info("Reading cube: %s", cube)
         self.cube = xtgeo.cube_from_file(cube)
         logger.info("Reading cube done")
+        self.inputfiles.append(cube)
     elif cube and isinstance(cube, xtgeo.Cube):
         self.cube = cube
+        self.inputfiles.append(None)
         logger.info("Apply an existing Cube instance: %s", type(cube))
     else:
         self.cube = None
 
 
 def load_grid(self):
-    """Load a grid with property"""
+    """Load a grid with property, or a dict of properties if several names"""
 
     gfile = self.config["input"]["grid"]["geometry"]
     pfile = self.config["input"]["grid"]["property"]["file"]
@@ -138,7 +195,8 @@ def load_grid(self):
     pdate = self.config["input"]["grid"]["property"]["date"]
 
     read_grid = True
-    if gfile == self.config["input"]["surfaces"]["fromgrid"]:
+    fromgrid = self.config["input"]["surfaces"].get("fromgrid")
+    if self.grid is not None and gfile == fromgrid:
         # skip reading grid once more
         read_grid = False
 
@@ -148,5 +206,21 @@ def load_grid(self):
             self.grid = xtgeo.grid_from_file(gfile)
             logger.info("Reading grid geometry done")
         logger.info("Reading grid property: %s", pfile)
-        self.gridproperty = xtgeo.gridproperty_from_file(pfile, name=pname, date=pdate)
+        # the grid is needed for Eclipse files, and a date only for restart files
+        kwargs = {}
+        if str(pfile).lower().endswith(GRID_PROPERTY_SUFFIXES):
+            kwargs["grid"] = self.grid
+        if pdate:
+            kwargs["date"] = pdate
+        if isinstance(pname, list):
+            # several properties, plotted as layers of one plot per well
+            self.gridproperty = {
+                name: xtgeo.gridproperty_from_file(pfile, name=name, **kwargs)
+                for name in pname
+            }
+        else:
+            self.gridproperty = xtgeo.gridproperty_from_file(
+                pfile, name=pname, **kwargs
+            )
         logger.info("Reading grid property done")
+        self.inputfiles.extend([gfile, pfile])
@@ -0,0 +1,172 @@
+"""Manifest of plots made by xsectplot, for incremental re-plotting.
+
+The manifest is stored as JSON in the plot folder, and records a fingerprint per
+plot file. The fingerprint is a hash of the well file, the other input files
+(surfaces, outline, cube, grid), the input config and the effective plot settings
+for the well. A well is only plotted again if its fingerprint has changed.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import os.path
+from typing import Any
+
+import xtgeoviz
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+_CHUNKSIZE = 1 << 20
+
+# settings that do not change the content of the plots
+_IGNORED_SETTINGS = (
+    "output_cleanup",
+    "output_incremental",
+    "output_profile",
+    "output_savethreads",
+)
+
+
+class Manifest:
+    """The plot files made by earlier runs, with fingerprints.
+
+    Args:
+        path: The manifest file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.plots = {}  # plot file name -> fingerprint
+        self.files = {}  # input file -> {"size", "mtime_ns", "digest"}
+        self._common = None
+        self._used: set[str] = set()  # input files of this run, others are not written
+
+        try:
+            with open(path, encoding="utf-8") as stream:
+                data = json.load(stream)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as err:
+            logger.warning("Cannot read manifest %s, plot all wells: %s", path, err)
+            return
+
+        if data.get("version") != MANIFEST_VERSION:
+            logger.info("Manifest %s is of another version, plot all wells", path)
+            return
+
+        self.plots = data["plots"]
+        self.files = data["files"]
+
+    def digest(self, filename: str) -> str:
+        """Return the content hash of a file.
+
+        The hash from an earlier run is used if the file size and modification time
+        are unchanged, so large files (e.g. cubes) are not read each run.
+        """
+        filename = os.path.abspath(filename)
+        stat = os.stat(filename)
+        self._used.add(filename)
+
+        known = self.files.get(filename)
+        if known and (known["size"], known["mtime_ns"]) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return known["digest"]
+
+        hasher = hashlib.sha256()
+        with open(filename, "rb") as stream:
+            while chunk := stream.read(_CHUNKSIZE):
+                hasher.update(chunk)
+
+        self.files[filename] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": hasher.hexdigest(),
+        }
+        return hasher.hexdigest()
+
+    def fingerprint(self, app, pset, iwell: int) -> str | None:
+        """Return the fingerprint of the plot for a well, or None if unknown.
+
+        The fingerprint is unknown if the well or any other input is given as an
+        object rather than as a file.
+        """
+        if self._common is None:
+            self._common = self._common_fingerprint(app)
+
+        wfile = app.wells["files"][iwell]
+        if self._common is False or wfile is None:
+            return None
+
+        well = app.wells["wlist"][iwell]
+        settings: dict[str, Any] = dataclasses.asdict(pset)
+        for key in _IGNORED_SETTINGS:
+            settings.pop(key, None)
+        if isinstance(pset.design_zrange, dict):
+            settings["design_zrange"] = pset.design_zrange[well.name]
+
+        parts: dict[str, Any] = {
+            "common": self._common,
+            "well": self.digest(wfile),
+            "settings": settings,
+        }
+        if pset.wellmap_otherwells or pset.wells_wellcrossings_show:
+            # the other wells are drawn or crossed in the plot
+            parts["otherwells"] = [self.digest(wf) for wf in app.wells["files"]]
+        if isinstance(pset.wells_wellcrossings_show, str):
+            parts["wellcrossings"] = self.digest(pset.wells_wellcrossings_show)
+
+        return _hash(parts)
+
+    def _common_fingerprint(self, app):
+        """The fingerprint of the input shared by all wells, False if unknown."""
+        if None in app.inputfiles:
+            logger.info("Some input is given as objects, plot all wells")
+            return False
+
+        return _hash(
+            {
+                "version": xtgeoviz.__version__,
+                "input": app.config["input"],
+                "files": sorted(self.digest(ifile) for ifile in app.inputfiles),
+            }
+        )
+
+    def unchanged(self, plotfile: str, fingerprint: str | None) -> bool:
+        """Return True if the plot file exists, made with the same fingerprint."""
+        return (
+            fingerprint is not None
+            and self.plots.get(os.path.basename(plotfile)) == fingerprint
+            and os.path.isfile(plotfile)
+        )
+
+    def record(self, plotfile: str, fingerprint: str | None):
+        """Record a plot file made, with its fingerprint."""
+        if fingerprint is None:
+            self.plots.pop(os.path.basename(plotfile), None)
+        else:
+            self.plots[os.path.basename(plotfile)] = fingerprint
+
+    def write(self):
+        """Write the manifest file."""
+        files = {name: self.files[name] for name in sorted(self._used)}
+        with open(self.path, "w", encoding="utf-8") as stream:
+            json.dump(
+                {"version": MANIFEST_VERSION, "plots": self.plots, "files": files},
+                stream,
+                indent=4,
+            )
+        logger.info("Manifest written to %s", self.path)
+
+
+def _hash(data) -> str:
+    """Hash JSON serializable data; other values are hashed by their str()."""
+    text = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -7,11 +7,13 @@ import logging
 import os
 import os.path
 import shutil
-import subprocess
 
 import pandas as pd
+from matplotlib.backends.backend_pdf import PdfPages
 
-from xtgeoviz.plot import XSection
+from xtgeoviz.plot import SavePool, XSection, _profiling, fencecache
+
+from . import _xsectplotting_manifest as _manifest
 
 logger = logging.getLogger(__name__)
 
@@ -38,177 +40,275 @@ def _plotting_mpl(self, pset):
 
     wellcross = _compute_wellcrossings(pset)
 
-    plotfiles = []
-
-    for well in self.wells["wlist"]:
-        logger.info("Plot cross section for well %s", well.name)
-
-        if isinstance(pset.design_zrange, dict):
-            zrange_min, zrange_max = pset.design_zrange[well.name]
-        else:
-            zrange_min, zrange_max = pset.design_zrange
-
-        xplot = XSection(
-            zmin=zrange_min,
-            zmax=zrange_max,
-            well=well,
-            surfaces=self.surfaces["primary"],
-            zonelogshift=pset.wells_zonelog_zoneshift,
-            outline=self.outline,
-            colormap=pset.surf_primary_colors,
-            cube=self.cube,
-            grid=self.grid,
-            gridproperty=self.gridproperty,
-        )
-
-        xplot.colormap_facies = pset.wells_facieslog_colors
-        xplot.colormap_facies_dict = pset.wells_facieslog_colordict
-
-        xplot.colormap_perf = pset.wells_perflog_colors
-        xplot.colormap_perf_dict = pset.wells_perflog_colordict
-
-        xplot.colormap_zonelog = pset.wells_zonelog_colors
-        xplot.colormap_zonelog_dict = pset.wells_zonelog_colordict
-
-        xplot.legendsize = pset.design_legendsize
-        xplot.has_legend = pset.design_legends
-
-        if xplot.fence is None:
-            continue
-
-        xplot.canvas(title=well.xwellname, subtitle=pset.design_subtitle)
-
-        if self.cube:
-            logger.info("Plot cube backdrop")
-            vmin, vmax = (None, None)
-            if pset.cube_range:
-                vmin, vmax = pset.cube_range
-
-            xplot.plot_cube(
-                colormap=pset.cube_colors,
-                vmin=vmin,
-                vmax=vmax,
-                alpha=pset.cube_alpha,
-                interpolation=pset.cube_interpolation,
-                sampling=pset.cube_sampling,
-            )
-
-        if self.grid:
-            vmin, vmax = (None, None)
-            if pset.grid_range:
-                vmin, vmax = pset.grid_range
-
-            xplot.plot_grid3d(
-                colormap=pset.grid_colors,
-                vmin=vmin,
-                vmax=vmax,
-                alpha=pset.grid_alpha,
-                zinc=pset.grid_zinc,
-            )
-
-        logger.info("Plot primary surfaces")
-        xplot.plot_surfaces(
-            fill=pset.surf_primary_fill,
-            axisname="main",
-            gridlines=True,
-            legend=pset.design_legends,
-        )
-
-        wcdf = None
-        if wellcross is not None:
-            wcdf = wellcross.copy()
-            wcdf = wcdf.loc[wcdf["WELL"] == well.xwellname]
-            del wcdf["WELL"]
-
-        logger.info("Plot well path")
-        xplot.plot_well(
-            zonelogname=self.wells["zonelog"],
-            facieslogname=self.wells["facieslog"],
-            perflogname=self.wells["perflog"],
-            wellcrossings=wcdf,
-        )
-
-        logger.info("Plot primary again (replot, thin lines)")
-        xplot.plot_surfaces(
-            fill=False, axisname="lines", legend=False, linewidth=0.3, onecolor="black"
+    profiler = _profiling.active()
+
+    # the plot files are encoded and written in background threads, if any
+    pool = SavePool(pset.output_savethreads) if pset.output_savethreads else None
+
+    # with pdfjoin, a page is appended to one PDF file as each well is done
+    pdfpages = _open_pdfjoin(pset)
+
+    # with incremental plotting, wells with unchanged input and settings are skipped
+    manifest = _open_manifest(pset)
+    force = self.args is not None and self.args.force
+    fingerprints = {}
+    errors = {}
+
+    # with several grid properties, a plot is saved per property (layer)
+    layers = [None]
+    if self.grid and isinstance(self.gridproperty, dict):
+        layers = list(self.gridproperty)
+
+    wells = []
+    for iwell, well in enumerate(self.wells["wlist"]):
+        fingerprint = None
+        if manifest is not None:
+            fingerprint = manifest.fingerprint(self, pset, iwell)
+            pnames = [_plot_name(well, pset, layer) for layer in layers]
+            if not force and all(
+                manifest.unchanged(pname, fingerprint) for pname in pnames
+            ):
+                logger.info("Well %s is unchanged, keep %s", well.name, pnames)
+                continue
+        wells.append((well, fingerprint))
+
+    # the fences of the wells are computed in parallel, for the zmin of each plot
+    if pset.general_fencecache:
+        fencecache.configure(folder=pset.general_fencecache)
+    fencecache.configure(maxsize=max(fencecache.FENCE_CACHE_SIZE, len(wells)))
+    with _profiling.stage("fences"):
+        fencecache.precompute_fences(
+            [well for well, _ in wells],
+            tvdmin=[_well_zrange(well, pset)[0] for well, _ in wells],
         )
 
-        if self.surfaces["contacts"]:
+    with pool or contextlib.nullcontext(), pdfpages or contextlib.nullcontext():
+        for well, fingerprint in wells:
+            logger.info("Plot cross section for well %s", well.name)
+            if profiler is not None:
+                profiler.well = well.name
+
+            zrange_min, zrange_max = _well_zrange(well, pset)
+
+            with _profiling.stage("xsection_init"):
+                xplot = XSection(
+                    zmin=zrange_min,
+                    zmax=zrange_max,
+                    well=well,
+                    surfaces=self.surfaces["primary"],
+                    zonelogshift=pset.wells_zonelog_zoneshift,
+                    outline=self.outline,
+                    colormap=pset.surf_primary_colors,
+                    cube=self.cube,
+                    grid=self.grid,
+                    gridproperty=self.gridproperty,
+                )
+
+            xplot.colormap_facies = pset.wells_facieslog_colors
+            xplot.colormap_facies_dict = pset.wells_facieslog_colordict
+
+            xplot.colormap_perf = pset.wells_perflog_colors
+            xplot.colormap_perf_dict = pset.wells_perflog_colordict
+
+            xplot.colormap_zonelog = pset.wells_zonelog_colors
+            xplot.colormap_zonelog_dict = pset.wells_zonelog_colordict
+
+            xplot.legendsize = pset.design_legendsize
+            xplot.simplify = pset.design_simplify or None
+            xplot.has_legend = pset.design_legends
+
+            if xplot.fence is None:
+                continue
+
+            xplot.canvas(title=well.xwellname, subtitle=pset.design_subtitle)
+
+            if self.cube:
+                logger.info("Plot cube backdrop")
+                vmin, vmax = (None, None)
+                if pset.cube_range:
+                    vmin, vmax = pset.cube_range
+
+                xplot.plot_cube(
+                    colormap=pset.cube_colors,
+                    vmin=vmin,
+                    vmax=vmax,
+                    alpha=pset.cube_alpha,
+                    interpolation=pset.cube_interpolation,
+                    sampling=pset.cube_sampling,
+                    smoothing=pset.cube_smoothing,
+                    dtype=pset.cube_dtype,
+                    composite=pset.design_composite and pset.design_dpi,
+                )
+
+            if self.grid:
+                vmin, vmax = (None, None)
+                if isinstance(pset.grid_range, dict):
+                    vmin = {name: rng[0] for name, rng in pset.grid_range.items()}
+                    vmax = {name: rng[1] for name, rng in pset.grid_range.items()}
+                elif pset.grid_range:
+                    vmin, vmax = pset.grid_range
+
+                xplot.plot_grid3d(
+                    colormap=pset.grid_colors,
+                    vmin=vmin,
+                    vmax=vmax,
+                    alpha=pset.grid_alpha,
+                    zinc=pset.grid_zinc,
+                    dtype=pset.grid_dtype,
+                    composite=pset.design_composite and pset.design_dpi,
+                )
+
+            logger.info("Plot primary surfaces")
             xplot.plot_surfaces(
-                surfaces=self.surfaces["contacts"],
-                legendtitle="Contacts",
-                colormap=pset.surf_contacts_colors,
-                axisname="contacts",
+                fill=pset.surf_primary_fill,
+                axisname="main",
+                gridlines=True,
                 legend=pset.design_legends,
             )
 
-        if self.surfaces["secondary"]:
-            logger.info("Plot secondary surfaces")
-            xplot.plot_surfaces(
-                surfaces=self.surfaces["secondary"],
-                legendtitle=pset.surf_secondary_legend,
-                colormap=pset.surf_secondary_colors,
-                axisname="second",
-                linewidth=2,
-                legend=pset.design_legends,
+            wcdf = None
+            if wellcross is not None:
+                wcdf = wellcross.copy()
+                wcdf = wcdf.loc[wcdf["WELL"] == well.xwellname]
+                del wcdf["WELL"]
+
+            logger.info("Plot well path")
+            xplot.plot_well(
+                zonelogname=self.wells["zonelog"],
+                facieslogname=self.wells["facieslog"],
+                perflogname=self.wells["perflog"],
+                wellcrossings=wcdf,
             )
 
-        if pset.design_legends:
-            xplot.plot_map()
-            xplot.plot_wellmap(
-                expand=pset.wellmap_expand, otherwells=pset.wellmap_otherwells
+            logger.info("Plot primary again (replot, thin lines)")
+            xplot.plot_surfaces(
+                fill=False,
+                axisname="lines",
+                legend=False,
+                linewidth=0.3,
+                onecolor="black",
             )
 
-        pname = _save_fig(well, pset, xplot)
-        plotfiles.append(pname)
-
-    _collect_pdf(pset, plotfiles)
-
-
-def _save_fig(well, pset, xplot):
+            if self.surfaces["contacts"]:
+                xplot.plot_surfaces(
+                    surfaces=self.surfaces["contacts"],
+                    legendtitle="Contacts",
+                    colormap=pset.surf_contacts_colors,
+                    axisname="contacts",
+                    legend=pset.design_legends,
+                )
+
+            if self.surfaces["secondary"]:
+                logger.info("Plot secondary surfaces")
+                xplot.plot_surfaces(
+                    surfaces=self.surfaces["secondary"],
+                    legendtitle=pset.surf_secondary_legend,
+                    colormap=pset.surf_secondary_colors,
+                    axisname="second",
+                    linewidth=2,
+                    legend=pset.design_legends,
+                )
+
+            if pset.design_legends:
+                xplot.plot_map()
+                xplot.plot_wellmap(
+                    expand=pset.wellmap_expand,
+                    otherwells=self.wells["wlist"] if pset.wellmap_otherwells else None,
+                )
+
+            # savefig() is a draw method, which is timed as a stage of its own
+            with _profiling.stage("save"):
+                pnames = _save_fig(well, pset, xplot, pool, pdfpages, layers)
+            if manifest is not None:
+                for pname in pnames:
+                    fingerprints[pname] = fingerprint
+
+        if pool is not None:
+            with _profiling.stage("savefig_join"):
+                _, errors = pool.join()
+
+    if profiler is not None:
+        profiler.well = None
+
+    if manifest is not None:
+        for pname, fingerprint in fingerprints.items():
+            manifest.record(pname, None if pname in errors else fingerprint)
+        manifest.write()
+
+    if errors:
+        raise RuntimeError(f"Could not write plot files: {errors}")
+
+
+def _well_zrange(well, pset):
+    if isinstance(pset.design_zrange, dict):
+        return pset.design_zrange[well.name]
+    return pset.design_zrange
+
+
+def _plot_name(well, pset, layer=None):
     prefix = ""
     if pset.output_prefix:
         prefix = pset.output_prefix
 
-    pname = os.path.join(
-        pset.output_plotfolder, prefix + well.xwellname + "." + pset.output_format
+    suffix = ""
+    if layer is not None:
+        suffix = "_" + layer
+
+    return os.path.join(
+        pset.output_plotfolder,
+        prefix + well.xwellname + suffix + "." + pset.output_format,
     )
 
-    xplot.savefig(pname, fformat=pset.output_format, dpi=pset.design_dpi)
-    logger.info("Plotting xsection for %s to %s", well.wellname, pname)
+
+def _save_fig(well, pset, xplot, pool=None, pdfpages=None, layers=(None,)):
+    """Save the plot once per grid layer, and return the plot file names."""
+    pnames = []
+    for ilayer, layer in enumerate(layers):
+        last = ilayer == len(layers) - 1
+        if layer is not None:
+            xplot.show_grid_layer(layer)
+
+        if pdfpages is not None:
+            xplot.savefig(pdfpages, fformat="pdf", dpi=pset.design_dpi, last=last)
+            logger.info("Plotting xsection for %s as page in PDF file", well.wellname)
+            continue
+
+        pname = _plot_name(well, pset, layer)
+        xplot.savefig(
+            pname, fformat=pset.output_format, dpi=pset.design_dpi, last=last, pool=pool
+        )
+        logger.info("Plotting xsection for %s to %s", well.wellname, pname)
+        pnames.append(pname)
 
     if os.environ.get("XTG_SHOW"):
         xplot.show()
 
-    return pname
-
+    return pnames
 
-def _collect_pdf(pset, plotfiles):
-    if pset.output_format != "pdf":
-        return
 
-    if pset.output_pdfjoin:
-        masterfile = os.path.join([pset.output_plotfolder, pset.output_pdfjoin])
+def _open_pdfjoin(pset):
+    """Return a PdfPages for all wells if output.pdfjoin is set, otherwise None."""
+    if pset.output_format != "pdf" or not pset.output_pdfjoin:
+        return None
 
-        syscommand = (
-            "gs -sDEVICE=pdfwrite -dCompatibilityLevel=1.4 "
-            "-dPDFSETTINGS=/default -dNOPAUSE -dQUIET -dBATCH "
-            "-dDetectDuplicateImages -dCompressFonts=true -r150 "
-            f"-sOutputFile={masterfile} "
-        )
+    masterfile = os.path.join(pset.output_plotfolder, pset.output_pdfjoin)
+    logger.info("Collecting PDF pages to %s", masterfile)
+    return PdfPages(masterfile)
 
-        for pfile in plotfiles:
-            syscommand = syscommand + pfile + " "
 
-        logger.info("Collecting PDF files to %s", masterfile)
-        logger.info(syscommand)
-        ier = subprocess.call(syscommand, shell=True)
+def _open_manifest(pset):
+    """Return the Manifest if output.incremental is set, otherwise None."""
+    if not pset.output_incremental:
+        return None
 
-        if ier != 0:
-            raise RuntimeError(f"Received number != 0 from subprosess: {ier}")
+    if pset.output_pdfjoin and pset.output_format == "pdf":
+        logger.warning("Incremental plotting is not possible with pdfjoin, ignored")
+        return None
 
-        for pfile in plotfiles:
-            os.remove(pfile)
+    prefix = pset.output_prefix or ""
+    return _manifest.Manifest(
+        os.path.join(pset.output_plotfolder, prefix + "manifest.json")
+    )
 
 
 def _folder_work(pset):
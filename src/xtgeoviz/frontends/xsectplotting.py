@@ -12,11 +12,12 @@ from typing import Any, Dict, Optional, Union
 
 import yaml
 
-from . import (
-    _xsectplotting_config as _cfg,
-    _xsectplotting_load as _load,
-    _xsectplotting_plotting as _plt,
-)
+from xtgeoviz.plot import _profiling
+
+# The load and plotting modules import xtgeo, pandas and matplotlib, which are slow
+# to import. They are imported when needed, so that command line args and the config
+# are parsed and validated first.
+from . import _xsectplotting_config as _cfg
 
 APPNAME = "xtgeoviz.xsectplot"
 
@@ -37,6 +38,8 @@ class _XsectSettings:
     title: str = "Generic Title"
 
     general_engine: str = "matplotlib"
+    general_backend: Optional[str] = "agg"
+    general_fencecache: Optional[str] = None
 
     design_style: int = 1
     design_zrange: Union[tuple, list, dict] = (1000, 2000)
@@ -45,6 +48,8 @@ class _XsectSettings:
     design_legendsize: int = 6
     design_legends: bool = True
     design_dpi: int = 100
+    design_simplify: Optional[float] = None
+    design_composite: bool = False
 
     wellmap_otherwells: bool = False
     wellmap_expand: int = 2
@@ -61,8 +66,16 @@ class _XsectSettings:
     cube_colors: str = "seismic"
     cube_range: Any = None
     cube_interpolation: str = "gaussian"
+    cube_smoothing: Any = None
     cube_alpha: float = 0.8
     cube_sampling: str = "nearest"
+    cube_dtype: str = "float32"
+
+    grid_colors: str = "rainbow"
+    grid_range: Any = None
+    grid_alpha: float = 0.8
+    grid_zinc: float = 0.5
+    grid_dtype: str = "float32"
 
     wells_zonelog_colors: str = "random40"
     wells_zonelog_zoneshift: int = 0
@@ -80,6 +93,9 @@ class _XsectSettings:
     output_prefix: str = ""
     output_pdfjoin: bool = False
     output_cleanup: bool = False
+    output_savethreads: int = 2
+    output_incremental: bool = False
+    output_profile: Union[bool, str] = False
 
     def __post_init__(self):
         logger.info("Initilize class: %s", __class__.__name__)
@@ -93,7 +109,7 @@ class _XsectSettings:
 class _Xsections:
     """Private class for XSections plotting"""
 
-    args: Optional[list] = None
+    args: Optional[Union[list, argparse.Namespace]] = None  # Namespace when parsed
     inputdata: dict = field(default_factory=dict)
     psettings: dict = field(default_factory=dict)
     output: dict = field(default_factory=dict)
@@ -109,14 +125,17 @@ class _Xsections:
     outline: Any = field(default=None, init=False)
     contacts: Any = field(default=None, init=False)
     surfaces: dict = field(default_factory=dict, init=False)
+    inputfiles: list = field(default_factory=list, init=False)  # None for objects
+    summary: dict = field(default_factory=dict, init=False)  # tables of XYZ ranges
 
     def __post_init__(self):
-        self.args = None  # command line args
         self.plotsettings = _XsectSettings()  # plotsettings
 
         if not self.inputdata:
-            self.parse_args()
+            self.parse_args()  # command line args, or sys.argv if args is None
+            self.parse_config()
         else:
+            self.args = None  # command line args are ignored
             self.parse_dicts()
 
     def parse_args(self):
@@ -129,6 +148,24 @@ class _Xsections:
         parser.add_argument(
             "-c", "--config", dest="config", type=str, help="Config file on YAML format"
         )
+        parser.add_argument(
+            "--check",
+            dest="check",
+            action="store_true",
+            help="Only validate the config and the input paths, then quit",
+        )
+        parser.add_argument(
+            "--force",
+            dest="force",
+            action="store_true",
+            help="Plot all wells, also those unchanged since last incremental run",
+        )
+        parser.add_argument(
+            "--profile",
+            dest="profile",
+            action="store_true",
+            help="Write time used per stage to profile.json and profile.csv",
+        )
 
         if self.args is None:
             self.args = sys.argv[1:]
@@ -191,6 +228,9 @@ class _Xsections:
         # merge config with defaults:
         merged = _cfg.data_merge(dconfig, config)
 
+        if args.profile and not merged["output"]["profile"]:
+            merged["output"]["profile"] = True
+
         self.config = merged
         self.set_logger_verbosity()
 
@@ -209,51 +249,105 @@ class _Xsections:
         self.set_logger_verbosity()
         # _prettyprint(self.config)
 
+    def validate_config(self, check_paths=False):
+        """Validate the config before loading any data, raise ConfigError if invalid.
+
+        Args:
+            check_paths: If True, also check that input files and folders exist.
+        """
+        problems = _cfg.validate_config(self.config, check_paths=check_paths)
+        if problems:
+            raise _cfg.ConfigError(
+                "Invalid config:\n" + "\n".join(f"  - {prb}" for prb in problems)
+            )
+        logger.info("Config is valid")
+
+    @_profiling.profiled
     def load_wells(self):
         """Load wells as a list of XTGeo Well() instances"""
 
+        from . import _xsectplotting_load as _load
+
         _load.load_wells(self)
 
+    @_profiling.profiled
     def load_surfaces(self):
         """Load surfaces as a dict of lists of XTGeo Surface() instances"""
 
+        from . import _xsectplotting_load as _load
+
         _load.load_surfaces(self)
 
+    @_profiling.profiled
     def load_cube(self):
         """Load cube to plot as backdrop, a XTGeo Cube() instances"""
 
+        from . import _xsectplotting_load as _load
+
         _load.load_cube(self)
 
+    @_profiling.profiled
     def load_grid(self):
         """Load grid with property to plot as backdrop, XTGeo Grid() + GridProperty
         instances.
         """
 
+        from . import _xsectplotting_load as _load
+
         _load.load_grid(self)
 
+    @_profiling.profiled
     def load_outline(self):
         """Load map outline to plot as info"""
 
+        from . import _xsectplotting_load as _load
+
         _load.load_outline(self)
 
+    @_profiling.profiled
     def config_complete(self):
         """improve config, better defaults, and some smart settings based on input"""
 
         _cfg.config_complete(self)  # config, wells, surfs["primary"])
 
+    @_profiling.profiled
     def plot(self):
         """Do the actual plotting"""
 
+        # a command line run owns the process; otherwise pyplot may be in use
+        _select_backend(self.plotsettings.general_backend, force=self.args is not None)
+
+        from . import _xsectplotting_plotting as _plt
+
         _plt.plotting(self)
 
 
+def _select_backend(backend, force=False):
+    """Set the matplotlib backend explicitly, as the automatic choice may load a GUI.
+
+    Unless force, the backend is only set if pyplot is not imported yet, as
+    switching it would close the open figures of e.g. a Jupyter or Qt session.
+    """
+    if not backend:
+        return
+
+    if not force and "matplotlib.pyplot" in sys.modules:
+        logger.info("Keep the current matplotlib backend, as pyplot is in use")
+        return
+
+    import matplotlib
+
+    logger.info("Use matplotlib backend: %s", backend)
+    matplotlib.use(backend)
+
+
 # ======================================================================================
 # MAIN
 # ======================================================================================
 
 
 def xsectplot(
-    args: Optional[Dict] = None,
+    args: Optional[list] = None,
     inputdata: Optional[Dict] = None,
     plotsettings: Optional[Dict] = None,
     output: Optional[Dict] = None,
@@ -279,17 +373,41 @@ def xsectplot(
 
     app = _Xsections(args, inputdata, plotsettings, output, verbosity)
 
-    # load what to xsect (and show):
-    app.load_wells()
-    app.load_surfaces()
-    app.load_cube()
-    app.load_outline()
+    # validate before loading data (and importing the plotting stack)
+    check = isinstance(app.args, argparse.Namespace) and app.args.check
+    try:
+        app.validate_config(check_paths=check)
+    except _cfg.ConfigError as err:
+        if check:
+            raise SystemExit(str(err)) from err
+        raise
+
+    if check:
+        return
+
+    profiler = None
+    if app.config["output"]["profile"]:
+        profiler = _profiling.Profiler(
+            tracemem=app.config["output"]["profile"] == "memory"
+        )
+
+    with _profiling.profiling(profiler):
+        # load what to xsect (and show):
+        app.load_wells()
+        app.load_surfaces()
+        app.load_cube()
+        app.load_grid()
+        app.load_outline()
+
+        app.config_complete()
 
-    app.config_complete()
+        app.plotsettings.update_plotsettings(app.config)
 
-    app.plotsettings.update_plotsettings(app.config)
+        app.plot()
 
-    app.plot()
+    if profiler is not None:
+        pset = app.plotsettings
+        profiler.write(pset.output_plotfolder, pset.output_prefix or "")
 
 
 if __name__ == "__main__":
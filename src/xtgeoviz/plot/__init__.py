@@ -1,6 +1,39 @@
 """The XTGeoViz plot package"""
 
-# flake8: noqa
-from .grid3d_slice import Grid3DSlice
-from .xsection import XSection
-from .xtmap import Map
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .fencecache import precompute_fences
+    from .grid3d_slice import Grid3DSlice
+    from .savepool import SavePool
+    from .xsection import XSection
+    from .xtmap import Map
+
+# the plot classes are imported on first use, as they import matplotlib.pyplot
+_LAZY_ATTRIBUTES = {
+    "Grid3DSlice": ".grid3d_slice",
+    "XSection": ".xsection",
+    "Map": ".xtmap",
+    "SavePool": ".savepool",
+    "precompute_fences": ".fencecache",
+}
+
+__all__ = ["Grid3DSlice", "Map", "SavePool", "XSection", "precompute_fences"]
+
+
+def __getattr__(name):
+    try:
+        modname = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(modname, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,559 @@
+"""Private helpers for the cube and grid backdrops of cross sections.
+
+The sections sampled from a cube along a fence are cached per cube, both as
+sampled and smoothed, so the same well plotted again (e.g. with other overlays
+or settings) does not sample and smooth the cube again. For grids, the cells
+along a fence are cached per grid, so sections of other properties of the grid
+are taken from the cells without searching them again.
+
+The backdrops are kept as float32 from the sampling to the image, or are
+quantized to uint8 or uint16 codes, with a Normalize that maps the codes to the
+colors as the values would have been.
+
+The backdrops can also be colored here, with a lookup in the colormap table, and
+composited into one RGBA image at the pixel size of the plot, so matplotlib
+resamples and embeds one image instead of blending each backdrop when saving.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import logging
+import numbers
+import threading
+import weakref
+from typing import Any
+
+import numpy as np
+from matplotlib.colors import Normalize
+from matplotlib.image import AxesImage
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+
+logger = logging.getLogger(__name__)
+
+# number of sections kept per cube or grid, the least recently used are removed first
+SECTION_CACHE_SIZE = 16
+
+# the gaussian filter is made with FFT for sigma (in cells) of this or more
+FFT_SIGMA = 8.0
+
+# the gaussian kernel is truncated at this many sigma, as in scipy
+TRUNCATE = 4.0
+
+# the data types of backdrop images, where the integer types are quantized
+BACKDROP_DTYPES = ("float32", "float64", "uint8", "uint16")
+
+# cube or grid -> (version, ordered dict of sections), while the version is the same
+_SECTIONS: weakref.WeakKeyDictionary[Any, tuple[Any, collections.OrderedDict]] = (
+    weakref.WeakKeyDictionary()
+)
+# id(grid) -> the key of the grid in _SECTIONS, removed when the grid is collected;
+# xtgeo grids hash their geometry in hash(), so they are not keys themselves
+_GRID_KEYS: dict[int, _GridKey] = {}
+_LOCK = threading.Lock()
+
+
+def gaussian_sigma(interpolation: str, smoothing=None):
+    """Return the gaussian sigma (depth, trace) in cells, or None for no smoothing.
+
+    Args:
+        interpolation: The interpolation, where gaussianN (N = 1..9) is smoothing
+            with sigma N.
+        smoothing: Sigma in cells, as one value or a (trace, depth) pair; this is
+            used instead of gaussianN if given.
+    """
+    if smoothing is None:
+        if "gaussian" not in interpolation:
+            return None
+        try:
+            smoothing = int(interpolation[-1])
+        except ValueError:
+            return None
+
+    if isinstance(smoothing, numbers.Real):
+        strace = sdepth = smoothing
+    else:
+        strace, sdepth = smoothing
+
+    if strace < 0 or sdepth < 0:
+        raise ValueError(f"The smoothing sigma must be >= 0, got {smoothing}")
+
+    if strace == 0 and sdepth == 0:
+        return None
+    return (float(sdepth), float(strace))
+
+
+def gaussian_smooth(arr: np.ndarray, sigma, truncate: float = TRUNCATE):
+    """Smooth a 2D array with a gaussian filter, as two 1D filters.
+
+    The result is the same as scipy.ndimage.gaussian_filter (with mode 'reflect'),
+    but keeps the float type of the array (e.g. float32). Large sigma are done
+    with FFT, where the cost does not grow with the kernel size.
+
+    Args:
+        arr: The 2D array.
+        sigma: Sigma in cells, as one value or a value per axis.
+        truncate: Truncate the kernel at this many sigma.
+    """
+    import scipy.ndimage  # scipy is slow to import, and only needed here
+
+    arr = np.asarray(arr)
+    if not np.issubdtype(arr.dtype, np.floating):
+        arr = arr.astype(np.float64)
+
+    result = arr
+    for axis, sig in enumerate(np.broadcast_to(sigma, (arr.ndim,))):
+        if sig <= 0:
+            continue
+        if sig >= FFT_SIGMA:
+            result = _fft_gaussian1d(result, sig, axis, truncate)
+        else:
+            result = scipy.ndimage.gaussian_filter1d(
+                result, sig, axis=axis, output=arr.dtype, truncate=truncate
+            )
+    return result
+
+
+def _fft_gaussian1d(arr, sigma, axis, truncate):
+    """A 1D gaussian filter along an axis, with FFT convolution."""
+    import scipy.signal
+
+    radius = int(truncate * sigma + 0.5)
+    xvalues = np.arange(-radius, radius + 1)
+    kernel = np.exp(-0.5 * (xvalues / sigma) ** 2)
+    kernel = (kernel / kernel.sum()).astype(arr.dtype)
+
+    # mode 'symmetric' in numpy is mode 'reflect' in scipy.ndimage
+    pad = [(0, 0)] * arr.ndim
+    pad[axis] = (radius, radius)
+    padded = np.pad(arr, pad, mode="symmetric")
+
+    shape = [1] * arr.ndim
+    shape[axis] = kernel.size
+    result = scipy.signal.fftconvolve(
+        padded, kernel.reshape(shape), mode="valid", axes=axis
+    )
+    return result.astype(arr.dtype, copy=False)
+
+
+def cube_section(
+    cube,
+    fence: np.ndarray,
+    zmin: float,
+    zmax: float,
+    zincrement: float,
+    sampling: str = "nearest",
+    sigma=None,
+):
+    """Return a section of a cube along a fence, as Cube.get_randomline(), cached.
+
+    The section has the float type of the cube values (float32 for XTGeo cubes),
+    and is smoothed with gaussian_smooth() if sigma is given. The section array is
+    read only, as it is shared by later calls.
+
+    Changes made in place to the cube values are not seen by the cache; assign new
+    values to the cube instead.
+
+    Returns:
+        A tuple (hmin, hmax, zmin, zmax, array).
+    """
+    key = (_digest(fence), float(zmin), float(zmax), float(zincrement), sampling)
+
+    section = _cached(cube, key, cube.values)
+    if section is None:
+        section = cube.get_randomline(
+            fence, zmin=zmin, zmax=zmax, zincrement=zincrement, sampling=sampling
+        )
+        dtype = cube.values.dtype
+        arr = section[4]
+        if np.issubdtype(dtype, np.floating) and arr.dtype != dtype:
+            arr = arr.astype(dtype)
+        arr.flags.writeable = False
+        section = (*section[:4], arr)
+        _store(cube, key, cube.values, section)
+
+    if sigma is None:
+        return section
+
+    smoothed = _cached(cube, (*key, sigma), cube.values)
+    if smoothed is None:
+        arr = gaussian_smooth(section[4], sigma)
+        arr.flags.writeable = False
+        smoothed = (*section[:4], arr)
+        _store(cube, (*key, sigma), cube.values, smoothed)
+    return smoothed
+
+
+def grid_section(
+    grid,
+    gridproperty,
+    fence: np.ndarray,
+    zmin: float,
+    zmax: float,
+    zincrement: float,
+    dtype=np.float32,
+):
+    """Return a section of a grid property along a fence, as Grid.get_randomline().
+
+    The cells along the fence depend only on the grid geometry, so they are found
+    once per grid geometry, fence and sampling, and cached. The section of a
+    property is then taken from its values in the cells.
+
+    The geometry is hashed once per grid, so changes made to the geometry after the
+    first section are not seen by the cache; use a new grid (e.g. a copy) instead.
+
+    Returns:
+        A tuple (hmin, hmax, zmin, zmax, array), where the array has the dtype and
+        is NaN outside the grid.
+    """
+    gridkey = _grid_key(grid)
+    key = (
+        gridkey.gridhash,
+        _digest(fence),
+        float(zmin),
+        float(zmax),
+        float(zincrement),
+    )
+
+    cells = _cached(gridkey, key)
+    if cells is None:
+        cells = _grid_cells(grid, fence, zmin, zmax, zincrement)
+        _store(gridkey, key, None, cells)
+    *limits, index = cells
+
+    # as xtgeo, the data of masked cells are used
+    values = np.ma.getdata(gridproperty.values).ravel()
+    if values.size != grid.ncol * grid.nrow * grid.nlay:
+        raise ValueError(
+            f"The grid property {gridproperty.name} does not fit the grid dimensions"
+        )
+
+    arr = np.full(index.shape, np.nan, dtype=dtype)
+    inside = index >= 0
+    arr[inside] = values[index[inside]]
+    return (*limits, arr)
+
+
+class _GridKey:
+    """A grid in the cache, with the hash of its geometry made once."""
+
+    __slots__ = ("gridhash", "__weakref__")
+
+    def __init__(self, gridhash: str):
+        self.gridhash = gridhash
+
+
+def _grid_key(grid) -> _GridKey:
+    with _LOCK:
+        gridkey = _GRID_KEYS.get(id(grid))
+    if gridkey is None:
+        gridkey = _GridKey(grid.generate_hash())
+        with _LOCK:
+            _GRID_KEYS[id(grid)] = gridkey
+        weakref.finalize(grid, _GRID_KEYS.pop, id(grid), None)
+    return gridkey
+
+
+def _grid_cells(grid, fence, zmin, zmax, zincrement):
+    """The cell indices along a fence, -1 outside the grid, and the limits."""
+    import xtgeo
+
+    ncells = grid.ncol * grid.nrow * grid.nlay
+    cellindex = xtgeo.GridProperty(
+        grid,
+        name="CELLINDEX",
+        values=np.arange(ncells, dtype=np.float64).reshape(grid.dimensions),
+    )
+    *limits, arr = grid.get_randomline(
+        fence, cellindex, zmin=zmin, zmax=zmax, zincrement=zincrement
+    )
+
+    index = np.full(arr.shape, -1, dtype=np.int32 if ncells < 2**31 else np.int64)
+    inside = ~np.isnan(arr)
+    index[inside] = arr[inside]
+    index.flags.writeable = False
+    return (*limits, index)
+
+
+def clear():
+    """Remove all cached sections and cells."""
+    with _LOCK:
+        _SECTIONS.clear()
+        _GRID_KEYS.clear()
+
+
+def _digest(fence):
+    return hashlib.blake2b(np.ascontiguousarray(fence), digest_size=16).hexdigest()
+
+
+def _sections(source, version):
+    """The sections of a cube or grid, made again if the version object changes,
+    e.g. the values of a cube are replaced.
+    """
+    known, sections = _SECTIONS.get(source, (None, None))
+    if sections is None or known is not version:
+        sections = collections.OrderedDict()
+        _SECTIONS[source] = (version, sections)
+    return sections
+
+
+def _cached(source, key, version=None):
+    with _LOCK:
+        sections = _sections(source, version)
+        section = sections.get(key)
+        if section is not None:
+            sections.move_to_end(key)
+    return section
+
+
+def _store(source, key, version, section):
+    with _LOCK:
+        sections = _sections(source, version)
+        sections[key] = section
+        while len(sections) > SECTION_CACHE_SIZE:
+            sections.popitem(last=False)
+
+
+class QuantizedNormalize(Normalize):
+    """Normalize quantized codes, as Normalize(vmin, vmax) of the values.
+
+    The codes 0..ncodes - 1 are the values from vmin to vmax in equal steps.
+
+    Args:
+        vmin: The value of code 0.
+        vmax: The value of the last code.
+        ncodes: The number of codes.
+    """
+
+    def __init__(self, vmin: float, vmax: float, ncodes: int):
+        super().__init__(vmin=0, vmax=ncodes - 1)
+        self.value_range = (vmin, vmax)
+        self.step = (vmax - vmin) / (ncodes - 1)
+
+    def values(self, codes):
+        """Return the values of codes."""
+        return self.value_range[0] + np.asarray(codes) * self.step
+
+    def colorbar_ticks(self):
+        """Return keyword arguments for a colorbar, with ticks at round values."""
+        vmin, vmax = self.value_range
+        values = MaxNLocator().tick_values(vmin, vmax)
+        values = values[(values >= vmin) & (values <= vmax)]
+        return {
+            "ticks": (values - vmin) / self.step,
+            "format": FuncFormatter(lambda code, _: f"{self.values(code):.4g}"),
+        }
+
+
+def backdrop_image(arr: np.ndarray, dtype: str = "float32", vmin=None, vmax=None):
+    """Return a section as an image array of a data type, and its norm for imshow.
+
+    Args:
+        arr: The section values, where NaN or masked values are undefined.
+        dtype: The data type of the image, see BACKDROP_DTYPES; for uint8 and uint16
+            the values from vmin to vmax are quantized to integer codes.
+        vmin: The min value, default is the min of the section.
+        vmax: The max value, default is the max of the section.
+
+    Returns:
+        A tuple (image, norm), where norm is None for float types (use vmin and
+        vmax with imshow), and a QuantizedNormalize for integer types.
+    """
+    if dtype not in BACKDROP_DTYPES:
+        raise ValueError(f"The backdrop dtype {dtype} is not one of {BACKDROP_DTYPES}")
+
+    if dtype.startswith("float"):
+        return arr.astype(dtype, copy=False), None
+
+    undefined = np.ma.getmaskarray(arr) | np.isnan(np.ma.getdata(arr))
+    values = np.ma.getdata(arr)
+    if vmin is None or vmax is None:
+        defined = values[~undefined]
+        if vmin is None:
+            vmin = float(defined.min()) if defined.size else 0.0
+        if vmax is None:
+            vmax = float(defined.max()) if defined.size else 1.0
+    if not vmax > vmin:
+        vmax = vmin + 1.0
+
+    maxcode = np.iinfo(dtype).max
+    codes = np.empty(values.shape, dtype=np.float32)
+    np.subtract(values, vmin, out=codes, casting="unsafe")
+    codes *= maxcode / (vmax - vmin)
+    np.clip(codes, 0, maxcode, out=codes)
+    np.rint(codes, out=codes)
+    codes[undefined] = 0
+    codes = codes.astype(dtype)
+
+    image = np.ma.array(codes, mask=undefined) if undefined.any() else codes
+    return image, QuantizedNormalize(vmin, vmax, maxcode + 1)
+
+
+def colorize(arr: np.ndarray, cmap, norm, alpha: float | None = None):
+    """Return the colors of a section as an RGBA uint8 image, as a colormap does.
+
+    Args:
+        arr: The section values (or codes for a QuantizedNormalize).
+        cmap: The matplotlib colormap.
+        norm: The matplotlib Normalize; a missing vmin or vmax is set from arr.
+        alpha: Alpha multiplied with the alpha of the colors.
+    """
+    ncolors = cmap.N
+    # the colors, then the colors for under, over and bad values
+    lut = np.concatenate(
+        [
+            cmap(np.arange(ncolors), bytes=True),
+            cmap(np.array([-1, ncolors]), bytes=True),
+            cmap(np.array([np.nan]), bytes=True),
+        ]
+    )
+    if alpha is not None:
+        lut[:, 3] = np.rint(lut[:, 3] * alpha)
+
+    if np.issubdtype(arr.dtype, np.floating):
+        arr = np.ma.masked_invalid(arr, copy=False)
+    norm.autoscale_None(arr)
+    normed = np.ma.asarray(norm(arr), dtype=np.float32)
+    bad = np.ma.getmaskarray(normed) | np.isnan(normed.data)
+    # as in matplotlib Colormap.__call__
+    scaled = np.where(bad, 0.0, normed.data) * ncolors
+    scaled[scaled == ncolors] = ncolors - 1
+    index = np.clip(scaled, 0, ncolors - 1).astype(np.intp)
+    index[scaled < 0] = ncolors
+    index[scaled >= ncolors] = ncolors + 1
+    index[bad] = ncolors + 2
+    return lut[index]
+
+
+class Composite:
+    """Backdrop layers composited into one RGBA image of a given pixel size.
+
+    The image covers the extents of all layers. Each layer is resampled to the
+    pixels (nearest), then colored and composited over the layers below it, so
+    the cost is by the pixels of the image rather than the size of the sections.
+
+    Args:
+        shape: The (rows, columns) of the composited image.
+    """
+
+    def __init__(self, shape):
+        self.shape = shape
+        self.version = 0  # changed by each change of the layers
+        self.last_extent = None  # the extent of the last layer, as given to add()
+        self._layers = []
+        self._hidden = set()
+
+    def __len__(self):
+        return len(self._layers)
+
+    def add(self, arr: np.ndarray, extent, cmap, norm, alpha: float | None = None):
+        """Add a layer on top, as for colorize(), with extent (left, right, bottom,
+        top). A missing vmin or vmax of the norm is set from the whole layer.
+
+        Returns:
+            The index of the layer.
+        """
+        if norm.vmin is None or norm.vmax is None:
+            norm.autoscale_None(np.ma.masked_invalid(arr, copy=False))
+
+        self.last_extent = tuple(extent)
+        left, right, bottom, top = extent
+        # reversed extents (e.g. right < left) are flipped images, as in imshow
+        if left > right:
+            arr, left, right = arr[:, ::-1], right, left
+        if bottom < top:
+            arr, bottom, top = arr[::-1], top, bottom
+        self._layers.append((arr, (left, right, bottom, top), cmap, norm, alpha))
+        self.version += 1
+        return len(self._layers) - 1
+
+    def set_visible(self, index: int, visible: bool):
+        """Show or hide a layer; hidden layers are not composited."""
+        if visible:
+            self._hidden.discard(index)
+        else:
+            self._hidden.add(index)
+        self.version += 1
+
+    @property
+    def extent(self):
+        """The (left, right, bottom, top) of all layers, also hidden layers."""
+        extents = np.array([layer[1] for layer in self._layers], dtype=np.float64)
+        return (
+            extents[:, 0].min(),
+            extents[:, 1].max(),
+            extents[:, 2].max(),  # the Z axis is down
+            extents[:, 3].min(),
+        )
+
+    def render(self):
+        """Return the composited RGBA uint8 image, and its extent."""
+        left, right, bottom, top = self.extent
+        nrows, ncols = self.shape
+        xpixels = left + (np.arange(ncols) + 0.5) * (right - left) / ncols
+        ypixels = top + (np.arange(nrows) + 0.5) * (bottom - top) / nrows
+
+        # premultiplied colors, composited with the 'over' operator
+        result = np.zeros((nrows, ncols, 4), dtype=np.float32)
+        for index, layer in enumerate(self._layers):
+            if index in self._hidden:
+                continue
+            arr, (lleft, lright, lbottom, ltop), cmap, norm, alpha = layer
+            cols = np.floor((xpixels - lleft) / (lright - lleft) * arr.shape[1])
+            rows = np.floor((ypixels - ltop) / (lbottom - ltop) * arr.shape[0])
+            # the pixels inside the layer are a block, as the pixels are ordered
+            colin = np.flatnonzero((cols >= 0) & (cols < arr.shape[1]))
+            rowin = np.flatnonzero((rows >= 0) & (rows < arr.shape[0]))
+            if colin.size == 0 or rowin.size == 0:
+                continue
+
+            pixels = arr[rows[rowin].astype(np.intp)][:, cols[colin].astype(np.intp)]
+            rgba = colorize(pixels, cmap, norm, alpha=alpha)
+
+            opacity = rgba[..., 3:] * np.float32(1.0 / 255.0)
+            target = result[rowin[0] : rowin[-1] + 1, colin[0] : colin[-1] + 1]
+            target *= 1.0 - opacity
+            target[..., :3] += rgba[..., :3] * (opacity * np.float32(1.0 / 255.0))
+            target[..., 3:] += opacity
+
+        alpha = result[..., 3:]
+        np.divide(result[..., :3], alpha, out=result[..., :3], where=alpha > 0)
+        result *= 255.0
+        image = np.rint(result, out=result).astype(np.uint8)
+        return image, (left, right, bottom, top)
+
+
+class CompositeImage(AxesImage):
+    """The image of composited backdrops, rendered when it is drawn.
+
+    Args:
+        ax: The matplotlib axes.
+        composite: The Composite.
+    """
+
+    def __init__(self, ax, composite: Composite):
+        super().__init__(ax, interpolation="none")
+        self.composite = composite
+        self.set_data(np.zeros((1, 1, 4), dtype=np.uint8))
+        self._rendered = None
+
+    def update_layers(self):
+        """Call after adding, showing or hiding layers of the composite."""
+        self.set_extent(self.composite.extent)
+
+        # the view (and its orientation) as imshow() of the last layer would set it
+        left, right, bottom, top = self.composite.last_extent
+        if self.axes.get_autoscalex_on():
+            self.axes.set_xlim((left, right), auto=None)
+        if self.axes.get_autoscaley_on():
+            self.axes.set_ylim((bottom, top), auto=None)
+        self.stale = True
+
+    def draw(self, renderer):
+        # render again only if the layers are changed
+        if self._rendered != self.composite.version:
+            image, _ = self.composite.render()
+            self.set_data(image)
+            self._rendered = self.composite.version
+        super().draw(renderer)
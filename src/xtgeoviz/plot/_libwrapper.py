@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import matplotlib
-import scipy
 
 
 def _version_ge_than(proposed, comparewith):
@@ -30,10 +29,10 @@ def matplotlib_colormap(name):
     )
 
 
-def scipy_gaussianfilter(inputv, sigma):
-    """Compatibility wrapper for scipy gaussian_filter syntax that change across 1.8."""
+def matplotlib_resampled(cmap, ncolors):
+    """Compatibility wrapper for resampling a colormap, public from matplotlib 3.6."""
     return (
-        scipy.ndimage.gaussian_filter(inputv, sigma)
-        if _version_ge_than(scipy.__version__, "1.8.0")
-        else scipy.ndimage.filters.gaussian_filter(inputv, sigma)
+        cmap.resampled(ncolors)
+        if _version_ge_than(matplotlib.__version__, "3.6.0")
+        else cmap._resample(ncolors)
     )
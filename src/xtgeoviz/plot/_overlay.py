@@ -0,0 +1,308 @@
+"""Private helpers for overlay data (faults, polygons, wells) drawn on top of plots."""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def split_parts(ids, xarr, yarr):
+    """Split coordinate arrays into one (N, 2) array per id, without a groupby loop.
+
+    The parts are returned ordered by id (as a pandas groupby), and the order of
+    points within each part is kept.
+
+    Args:
+        ids (ndarray): Id per point, e.g. the POLY_ID column.
+        xarr (ndarray): X coordinates.
+        yarr (ndarray): Y coordinates.
+
+    Returns:
+        A tuple (parts, bboxes) where parts is a list of (N, 2) arrays and bboxes
+        is a (nparts, 4) array with xmin, xmax, ymin, ymax per part.
+    """
+    ids = np.asarray(ids)
+    xy = np.column_stack((xarr, yarr)).astype(np.float64, copy=False)
+
+    if xy.shape[0] == 0:
+        return [], np.empty((0, 4))
+
+    if np.any(ids[1:] < ids[:-1]):
+        order = np.argsort(ids, kind="stable")
+        ids = ids[order]
+        xy = xy[order]
+
+    _, starts = np.unique(ids, return_index=True)
+
+    return np.split(xy, starts[1:]), reduce_bboxes(xy, starts)
+
+
+def reduce_bboxes(xy, starts):
+    """Bounding boxes of consecutive point ranges in xy, given the range starts."""
+    return np.column_stack(
+        (
+            np.minimum.reduceat(xy[:, 0], starts),
+            np.maximum.reduceat(xy[:, 0], starts),
+            np.minimum.reduceat(xy[:, 1], starts),
+            np.maximum.reduceat(xy[:, 1], starts),
+        )
+    )
+
+
+def bounding_boxes(parts):
+    """Return a (nparts, 4) array with xmin, xmax, ymin, ymax for a list of parts.
+
+    Empty parts get NaN as bounding box, which is never visible.
+    """
+    lengths = np.array([len(part) for part in parts], dtype=np.int64)
+    bboxes = np.full((len(parts), 4), np.nan)
+
+    nonempty = lengths > 0
+    if nonempty.any():
+        xy = np.concatenate([part for part in parts if len(part) > 0])
+        starts = np.concatenate(([0], np.cumsum(lengths[nonempty])[:-1]))
+        bboxes[nonempty] = reduce_bboxes(xy, starts)
+
+    return bboxes
+
+
+def visible_parts(bboxes, extent):
+    """Return a boolean array telling which bounding boxes overlap the extent.
+
+    Args:
+        bboxes (ndarray): A (nparts, 4) array with xmin, xmax, ymin, ymax per part.
+        extent (tuple): The view as (xmin, xmax, ymin, ymax), in any axis direction.
+    """
+    xmin, xmax = sorted(extent[0:2])
+    ymin, ymax = sorted(extent[2:4])
+
+    return (
+        (bboxes[:, 1] >= xmin)
+        & (bboxes[:, 0] <= xmax)
+        & (bboxes[:, 3] >= ymin)
+        & (bboxes[:, 2] <= ymax)
+    )
+
+
+def visible_points(xarr, yarr, extent):
+    """Return a boolean array telling which points are inside the extent."""
+    xmin, xmax = sorted(extent[0:2])
+    ymin, ymax = sorted(extent[2:4])
+
+    return (xarr >= xmin) & (xarr <= xmax) & (yarr >= ymin) & (yarr <= ymax)
+
+
+def clip_line(part, extent):
+    """Clip a polyline to the extent, returning a list of polylines.
+
+    Only the segments that may cross the extent are kept (segment bounding box
+    overlap), so the drawn result within the extent is unchanged. A polyline
+    leaving and re-entering the extent is split in several pieces.
+    """
+    if len(part) < 2:
+        inside = visible_points(part[:, 0], part[:, 1], extent)
+        return [part] if inside.any() else []
+
+    segs = np.column_stack(
+        (
+            np.minimum(part[:-1, 0], part[1:, 0]),
+            np.maximum(part[:-1, 0], part[1:, 0]),
+            np.minimum(part[:-1, 1], part[1:, 1]),
+            np.maximum(part[:-1, 1], part[1:, 1]),
+        )
+    )
+    keep = np.concatenate(([0], visible_parts(segs, extent).astype(np.int8), [0]))
+
+    # runs of kept segments; a run of segments s..e-1 uses vertices s..e
+    edges = np.diff(keep)
+    starts = np.flatnonzero(edges == 1)
+    stops = np.flatnonzero(edges == -1)
+
+    return [part[start : stop + 1] for start, stop in zip(starts, stops)]
+
+
+def cull_parts(parts, extent, bboxes=None, clip=False):
+    """Remove parts outside the extent, and optionally clip the remaining lines.
+
+    Args:
+        parts (list): List of (N, 2) arrays.
+        extent (tuple): The view as (xmin, xmax, ymin, ymax).
+        bboxes (ndarray): Precomputed bounding boxes of parts, if any.
+        clip (bool): If True, also remove the outside segments of the lines. This
+            should not be applied to filled polygons.
+
+    Returns:
+        A tuple (parts, index) with the kept (and clipped) parts, and for each
+        of them the index of the input part it comes from.
+    """
+    if bboxes is None:
+        bboxes = bounding_boxes(parts)
+
+    inside = np.flatnonzero(visible_parts(bboxes, extent))
+    logger.debug("Keep %s of %s parts within %s", len(inside), len(parts), extent)
+
+    if not clip:
+        return [parts[idx] for idx in inside], inside
+
+    result = []
+    index = []
+    for idx in inside:
+        for piece in clip_line(parts[idx], extent):
+            result.append(piece)
+            index.append(idx)
+
+    return result, np.array(index, dtype=np.int64)
+
+
+def _segment_distance(points, start, end):
+    """Distance from points to the line segment start-end."""
+    direction = end - start
+    length2 = float(np.dot(direction, direction))
+    if length2 == 0.0:
+        return np.hypot(*(points - start).T)
+
+    along = np.clip((points - start) @ direction / length2, 0.0, 1.0)
+    return np.hypot(*(points - start - along[:, np.newaxis] * direction).T)
+
+
+def simplify_line(xy, tolerance, keep=None):
+    """Return indices of vertices to keep after Douglas-Peucker simplification.
+
+    Args:
+        xy (ndarray): A (N, 2) array of coordinates, in the unit of tolerance.
+        tolerance (float): Max distance between the simplified and the input line.
+        keep (ndarray): Optional boolean (N) array of vertices that shall be kept,
+            e.g. where a log changes value. The line is simplified between these.
+    """
+    nlen = len(xy)
+    if not tolerance or nlen < 3:
+        return np.arange(nlen)
+
+    mask = ~np.isfinite(xy).all(axis=1)
+    mask[[0, -1]] = True
+    if keep is not None:
+        mask |= keep
+
+    anchors = np.flatnonzero(mask)
+    stack = list(zip(anchors[:-1], anchors[1:]))
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        dist = _segment_distance(xy[first + 1 : last], xy[first], xy[last])
+        imax = int(np.argmax(dist))
+        if dist[imax] > tolerance:
+            split = first + 1 + imax
+            mask[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+
+    return np.flatnonzero(mask)
+
+
+def simplify_parts(parts, tolerance, transform=None):
+    """Simplify a list of polylines, see simplify_line().
+
+    Args:
+        parts (list): List of (N, 2) arrays in data coordinates.
+        tolerance (float): Tolerance, in data units or in units of the transform.
+        transform: Optional matplotlib transform, e.g. ax.transData to have the
+            tolerance in pixels.
+    """
+    if not tolerance:
+        return parts
+
+    result = []
+    for part in parts:
+        coords = part if transform is None else transform.transform(part)
+        result.append(part[simplify_line(coords, tolerance)])
+    return result
+
+
+def finite_runs(*arrays):
+    """Return (start, stop) of the runs of points where all the arrays are finite."""
+    finite = np.logical_and.reduce([np.isfinite(arr) for arr in arrays])
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], finite.view(np.int8), [0]))))
+    return edges.reshape(-1, 2)
+
+
+def fill_polygons(xarr, depths):
+    """Return the polygons filling the zones between lines, as fill_between().
+
+    Zone i is between the lines depths[i] and depths[i + 1], with one polygon per
+    run of points where both lines are defined. Each polygon starts and ends on the
+    lower line, as the polygons of fill_between().
+
+    Args:
+        xarr (ndarray): The X values, shared by the lines.
+        depths (ndarray): A (nlines, N) array with the lines, NaN where undefined.
+
+    Returns:
+        A tuple (polygons, zones) where polygons is a list of (M, 2) arrays and
+        zones is the zone index of each polygon.
+    """
+    polygons = []
+    zones = []
+    for izone in range(len(depths) - 1):
+        top, base = depths[izone], depths[izone + 1]
+        for start, stop in finite_runs(xarr, top, base):
+            xrun = xarr[start:stop]
+            points = np.empty((2 * (stop - start) + 2, 2))
+            points[0] = xrun[0], base[start]
+            points[1 : stop - start + 1, 0] = xrun
+            points[1 : stop - start + 1, 1] = top[start:stop]
+            points[stop - start + 1] = xrun[-1], base[stop - 1]
+            points[stop - start + 2 :, 0] = xrun[::-1]
+            points[stop - start + 2 :, 1] = base[start:stop][::-1]
+            polygons.append(points)
+            zones.append(izone)
+    return polygons, np.array(zones, dtype=np.int64)
+
+
+def change_points(*logs):
+    """Return a boolean array marking vertices on both sides of a log value change.
+
+    Args:
+        logs (ndarray): One or more arrays (e.g. zone and facies logs) with the
+            same length; NaN to NaN is not a change.
+    """
+    mask = None
+    for log in logs:
+        log = np.asarray(log, dtype=np.float64)
+        change = (log[1:] != log[:-1]) & ~(np.isnan(log[1:]) & np.isnan(log[:-1]))
+        if mask is None:
+            mask = np.zeros(len(log), dtype=bool)
+        mask[1:] |= change
+        mask[:-1] |= change
+    return mask
+
+
+def decimate_labels(points, mindist):
+    """Return indices of label positions so that labels are roughly mindist apart.
+
+    The positions are binned in cells of size mindist, and the first label in
+    each cell is kept. This is approximate, but fast also for many labels.
+
+    Args:
+        points (ndarray): A (N, 2) array of label positions, e.g. in pixels.
+        mindist (float): Cell size, in same unit as points.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if mindist is None or mindist <= 0 or points.shape[0] < 2:
+        return np.arange(points.shape[0])
+
+    cells = np.floor(points / mindist).astype(np.int64)
+    _, first = np.unique(cells, axis=0, return_index=True)
+    return np.sort(first)
+
+
+def axes_extent(ax):
+    """Return the current view of an axes as (xmin, xmax, ymin, ymax).
+
+    The aspect is applied first, as an equal aspect may widen the view limits.
+    """
+    ax.apply_aspect()
+    return (*ax.get_xlim(), *ax.get_ylim())
@@ -0,0 +1,201 @@
+"""Private timing and memory instrumentation of plot stages.
+
+Stages are timed when a Profiler is active, e.g.::
+
+    profiler = Profiler(tracemem=True)
+    with profiling(profiler):
+        with stage("load"):
+            ...
+    profiler.write("/tmp/plots")
+
+The draw methods of the plots are timed as stages too, as the active profiler
+is also a draw hook of all plots, see baseplot.drawmethod().
+
+When no profiler is active, stage() returns a no-op context and functions
+decorated with profiled() are called directly, so the overhead is negligible.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import functools
+import json
+import logging
+import os.path
+import time
+import tracemalloc
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+_ACTIVE: Optional[Profiler] = None  # the active Profiler, if any
+
+_CSV_FIELDS = ("stage", "well", "seconds", "peak_memory_mb")
+
+
+class Profiler:
+    """Collect wall time, and optionally peak memory, per named stage.
+
+    Args:
+        tracemem: If True, also trace the peak memory per stage with tracemalloc.
+            This slows down the run, typically by a factor 2 or more.
+    """
+
+    def __init__(self, tracemem: bool = False):
+        self.tracemem = tracemem
+        self.well = None  # current well, stored with each record
+        self.records: list[dict[str, Any]] = []
+        self._memstack: list[list[int]] = []  # [start, peak of children] per stage
+        self._timestack: list[float] = []  # start time per stage
+
+    def begin(self, name: str):
+        """Start timing a stage, which shall be ended with end()."""
+        if self.tracemem:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._memstack:
+                # keep the peak so far of the enclosing stage, as it is reset here
+                self._memstack[-1][1] = max(self._memstack[-1][1], peak)
+            self._memstack.append([current, 0])
+            tracemalloc.reset_peak()
+
+        self._timestack.append(time.perf_counter())
+
+    def end(self, name: str):
+        """End timing the stage last started with begin(), and record it."""
+        seconds = time.perf_counter() - self._timestack.pop()
+        peak_mb = None
+        if self.tracemem:
+            _, peak = tracemalloc.get_traced_memory()
+            start, childpeak = self._memstack.pop()
+            peak = max(peak, childpeak)
+            if self._memstack:
+                self._memstack[-1][1] = max(self._memstack[-1][1], peak)
+            peak_mb = round((peak - start) / 1e6, 3)
+
+        self.records.append(
+            {
+                "stage": name,
+                "well": self.well,
+                "seconds": round(seconds, 6),
+                "peak_memory_mb": peak_mb,
+            }
+        )
+        logger.debug("Stage %s (%s) took %.3f s", name, self.well, seconds)
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Context manager timing a stage, see also the module function stage()."""
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def draw_hook(self, event):
+        """Draw hook timing a draw method of a plot as a stage with its name."""
+        if event.phase == "start":
+            self.begin(event.name)
+        else:
+            self.end(event.name)
+
+    def summary(self) -> dict:
+        """Aggregate the records per stage: count, total, mean and max time."""
+        result: dict[str, dict[str, Any]] = {}
+        for rec in self.records:
+            entry = result.setdefault(
+                rec["stage"],
+                {
+                    "count": 0,
+                    "seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "peak_memory_mb": None,
+                },
+            )
+            entry["count"] += 1
+            entry["seconds"] += rec["seconds"]
+            entry["max_seconds"] = max(entry["max_seconds"], rec["seconds"])
+            if rec["peak_memory_mb"] is not None:
+                entry["peak_memory_mb"] = max(
+                    entry["peak_memory_mb"] or 0.0, rec["peak_memory_mb"]
+                )
+
+        for entry in result.values():
+            entry["mean_seconds"] = entry["seconds"] / entry["count"]
+        return result
+
+    def write(self, folder: str, prefix: str = "") -> list:
+        """Write the records and the summary as JSON, and the records as CSV.
+
+        Returns:
+            The file names written.
+        """
+        jsonfile = os.path.join(folder, prefix + "profile.json")
+        csvfile = os.path.join(folder, prefix + "profile.csv")
+
+        with open(jsonfile, "w", encoding="utf-8") as stream:
+            json.dump(
+                {"records": self.records, "summary": self.summary()},
+                stream,
+                indent=4,
+            )
+
+        with open(csvfile, "w", encoding="utf-8", newline="") as stream:
+            writer = csv.DictWriter(stream, fieldnames=_CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.records)
+
+        logger.info("Profile written to %s and %s", jsonfile, csvfile)
+        return [jsonfile, csvfile]
+
+
+@contextlib.contextmanager
+def profiling(profiler):
+    """Make the profiler active within the context; a None profiler is allowed."""
+    global _ACTIVE
+
+    if profiler is None:
+        yield None
+        return
+
+    previous = _ACTIVE
+    started = profiler.tracemem and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+
+    _ACTIVE = profiler
+    try:
+        yield profiler
+    finally:
+        _ACTIVE = previous
+        if started:
+            tracemalloc.stop()
+
+
+def stage(name: str):
+    """Time a stage with the active profiler, if any."""
+    if _ACTIVE is None:
+        return contextlib.nullcontext()
+    return _ACTIVE.stage(name)
+
+
+def active():
+    """Return the active profiler, or None."""
+    return _ACTIVE
+
+
+def profiled(func):
+    """Decorator timing a function (or method) as a stage with its name.
+
+    Not needed for the draw methods of the plots, which are timed by the draw hook
+    of the active profiler.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _ACTIVE is None:
+            return func(*args, **kwargs)
+        with _ACTIVE.stage(func.__name__):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,228 @@
+"""Private columnar store of well data, shared by the plots.
+
+The columns of a well are taken once as numpy arrays, instead of indexing the
+well dataframe in each plot method. The rows of a well below a level are a
+WellView of the columns, as plotted in a cross section. Many wells can be packed
+into one set of arrays with offsets per well, for passes over all wells (e.g.
+well maps).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import weakref
+from typing import Any, Optional
+
+import numpy as np
+
+from . import _overlay
+
+logger = logging.getLogger(__name__)
+
+# the columns of a well per well object, while its dataframe is the same
+_CACHE: weakref.WeakKeyDictionary[Any, WellColumns] = weakref.WeakKeyDictionary()
+
+
+class WellColumns:
+    """The columns of a well as contiguous numpy arrays, and its log records.
+
+    The arrays and records are made on first use and cached. The arrays are views
+    of the dataframe when possible, so the dataframe is not copied.
+
+    Args:
+        well: A XTGeo Well instance.
+    """
+
+    def __init__(self, well):
+        self.name = well.name
+        self.xwellname = well.xwellname
+        self._well = weakref.ref(well)
+        self._dfr = well.get_dataframe(copy=False)
+        self._columns = {}
+        self._logrecords = {}
+        self._digest = None
+
+    def __len__(self):
+        return len(self._dfr)
+
+    def __contains__(self, name):
+        return name in self._dfr.columns
+
+    def __getitem__(self, name):
+        column = self._columns.get(name)
+        if column is None:
+            column = np.ascontiguousarray(self._dfr[name].to_numpy())
+            self._columns[name] = column
+        return column
+
+    def trajectory_digest(self):
+        """Return a hash of the X, Y and Z values, computed once."""
+        if self._digest is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            for name in ("X_UTME", "Y_UTMN", "Z_TVDSS"):
+                hasher.update(np.ascontiguousarray(self[name], dtype=np.float64))
+            self._digest = hasher.hexdigest()
+        return self._digest
+
+    def logrecord(self, name):
+        """Return the log record of a log, e.g. a dict with codes and names."""
+        if name not in self._logrecords:
+            self._logrecords[name] = self._well().get_logrecord(name)
+        return self._logrecords[name]
+
+
+def well_columns(well) -> WellColumns:
+    """Return the columns of a well, made once per well.
+
+    They are made again if the dataframe of the well is replaced (e.g. by
+    set_dataframe). Changes made in place to the dataframe values are seen, as the
+    arrays are views, but not changes made in place to the log records.
+    """
+    columns = _CACHE.get(well)
+    if columns is None or columns._dfr is not well.get_dataframe(copy=False):
+        columns = WellColumns(well)
+        _CACHE[well] = columns
+    return columns
+
+
+class WellView:
+    """Arrays of the well rows below a level, without copying or changing the well.
+
+    The rows are found once, and each column is taken as an array on first use and
+    cached, so the trajectory, the logs and the crossings share the same arrays.
+    The relative horizontal length R_HLEN is computed from the first row in view,
+    as Well.create_relative_hlen() does for a truncated well.
+
+    Args:
+        source (WellColumns or DataFrame): The well columns, which are only read.
+        zmin (float): Rows with Z_TVDSS above or at zmin are left out, if given.
+    """
+
+    def __init__(self, source, zmin=None):
+        self._source = source
+        self._columns = {}
+        self.rows = None  # row positions in source, or None for all rows
+
+        if zmin is not None:
+            inside = np.asarray(source["Z_TVDSS"]) > zmin
+            if not inside.all():
+                self.rows = np.flatnonzero(inside)
+
+    def __len__(self):
+        return len(self._source) if self.rows is None else len(self.rows)
+
+    def __contains__(self, name):
+        return name == "R_HLEN" or name in self._source
+
+    def __getitem__(self, name):
+        """Return the column as a numpy array, for the rows in view."""
+        column = self._columns.get(name)
+        if column is None:
+            if name == "R_HLEN":
+                column = _relative_hlen(self["X_UTME"], self["Y_UTMN"])
+            else:
+                column = np.asarray(self._source[name])
+                if self.rows is not None:
+                    column = column[self.rows]
+            self._columns[name] = column
+        return column
+
+    def take(self, index):
+        """Return a view of a subset of the rows, e.g. of a simplified trajectory.
+
+        The R_HLEN of the subset is taken from this view, not computed again.
+        """
+        columns = {**self._columns, "R_HLEN": self["R_HLEN"]}
+        rows = np.arange(len(self)) if self.rows is None else self.rows
+
+        subset = WellView(self._source)
+        subset.rows = rows[index]
+        subset._columns = {name: column[index] for name, column in columns.items()}
+        return subset
+
+
+def _relative_hlen(xarr, yarr):
+    if len(xarr) == 0:
+        return np.empty(0)
+    steps = np.hypot(np.diff(xarr), np.diff(yarr))
+    return np.concatenate(([0.0], np.cumsum(steps)))
+
+
+class PackedWells:
+    """The trajectories of many wells, packed in one array with offsets per well.
+
+    The points of well number i are xyz[offsets[i]:offsets[i + 1]]. The last XY
+    point and the XY bounding box per well are NaN for wells without points.
+
+    Args:
+        wells: A sequence of XTGeo Well instances.
+    """
+
+    def __init__(self, wells):
+        columns = [well_columns(well) for well in wells]
+
+        self.names = [col.xwellname for col in columns]
+        sizes = np.array([len(col) for col in columns], dtype=np.int64)
+        self.offsets = np.concatenate(([0], np.cumsum(sizes)))
+
+        self.xyz = np.empty((self.offsets[-1], 3))
+        for col, start, stop in zip(columns, self.offsets[:-1], self.offsets[1:]):
+            for icol, name in enumerate(("X_UTME", "Y_UTMN", "Z_TVDSS")):
+                self.xyz[start:stop, icol] = col[name]
+
+        nonempty = np.flatnonzero(sizes > 0)
+        self.ends = np.full((len(self.names), 2), np.nan)
+        self.ends[nonempty] = self.xyz[self.offsets[nonempty + 1] - 1, :2]
+        self.bboxes = np.full((len(self.names), 4), np.nan)
+        if len(nonempty) > 0:
+            self.bboxes[nonempty] = _overlay.reduce_bboxes(
+                self.xyz[:, :2], self.offsets[nonempty]
+            )
+
+    def __len__(self):
+        return len(self.names)
+
+    def part(self, index):
+        """Return the (N, 3) array of points for a well, as a view."""
+        return self.xyz[self.offsets[index] : self.offsets[index + 1]]
+
+    def parts(self, index=None):
+        """Return the XY points per well as (N, 2) views, default for all wells."""
+        if index is None:
+            index = range(len(self))
+        return [self.part(idx)[:, :2] for idx in index]
+
+
+# the last packed wells, as the same wells are often drawn in a series of plots.
+# The wells are referenced weakly, and the entry is dropped when one is gone.
+_LAST_PACKED: Optional[tuple[tuple[weakref.ref[WellColumns], ...], PackedWells]] = None
+
+
+def _forget_packed(ref):
+    """Drop the last packed wells, if a well in them is garbage collected."""
+    global _LAST_PACKED
+
+    last = _LAST_PACKED
+    if last is not None and ref in last[0]:
+        _LAST_PACKED = None
+
+
+def packed_wells(wells) -> PackedWells:
+    """Return the wells packed, reusing the result if called again with the same."""
+    global _LAST_PACKED
+
+    key = [well_columns(well) for well in wells]
+
+    # the entry is read and replaced as a whole, as other threads may plot too
+    last = _LAST_PACKED
+    if (
+        last is not None
+        and len(last[0]) == len(key)
+        and all(ref() is col for ref, col in zip(last[0], key))
+    ):
+        return last[1]
+
+    packed = PackedWells(wells)
+    _LAST_PACKED = (tuple(weakref.ref(col, _forget_packed) for col in key), packed)
+    return packed
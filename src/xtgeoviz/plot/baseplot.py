@@ -2,21 +2,133 @@
 
 from __future__ import annotations
 
+import collections
+import functools
 import logging
+import os
+import time
 import warnings
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
 
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib import animation
+from matplotlib.collections import Collection, PathCollection
 from matplotlib.colors import LinearSegmentedColormap, ListedColormap
+from matplotlib.image import AxesImage
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
 
-from . import _colortables as _ctable
-from ._libwrapper import matplotlib_colormap
+from . import _colortables as _ctable, _overlay, _profiling
+from ._libwrapper import matplotlib_colormap, matplotlib_resampled
 
 logger = logging.getLogger(__name__)
 
+# max number of colormaps (and color tables) to keep in cache
+CMAP_CACHE_SIZE = 64
+
+_COLORTABLES: collections.OrderedDict[tuple[int, Optional[int]], tuple[Any, list]] = (
+    collections.OrderedDict()
+)
+
+
+@dataclass
+class DrawEvent:
+    """Event sent to hooks before ("start") and after ("end") a draw method.
+
+    The sizes (artists, points, segments) count what the method added to the
+    figure, and are only given with the "end" event. If the method failed, the
+    exception is given as error.
+    """
+
+    name: str
+    phase: str
+    plot: Any = field(repr=False)
+    elapsed: Optional[float] = None
+    artists: int = 0
+    points: int = 0
+    segments: int = 0
+    error: Optional[BaseException] = None
+
+
+def _artist_sizes(artist):
+    """Return (points, segments) drawn by an artist; text etc. count as none."""
+    if isinstance(artist, Line2D):
+        npts = len(artist.get_xydata())
+        return npts, max(npts - 1, 0)
+    if isinstance(artist, PathCollection):
+        return len(artist.get_offsets()), 0
+    if isinstance(artist, Collection):
+        lengths = [len(path.vertices) for path in artist.get_paths()]
+        return sum(lengths), sum(max(npts - 1, 0) for npts in lengths)
+    if isinstance(artist, AxesImage):
+        array = artist.get_array()
+        return (0 if array is None else int(np.prod(array.shape[:2]))), 0
+    if isinstance(artist, Patch):
+        npts = len(artist.get_path().vertices)
+        return npts, max(npts - 1, 0)
+    return 0, 0
+
+
+def _figure_artists(figs):
+    """Return the artists in all axes of the figures, as a dict on id()."""
+    return {
+        id(artist): artist
+        for fig in figs
+        for ax in fig.axes
+        for artist in ax.get_children()
+    }
+
+
+def drawmethod(func):
+    """Decorator sending DrawEvents to the hooks of a plot around a draw method.
+
+    The active profiler (see _profiling.profiling()) is a hook of all plots. When
+    there are no hooks, the method is called directly.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        profiler = _profiling.active()
+        if not (BasePlot._global_hooks or self._hooks or profiler):
+            return func(self, *args, **kwargs)
+
+        hooks = BasePlot._global_hooks + self._hooks
+        if profiler is not None:
+            hooks.append(profiler.draw_hook)
+
+        for hook in hooks:
+            hook(DrawEvent(func.__name__, "start", self))
+
+        before = _figure_artists(self._allfigs)
+        t0 = time.perf_counter()
+        event = DrawEvent(func.__name__, "end", self)
+        try:
+            return func(self, *args, **kwargs)
+        except BaseException as err:
+            event.error = err
+            raise
+        finally:
+            event.elapsed = time.perf_counter() - t0
+            for key, artist in _figure_artists(self._allfigs).items():
+                if key not in before:
+                    npts, nsegs = _artist_sizes(artist)
+                    event.artists += 1
+                    event.points += npts
+                    event.segments += nsegs
+            for hook in hooks:
+                hook(event)
+
+    return wrapper
+
 
 class BasePlot:
     """Base class for plots, proviridisding some functions to share."""
 
+    # hooks called for all plot instances, see add_global_hook()
+    _global_hooks: list[Callable[[DrawEvent], None]] = []
+
     def __init__(self):
         """Init method."""
 
@@ -39,6 +151,9 @@ class BasePlot:
         self._fig = None
         self._allfigs = []
         self._pagesize = "A4"
+        self._simplify = None
+        self._simplify_units = "pixels"
+        self._hooks = []
 
         logger.debug("Ran __init__ for BasePlot")
 
@@ -77,12 +192,75 @@ class BasePlot:
         """Returns page size."""
         return self._pagesize
 
+    @property
+    def simplify(self):
+        """Get or set the tolerance for simplifying lines before drawing.
+
+        Lines such as well paths, polygons and faults are thinned with the
+        Douglas-Peucker algorithm, so that the drawn line deviates less than
+        this from the input. Default is None, meaning no simplification.
+        The unit is given by ``simplify_units``.
+        """
+        return self._simplify
+
+    @simplify.setter
+    def simplify(self, tolerance):
+        if tolerance is not None and tolerance < 0:
+            raise ValueError("The simplify tolerance cannot be negative")
+        self._simplify = tolerance
+
+    @property
+    def simplify_units(self):
+        """Get or set the unit of ``simplify``, "pixels" (default) or "data"."""
+        return self._simplify_units
+
+    @simplify_units.setter
+    def simplify_units(self, units):
+        if units not in ("pixels", "data"):
+            raise ValueError("The simplify units must be 'pixels' or 'data'")
+        self._simplify_units = units
+
+    def add_hook(self, hook):
+        """Add a hook, called with a DrawEvent before and after each draw method.
+
+        The draw methods are the public plot_* methods, and canvas() and
+        savefig(). This can be used to attach timing and counters, e.g.::
+
+            def myhook(event):
+                if event.phase == "end":
+                    print(event.name, event.elapsed, event.points)
+
+            myplot.add_hook(myhook)
+
+        Args:
+            hook: A callable taking a DrawEvent as its single argument.
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """Remove a hook added with add_hook()."""
+        self._hooks.remove(hook)
+
+    @staticmethod
+    def add_global_hook(hook):
+        """Add a hook for all plot instances (also existing), see add_hook()."""
+        BasePlot._global_hooks.append(hook)
+
+    @staticmethod
+    def remove_global_hook(hook):
+        """Remove a hook added with add_global_hook()."""
+        BasePlot._global_hooks.remove(hook)
+
     @staticmethod
     def define_any_colormap(cfile, colorlist=None):
         """Defines any color map from file or a predefined name.
 
         This is a static method, which returns a matplotlib CM object.
 
+        Colormaps are cached on name, colorlist and (for files) the file
+        modification time, and each call returns a copy of the cached colormap,
+        so e.g. set_bad() on it does not leak into later plots.
+
         Args:
             cfile (str): File name (RMS format) or an alias for a predefined
                 map name, e.g. 'xtgeo', or one of matplotlibs numerous tables.
@@ -91,70 +269,51 @@ class BasePlot:
                 from 0 index. Default is just keep the linear sequence as is.
 
         """
-        valid_maps = sorted(m for m in plt.cm.datad)
-
-        logger.debug("Valid color maps: %s", valid_maps)
-
-        colors = []
-
-        cmap = plt.get_cmap("rainbow")
+        if colorlist:
+            colorlist = tuple(colorlist)
 
-        if cfile is None:
-            cfile = "rainbow"
-            cmap = plt.get_cmap("rainbow")
-
-        elif cfile == "xtgeo":
-            colors = _ctable.xtgeocolors()
-            cmap = LinearSegmentedColormap.from_list(cfile, colors, N=len(colors))
-            cmap.name = "xtgeo"
-        elif cfile == "random40":
-            colors = _ctable.random40()
-            cmap = LinearSegmentedColormap.from_list(cfile, colors, N=len(colors))
-            cmap.name = "random40"
-
-        elif cfile == "randomc":
-            colors = _ctable.randomc(256)
-            cmap = LinearSegmentedColormap.from_list(cfile, colors, N=len(colors))
-            cmap.name = "randomc"
-
-        elif isinstance(cfile, str) and "rms" in cfile:
-            colors = _ctable.colorsfromfile(cfile)
-            cmap = LinearSegmentedColormap.from_list("rms", colors, N=len(colors))
-            cmap.name = cfile
-        elif cfile in valid_maps:
-            cmap = plt.get_cmap(cfile)
-            for i in range(cmap.N):
-                colors.append(cmap(i))
-        else:
-            warnings.warn(
-                "Trying to access as color map not installed in "
-                f"this version of matplotlib: <{cfile}>. Revert to <rainbow>",
-                UserWarning,
-                stacklevel=2,
-            )
-            cmap = plt.get_cmap("rainbow")
-            for i in range(cmap.N):
-                colors.append(cmap(i))
+        if cfile == "randomc" or not isinstance(cfile, (str, os.PathLike, type(None))):
+            return _define_colormap(cfile, colorlist)
 
-        ctable = []
+        mtime = None
+        if isinstance(cfile, (str, os.PathLike)) and os.path.isfile(cfile):
+            mtime = os.stat(cfile).st_mtime_ns
 
-        if colorlist:
-            for entry in colorlist:
-                if entry < len(colors):
-                    ctable.append(colors[entry])
-                else:
-                    logger.warning("Color list out of range")
-                    ctable.append(colors[0])
+        return _cached_colormap(cfile, colorlist, mtime).copy()
 
-            cmap = LinearSegmentedColormap.from_list(ctable, colors, N=len(colors))
-            cmap.name = "user"
+    @staticmethod
+    def get_any_colormap_as_table(cmap, ncolors=None):
+        """Returns the given color map cmap as a list of RGB tuples.
 
-        return cmap
+        Args:
+            cmap: A matplotlib colormap.
+            ncolors (int, optional): Number of colors, default is the colors of the
+                map. Fewer colors are the first colors of the map. For more
+                colors, a ListedColormap is cycled, and other maps (e.g. the color
+                tables made from files and names) are resampled.
+        """
+        if ncolors is not None and ncolors <= cmap.N:
+            return BasePlot.get_any_colormap_as_table(cmap)[:ncolors]
+
+        key = (id(cmap), ncolors)
+        entry = _COLORTABLES.get(key)
+        if entry is None or entry[0] is not cmap:
+            if ncolors is None:
+                table = [tuple(rgba) for rgba in cmap(np.arange(cmap.N)).tolist()]
+            elif isinstance(cmap, ListedColormap):
+                table = BasePlot.get_any_colormap_as_table(cmap)
+                table = [table[icol % cmap.N] for icol in range(ncolors)]
+            else:
+                resampled = matplotlib_resampled(cmap, ncolors)
+                table = [tuple(rgba) for rgba in resampled(np.arange(ncolors)).tolist()]
+            entry = (cmap, table)
+            _COLORTABLES[key] = entry
+            if len(_COLORTABLES) > CMAP_CACHE_SIZE:
+                _COLORTABLES.popitem(last=False)
+        else:
+            _COLORTABLES.move_to_end(key)
 
-    @staticmethod
-    def get_any_colormap_as_table(cmap):
-        """Returns the given color map cmap as a list of RGB tuples."""
-        return [cmap(i) for i in range(cmap.N)]
+        return list(entry[1])
 
     def get_colormap_as_table(self):
         """Get the current color map as a list of RGB tuples."""
@@ -178,6 +337,30 @@ class BasePlot:
         self.contourlevels = cmap.N
         self._colormap = cmap
 
+    def _simplify_transform(self, ax):
+        """Return the transform to apply before simplifying lines drawn in ax."""
+        if self._simplify_units == "data":
+            return None
+        ax.apply_aspect()
+        return ax.transData
+
+    def _simplified(self, ax, parts):
+        """Return the list of (N, 2) lines simplified, if simplify is set."""
+        if not self._simplify:
+            return parts
+        return _overlay.simplify_parts(
+            parts, self._simplify, self._simplify_transform(ax)
+        )
+
+    def _simplified_index(self, ax, xy, keep=None):
+        """Return indices of the vertices in xy to draw, see _overlay.simplify_line."""
+        if not self._simplify:
+            return np.arange(len(xy))
+        transform = self._simplify_transform(ax)
+        coords = xy if transform is None else transform.transform(xy)
+        return _overlay.simplify_line(coords, self._simplify, keep=keep)
+
+    @drawmethod
     def canvas(self, title=None, subtitle=None, infotext=None, figscaling=1.0):
         """Prepare the canvas to plot on, with title and subtitle.
 
@@ -225,7 +408,8 @@ class BasePlot:
         for fig in self._allfigs:
             plt.close(fig)
 
-    def savefig(self, filename, fformat="png", last=True, **kwargs):
+    @drawmethod
+    def savefig(self, filename, fformat="png", last=True, pool=None, **kwargs):
         """Call to matplotlib.pyplot savefig method.
 
         Args:
@@ -233,6 +417,9 @@ class BasePlot:
             fformat (str): Plot format, e.g. png (default), jpg, svg
             last (bool): Default is true, calls close on the plot, let last
                 be False for all except the last plots.
+            pool (SavePool): If given, the figure is rendered to memory, and
+                encoded and written to file in the background by the pool. Use
+                pool.join() to wait for the files.
             kwargs: Additional keyword arguments that are passed
                 to matplotlib when saving the figure
 
@@ -251,10 +438,117 @@ class BasePlot:
             self._fig.tight_layout()
 
         if self._showok:
-            plt.savefig(filename, format=fformat, **kwargs)
+            if pool is not None:
+                pool.submit(self._fig, filename, fformat, close=False, **kwargs)
+            else:
+                plt.savefig(filename, format=fformat, **kwargs)
             if last:
                 self.close()
             return True
 
         logger.warning("Nothing to plot (well outside Z range?)")
         return False
+
+    def _save_animation(self, update, nframes, filename, fps=5, dpi=None):
+        """Write an animation of the current figure, one update call per frame.
+
+        The figure is kept as is, and ``update(frame)`` is only expected to change
+        the data of existing artists. MP4 (and other movie formats) needs ffmpeg;
+        if not available, a GIF is written by Pillow instead, next to the
+        requested file name.
+
+        Returns:
+            The file name actually written.
+        """
+        filename = str(filename)
+        root, ext = os.path.splitext(filename)
+
+        if ext.lower() == ".gif":
+            writer = animation.PillowWriter(fps=fps)
+        elif animation.writers.is_available("ffmpeg"):
+            writer = animation.FFMpegWriter(fps=fps)
+        else:
+            warnings.warn(
+                f"Cannot write <{filename}> as ffmpeg is not available, "
+                "revert to GIF with Pillow",
+                UserWarning,
+                stacklevel=3,
+            )
+            filename = root + ".gif"
+            writer = animation.PillowWriter(fps=fps)
+
+        with writer.saving(self._fig, filename, dpi or self._fig.dpi):
+            for frame in range(nframes):
+                update(frame)
+                writer.grab_frame()
+
+        logger.debug("Animation with %s frames written to %s", nframes, filename)
+        return filename
+
+
+def _define_colormap(cfile, colorlist=None):
+    """Make a colormap, see BasePlot.define_any_colormap()."""
+    valid_maps = sorted(m for m in plt.cm.datad)
+
+    logger.debug("Valid color maps: %s", valid_maps)
+
+    colors = []
+
+    cmap = plt.get_cmap("rainbow")
+
+    if cfile is None:
+        cfile = "rainbow"
+        cmap = plt.get_cmap("rainbow")
+
+    elif cfile == "xtgeo":
+        colors = _ctable.xtgeocolors()
+        cmap = LinearSegmentedColormap.from_list(cfile, colors, N=len(colors))
+        cmap.name = "xtgeo"
+    elif cfile == "random40":
+        colors = _ctable.random40()
+        cmap = LinearSegmentedColormap.from_list(cfile, colors, N=len(colors))
+        cmap.name = "random40"
+
+    elif cfile == "randomc":
+        colors = _ctable.randomc(256)
+        cmap = LinearSegmentedColormap.from_list(cfile, colors, N=len(colors))
+        cmap.name = "randomc"
+
+    elif isinstance(cfile, str) and "rms" in cfile:
+        colors = _ctable.colorsfromfile(cfile)
+        cmap = LinearSegmentedColormap.from_list("rms", colors, N=len(colors))
+        cmap.name = cfile
+    elif cfile in valid_maps:
+        cmap = plt.get_cmap(cfile)
+        colors = [tuple(rgba) for rgba in cmap(np.arange(cmap.N)).tolist()]
+    else:
+        warnings.warn(
+            "Trying to access as color map not installed in "
+            f"this version of matplotlib: <{cfile}>. Revert to <rainbow>",
+            UserWarning,
+            stacklevel=4,
+        )
+        cmap = plt.get_cmap("rainbow")
+        colors = [tuple(rgba) for rgba in cmap(np.arange(cmap.N)).tolist()]
+
+    ctable = []
+
+    if colorlist:
+        for entry in colorlist:
+            if entry < len(colors):
+                ctable.append(colors[entry])
+            else:
+                logger.warning("Color list out of range")
+                ctable.append(colors[0])
+
+        cmap = LinearSegmentedColormap.from_list(ctable, colors, N=len(colors))
+        cmap.name = "user"
+
+    return cmap
+
+
+@functools.lru_cache(maxsize=CMAP_CACHE_SIZE)
+def _cached_colormap(cfile, colorlist, mtime):
+    """Cached _define_colormap(); mtime is only a part of the cache key."""
+    logger.debug("Make colormap %s (file mtime %s)", cfile, mtime)
+    return _define_colormap(cfile, colorlist)
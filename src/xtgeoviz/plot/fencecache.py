@@ -0,0 +1,182 @@
+"""Process wide cache of well fences, optionally also stored on disk.
+
+The fence of a well (see xtgeo Well.get_fence_polyline) is cached by the hash of
+the well trajectory and the fence parameters, so plotting the same well again,
+e.g. with other layers or styles, does not compute it again. Example::
+
+    from xtgeoviz.plot import fencecache
+
+    fencecache.configure(folder="/scratch/fences")  # optional, keep on disk
+    fencecache.precompute_fences(wells, tvdmin=1500)
+    ...  # XSection plots of the wells use the cached fences
+
+Changes made in place to the well trajectory values are not seen by the cache;
+replace the well dataframe (e.g. with set_dataframe) instead.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal
+
+import numpy as np
+
+from . import _wellstore
+
+logger = logging.getLogger(__name__)
+
+# default number of fences kept in memory
+FENCE_CACHE_SIZE = 256
+
+# the default fence parameters, as in XSection
+FENCE_SAMPLING = 20
+FENCE_NEXTEND = 5
+
+# fences (or False if not possible) on trajectory digest and fence parameters
+_FENCES: collections.OrderedDict[tuple, np.ndarray | Literal[False]] = (
+    collections.OrderedDict()
+)
+_LOCK = threading.Lock()
+_MAXSIZE: int = FENCE_CACHE_SIZE
+_FOLDER: str | None = None
+
+
+def configure(maxsize: int | None = None, folder: str | None = None):
+    """Set the number of fences kept in memory, and a folder to store them in.
+
+    Args:
+        maxsize: Max number of fences in memory; the least recently used are
+            removed first. Default is to keep the current setting.
+        folder: A folder to also store the fences in, to be reused by later runs;
+            an empty string turns this off. Default is to keep the current setting.
+    """
+    global _MAXSIZE, _FOLDER
+
+    with _LOCK:
+        if maxsize is not None:
+            _MAXSIZE = maxsize
+            while len(_FENCES) > maxsize:
+                _FENCES.popitem(last=False)
+        if folder is not None:
+            _FOLDER = folder or None
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+
+
+def clear():
+    """Remove all fences from memory (but not from the folder, if any)."""
+    with _LOCK:
+        _FENCES.clear()
+
+
+def get_fence(
+    well,
+    sampling: float = FENCE_SAMPLING,
+    nextend: int = FENCE_NEXTEND,
+    tvdmin: float | None = None,
+):
+    """Return the fence of a well, as Well.get_fence_polyline(), from the cache.
+
+    Returns:
+        A copy of the fence as a numpy array, or False if a fence is not possible.
+    """
+    key = _key(well, sampling, nextend, tvdmin)
+
+    with _LOCK:
+        fence = _FENCES.get(key)
+        if fence is not None:
+            _FENCES.move_to_end(key)
+
+    if fence is None:
+        fence = _load(key)
+    if fence is None:
+        fence = well.get_fence_polyline(
+            sampling=sampling, nextend=nextend, tvdmin=tvdmin
+        )
+        _store(key, fence)
+
+    with _LOCK:
+        _FENCES[key] = fence
+        _FENCES.move_to_end(key)
+        while len(_FENCES) > _MAXSIZE:
+            _FENCES.popitem(last=False)
+
+    return fence if fence is False else fence.copy()
+
+
+def precompute_fences(
+    wells,
+    sampling: float = FENCE_SAMPLING,
+    nextend: int = FENCE_NEXTEND,
+    tvdmin=None,
+    max_workers: int | None = None,
+):
+    """Compute the fences of wells in parallel threads, and keep them in the cache.
+
+    The cache should be large enough for all the wells, see configure().
+
+    Args:
+        wells: A list of XTGeo Well instances.
+        sampling: Fence sampling, as for XSection.
+        nextend: Fence extension, as for XSection.
+        tvdmin: The min TVD of the fences, as one value or a list with a value per
+            well; use the zmin of the XSection plots.
+        max_workers: Number of threads, default is as for ThreadPoolExecutor.
+    """
+    if tvdmin is None or np.isscalar(tvdmin):
+        tvdmin = [tvdmin] * len(wells)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(get_fence, well, sampling, nextend, zmin)
+            for well, zmin in zip(wells, tvdmin)
+        ]
+        for future in futures:
+            future.result()
+
+    logger.info("Computed fences for %s wells", len(wells))
+
+
+def _key(well, sampling, nextend, tvdmin):
+    return (
+        _wellstore.well_columns(well).trajectory_digest(),
+        float(sampling),
+        int(nextend),
+        None if tvdmin is None else float(tvdmin),
+    )
+
+
+def _filename(folder, key):
+    name = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+    return os.path.join(folder, f"fence_{name}.npy")
+
+
+def _load(key):
+    folder = _FOLDER
+    if not folder:
+        return None
+    try:
+        fence = np.load(_filename(folder, key))
+    except (OSError, ValueError):
+        return None
+    # an empty array is stored when a fence is not possible
+    return fence if fence.size else False
+
+
+def _store(key, fence):
+    folder = _FOLDER
+    if not folder:
+        return
+    filename = _filename(folder, key)
+    tmpname = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmpname, "wb") as stream:
+            np.save(stream, np.empty(0) if fence is False else fence)
+        os.replace(tmpname, filename)
+    except OSError as err:
+        logger.warning("Could not store fence in %s: %s", filename, err)
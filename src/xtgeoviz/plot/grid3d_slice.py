@@ -5,10 +5,11 @@ from __future__ import annotations
 import logging
 
 import matplotlib.pyplot as plt
+import numpy.ma as ma
 from matplotlib.collections import PatchCollection
 from matplotlib.patches import Polygon
 
-from .baseplot import BasePlot
+from .baseplot import BasePlot, drawmethod
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +40,9 @@ class Grid3DSlice(BasePlot):
         self._active = True
         self._minvalue = None
         self._maxvalue = None
+        self._patchcoll = None
 
+    @drawmethod
     def plot_gridslice(
         self,
         grid,
@@ -132,9 +135,7 @@ class Grid3DSlice(BasePlot):
         )
 
         if self._prop:
-            pvalues = self._prop.values
-            pvalues = pvalues[:, :, self._index - 1]
-            pvalues = pvalues[~pvalues.mask]
+            pvalues = self._layer_values(self._prop)
 
             patchcoll.set_array(pvalues)
 
@@ -148,9 +149,96 @@ class Grid3DSlice(BasePlot):
 
             patchcoll.set_clim([pmin, pmax])
 
+        self._patchcoll = patchcoll
         im = self._ax.add_collection(patchcoll)
         self._ax.set_xlim((xmin, xmax))
         self._ax.set_ylim((ymin, ymax))
         self._fig.colorbar(im)
 
         plt.gca().set_aspect("equal", adjustable="box")
+
+    def _layer_values(self, prop):
+        """Return the active property values for current layer, as for the patches."""
+        pvalues = prop.values[:, :, self._index - 1]
+        return pvalues[~ma.getmaskarray(pvalues)]
+
+    @drawmethod
+    def animate_gridslice(
+        self,
+        grid,
+        props,
+        filename,
+        minvalue=None,
+        maxvalue=None,
+        colormap=None,
+        linecolor="black",
+        index=1,
+        window=None,
+        activeonly=True,
+        labels=None,
+        fps=5,
+        dpi=None,
+    ):
+        """Write an animation of a layer slice for a sequence of grid properties.
+
+        This is typically used for restart properties, where the cell geometry is
+        the same for all dates. The cell polygons are made once, and only the
+        colors are updated for the next frames. Use canvas() first to get title etc.
+
+        Args:
+            grid (Grid): The XTGeo grid object
+            props (list): List of XTGeo GridProperty objects, e.g. one per date.
+            filename (str): Output file, typically .mp4 or .gif. If ffmpeg is
+                not present, a .gif will be made instead.
+            minvalue (float): Minimum level color scale (default: from all data)
+            maxvalue (float): Maximum level color scale (default: from all data)
+            colormap: Color map to use for cells, e.g. 'rainbow' or an rmscol file
+            linecolor (str or tuple): Color of grid lines, see plot_gridslice()
+            index (int): Layer number to plot (first=1)
+            window (str): Some window
+            activeonly (bool): If only use active cells
+            labels (list of str): Frame labels, default is property dates or names.
+            fps (int): Frames per second.
+            dpi (float): Resolution, default is the figure resolution.
+
+        Returns:
+            The file name actually written.
+        """
+        if not props:
+            raise ValueError("No grid properties to animate")
+
+        if self._fig is None:
+            self.canvas()
+
+        self._index = index
+        frames = [self._layer_values(prop) for prop in props]
+
+        if minvalue is None:
+            minvalue = min(values.min() for values in frames)
+        if maxvalue is None:
+            maxvalue = max(values.max() for values in frames)
+
+        if labels is None:
+            labels = [str(prop.date or prop.name) for prop in props]
+
+        self.plot_gridslice(
+            grid,
+            prop=props[0],
+            minvalue=minvalue,
+            maxvalue=maxvalue,
+            colormap=colormap,
+            linecolor=linecolor,
+            index=index,
+            window=window,
+            activeonly=activeonly,
+        )
+
+        label = self._ax.text(
+            0.02, 0.98, "", transform=self._ax.transAxes, ha="left", va="top"
+        )
+
+        def _update(frame):
+            self._patchcoll.set_array(frames[frame])
+            label.set_text(labels[frame])
+
+        return self._save_animation(_update, len(props), filename, fps=fps, dpi=dpi)
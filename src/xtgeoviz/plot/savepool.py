@@ -0,0 +1,162 @@
+"""Save figures in the background, while the next plot is made.
+
+Example::
+
+    from xtgeoviz.plot import SavePool, XSection
+
+    with SavePool() as pool:
+        for well in wells:
+            xsect = XSection(well=well, ...)
+            ...
+            xsect.savefig(f"{well.name}.png", pool=pool)
+
+    paths, errors = pool.join()
+
+The figure is rendered in the calling thread, as matplotlib is not thread safe,
+and closed as soon as the result is captured. Only the encoding (e.g. PNG
+compression) and the file writing are done in the background.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.image import imsave
+
+logger = logging.getLogger(__name__)
+
+# formats encoded from the Agg RGBA buffer in the background
+RASTER_FORMATS = ("png", "jpg", "jpeg", "tif", "tiff", "webp")
+
+# aliases of the raster formats, which imsave does not know (as savefig does)
+_FORMAT_ALIASES = {"jpg": "jpeg", "tif": "tiff"}
+
+
+class SavePool:
+    """A bounded pool of background threads encoding and writing figures.
+
+    Args:
+        max_workers: Number of background threads.
+        max_pending: Max number of captured figures waiting to be written; further
+            saves wait until one is done, to bound the memory used by buffers.
+            Default is twice max_workers.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int | None = None):
+        if max_workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="xtgeoviz-save"
+        )
+        self._slots = threading.BoundedSemaphore(max_pending or 2 * max_workers)
+        self._futures: list[tuple[str, Future]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def submit(self, fig, filename, fformat="png", close=True, **kwargs):
+        """Capture the figure, then encode and write it in the background.
+
+        Args:
+            fig: The matplotlib figure.
+            filename: File to write to.
+            fformat: File format, e.g. png (default), svg or pdf.
+            close: If True (default), close the figure when it is captured.
+            kwargs: Keyword arguments passed to matplotlib when saving; only dpi
+                is supported for the background encoding of raster formats, other
+                options makes the figure be fully encoded in the calling thread.
+        """
+        filename = os.fspath(filename)
+        fformat = fformat.lower()
+
+        self._slots.acquire()
+        try:
+            if fformat in RASTER_FORMATS and set(kwargs) <= {"dpi"}:
+                rgba, dpi = _render_rgba(fig, kwargs.get("dpi"))
+                task = (_write_raster, filename, rgba, fformat, dpi)
+            else:
+                stream = io.BytesIO()
+                fig.savefig(stream, format=fformat, **kwargs)
+                task = (_write_bytes, filename, stream.getbuffer())
+        except BaseException:
+            self._slots.release()
+            raise
+        finally:
+            if close:
+                plt.close(fig)
+
+        future = self._executor.submit(*task)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append((filename, future))
+        logger.debug("Figure captured, writing %s in the background", filename)
+
+    def join(self):
+        """Wait for all files to be written.
+
+        Returns:
+            A tuple (paths, errors), where paths is a list of files written and
+            errors is a dict with file name and exception for failed files.
+        """
+        paths = []
+        errors = {}
+        for filename, future in self._futures:
+            error = future.exception()
+            if error is None:
+                paths.append(filename)
+            else:
+                logger.error("Could not write %s: %s", filename, error)
+                errors[filename] = error
+
+        self._futures = []
+        return paths, errors
+
+    def shutdown(self):
+        """Wait for the files, and stop the background threads."""
+        self._executor.shutdown(wait=True)
+
+
+def _render_rgba(fig, dpi=None):
+    """Draw the figure with Agg and return a copy of the RGBA buffer, and the dpi.
+
+    A figure of another backend is drawn on a temporary Agg canvas, and keeps its
+    own canvas (e.g. of a GUI window).
+    """
+    original = fig.canvas
+    canvas = original
+    if not isinstance(canvas, FigureCanvasAgg):
+        canvas = FigureCanvasAgg(fig)  # this replaces fig.canvas
+
+    dpi = dpi or fig.dpi
+    figdpi = fig.dpi
+    fig.dpi = dpi
+    try:
+        canvas.draw()
+        rgba = np.array(canvas.buffer_rgba())
+    finally:
+        fig.dpi = figdpi
+        if canvas is not original:
+            fig.set_canvas(original)
+
+    return rgba, dpi
+
+
+def _write_raster(filename, rgba, fformat, dpi):
+    # a memoryview of the RGBA bytes is used as is by imsave
+    fformat = _FORMAT_ALIASES.get(fformat, fformat)
+    imsave(filename, memoryview(rgba), format=fformat, dpi=dpi)
+
+
+def _write_bytes(filename, data):
+    with open(filename, "wb") as stream:
+        stream.write(data)
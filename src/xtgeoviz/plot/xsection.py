@@ -5,18 +5,21 @@ from __future__ import annotations
 import logging
 import math
 import warnings
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 import numpy.ma as ma
-import pandas as pd
 import xtgeo
 from matplotlib import collections as mc
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Colormap, Normalize
 from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
 
-from ._libwrapper import matplotlib_colormap, scipy_gaussianfilter
-from .baseplot import BasePlot
+from . import _backdrop, _overlay, _wellstore, fencecache
+from ._libwrapper import matplotlib_colormap
+from .baseplot import BasePlot, drawmethod
 
 if TYPE_CHECKING:
     from matplotlib.colors import LinearSegmentedColormap, ListedColormap
@@ -36,7 +39,8 @@ class XSection(BasePlot):
         surfacenames: List of surface names (str) for legend
         cube: A XTGeo Cube instance
         grid: A XTGeo Grid instance
-        gridproperty: A XTGeo GridProperty instance
+        gridproperty: A XTGeo GridProperty instance, or a list of them, or a dict of
+            them by name, plotted as layers of the grid backdrop.
         colormap: Name of colormap, e.g. 'Set1'. Default is 'xtgeo'
         outline: XTGeo Polygons object
 
@@ -55,7 +59,7 @@ class XSection(BasePlot):
         surfacenames: Optional[list] = None,
         cube: Optional[xtgeo.Cube] = None,
         grid: Optional[xtgeo.Grid] = None,
-        gridproperty: Optional[xtgeo.GridProperty] = None,
+        gridproperty: Optional[Union[xtgeo.GridProperty, list, dict]] = None,
         outline: Optional[xtgeo.Polygons] = None,
     ):
         """Init method."""
@@ -70,7 +74,8 @@ class XSection(BasePlot):
         self._surfacenames = surfacenames
         self._cube = cube
         self._grid = grid
-        self._gridproperty = gridproperty
+        self._gridproperties = _grid_properties(gridproperty)
+        self._gridproperty = next(iter(self._gridproperties.values()), None)
         self._zonelogshift = zonelogshift
         self._outline = outline
 
@@ -79,6 +84,7 @@ class XSection(BasePlot):
 
         self._pagesize = "A4"
         self._fence = None
+        self._wellview = None
         self._legendtitle = "Zones"
         self._legendsize = 5
 
@@ -92,6 +98,11 @@ class XSection(BasePlot):
 
         self._colormap_grid = None
         self._colorlegend_grid = False
+        # name -> (image or mappable, composite layer index)
+        self._gridlayers: dict[str, tuple[Any, Optional[int]]] = {}
+        self._gridcolorbar = None
+
+        self._composite = None  # the image of composited backdrops
 
         if colormap is None:
             self._colormap = matplotlib_colormap("viridis")
@@ -150,6 +161,11 @@ class XSection(BasePlot):
 
         self._has_axes = value
 
+    @property
+    def grid_layers(self):
+        """The names of the grid properties, plotted as layers (read only)."""
+        return list(self._gridproperties)
+
     @property
     def colormap_facies(self):
         """Set or get the facies colormap."""
@@ -215,8 +231,11 @@ class XSection(BasePlot):
         """Set or get the fence spesification."""
         if self._fence is None:
             if self._well is not None:
-                wfence = self._well.get_fence_polyline(
-                    sampling=self._sampling, nextend=self._nextend, tvdmin=self._zmin
+                wfence = fencecache.get_fence(
+                    self._well,
+                    sampling=self._sampling,
+                    nextend=self._nextend,
+                    tvdmin=self._zmin,
                 )
                 self._fence = wfence
 
@@ -231,10 +250,19 @@ class XSection(BasePlot):
         # this can be extended with checks and various types of input...
         self._fence = myfence
 
+    def _get_wellview(self):
+        """The well rows below zmin as arrays, made once and shared by the plots."""
+        if self._wellview is None:
+            self._wellview = _wellstore.WellView(
+                _wellstore.well_columns(self._well), zmin=self._zmin
+            )
+        return self._wellview
+
     # ==================================================================================
     # Functions methods (public)
     # ==================================================================================
 
+    @drawmethod
     def canvas(self, title=None, subtitle=None, infotext=None, figscaling=1.0):
         """Prepare the canvas to plot on, with title and subtitle.
 
@@ -260,6 +288,9 @@ class XSection(BasePlot):
 
         self._fig = plt.figure(figsize=(11.69 * figscaling, 8.27 * figscaling))
         self._allfigs.append(self._fig)
+        self._composite = None
+        self._gridlayers = {}
+        self._gridcolorbar = None
 
         ax1 = {
             "main": plt.subplot2grid((20, 28), (0, 0), rowspan=20, colspan=23),
@@ -359,6 +390,7 @@ class XSection(BasePlot):
         self._ax2 = ax2
         self._ax3 = ax3
 
+    @drawmethod
     def plot_well(
         self,
         zonelogname="ZONELOG",
@@ -374,31 +406,44 @@ class XSection(BasePlot):
         if self.fence is None:
             return
 
-        # reduce the well data by Pandas operations
-        dfr = self._well.get_dataframe(copy=False)
-        self._well.set_dataframe(dfr[dfr["Z_TVDSS"] > self._zmin])
-
-        # Create a relative XYLENGTH vector (0.0 where well starts)
-        self._well.create_relative_hlen()
-
-        dfr = self._well.get_dataframe(copy=False)
-        if dfr.empty:
+        # the well below zmin as arrays, with a relative length (0.0 where it starts);
+        # the well itself is not changed
+        view = self._get_wellview()
+        if len(view) == 0:
             self._showok = False
             return
 
-        # get the well trajectory (numpies) as copy
-        zv = dfr["Z_TVDSS"].values.copy()
-        hv = dfr["R_HLEN"].values.copy()
+        zv = view["Z_TVDSS"]
+        hv = view["R_HLEN"]
+
+        # thin the trajectory for drawing, but keep all points where logs change
+        crossview = view
+        if self._simplify:
+            logs = [
+                view[name]
+                for name in (zonelogname, facieslogname, perflogname)
+                if name and name in view
+            ]
+            idx = self._simplified_index(
+                self._ax1["main"],
+                np.column_stack((hv, zv)),
+                keep=_overlay.change_points(*logs),
+            )
+            view = view.take(idx)
+            zv = view["Z_TVDSS"]
+            hv = view["R_HLEN"]
 
         # plot the perflog, if any, first
         if perflogname:
             ax, bba = self._currentax(axisname="perf")
-            self._plot_well_perflog(dfr, ax, bba, perflogname, legend=self._has_legend)
+            self._plot_well_perflog(view, ax, bba, perflogname, legend=self._has_legend)
 
         # plot the facies, if any, behind the trajectory; ie. first or second
         if facieslogname:
             ax, bba = self._currentax(axisname="facies")
-            self._plot_well_faclog(dfr, ax, bba, facieslogname, legend=self._has_legend)
+            self._plot_well_faclog(
+                view, ax, bba, facieslogname, legend=self._has_legend
+            )
 
         axx, _bbxa = self._currentax(axisname="well")
         self._plot_well_traj(
@@ -407,19 +452,19 @@ class XSection(BasePlot):
 
         if zonelogname:
             ax, bba = self._currentax(axisname="main")
-            self._plot_well_zlog(dfr, axx, bba, zonelogname, legend=self._has_legend)
+            self._plot_well_zlog(view, axx, bba, zonelogname, legend=self._has_legend)
 
         if wellcrossings is not None and wellcrossings.empty:
             wellcrossings = None
 
         if wellcrossings is not None:
             self._plot_well_crossings(
-                dfr, axx, wellcrossings, wellcrossingnames, wellcrossingyears
+                crossview, axx, wellcrossings, wellcrossingnames, wellcrossingyears
             )
 
     def set_xaxis_md(self, gridlines=False):
         """Set x-axis labels to measured depth."""
-        md_start = self._well.get_dataframe(copy=False)["MDEPTH"].iloc[0]
+        md_start = self._get_wellview()["MDEPTH"][0]
         md_start_round = int(math.floor(md_start / 100.0)) * 100
         md_start_delta = md_start - md_start_round
 
@@ -459,67 +504,65 @@ class XSection(BasePlot):
         ax.plot(hv_copy, zv_copy, linewidth=linewidth, c=welltrajcolor)
 
     @staticmethod
-    def _line_segments_colors(df, idx, ctable, logname, fillnavalue):
-        """Get segment and color array for plotting matplotlib lineCollection."""
-        df_idx = pd.DataFrame(
-            {"idx_log": list(idx.keys()), "idx_color": list(idx.values())}
-        )
-
-        df_ctable = df_idx.merge(
-            pd.DataFrame({"ctable": ctable}),
-            how="left",
-            left_on="idx_color",
-            right_index=True,
-        )
-
-        dff = df.merge(df_ctable, how="left", left_on=logname, right_on="idx_log")
-
-        dff["point"] = list(zip(dff["R_HLEN"], dff["Z_TVDSS"]))
-
-        # find line segments
-        segments = []
-        segments_i = -1
-        colorlist = []
-        previous_color = None
+    def _line_segments_colors(view, idx, ctable, logname, fillnavalue):
+        """Get segment and color array for plotting matplotlib lineCollection.
 
-        for point, color in zip(dff["point"], dff["ctable"]):
-            if np.any(np.isnan(color)):
-                color = fillnavalue
-
-            if color == previous_color:
-                segments[segments_i].append(point)
-                previous_color = color
-            else:
-                # add endpoint to current segment
-                if segments_i > 0:
-                    segments[segments_i].append(point)
-
-                # start new segment
-                segments.append([point])
-                colorlist.append(color)
-
-                previous_color = color
-                segments_i += 1
-
-        colorlist = np.asarray(colorlist, dtype=object)
+        Consecutive points with the same color make one segment. The log values
+        are mapped to colors by idx (log value to color index in ctable, or a color
+        name); other values, and NaN, get the fillnavalue color.
+        """
+        values = view[logname]
+        if len(values) == 0:
+            return [], np.asarray([], dtype=object)
+
+        # color per unique value, then a code per point for each distinct color
+        uniq, inverse = np.unique(values, return_inverse=True)
+        colors = []
+        codes = {}
+        uniq_codes = np.empty(len(uniq), dtype=np.int64)
+        for iuniq, value in enumerate(uniq):
+            color = fillnavalue
+            icolor = None if np.isnan(value) else idx.get(value)
+            if isinstance(icolor, str):
+                color = icolor
+            elif icolor is not None and 0 <= icolor < len(ctable):
+                color = ctable[int(icolor)]
+
+            key = color if isinstance(color, str) else tuple(color)
+            if key not in codes:
+                codes[key] = len(colors)
+                colors.append(color)
+            uniq_codes[iuniq] = codes[key]
+
+        pcodes = uniq_codes[inverse.ravel()]
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(pcodes)) + 1))
+        ends = np.append(starts[1:], len(pcodes))
+        # each segment but the first ends at the start of the next
+        ends[1:-1] += 1
+
+        hv = view["R_HLEN"]
+        zv = view["Z_TVDSS"]
+        segments = [
+            np.column_stack((hv[start:end], zv[start:end]))
+            for start, end in zip(starts, ends)
+        ]
+        colorlist = np.asarray([colors[code] for code in pcodes[starts]], dtype=object)
 
         return segments, colorlist
 
-    def _plot_well_zlog(self, df, ax, bba, zonelogname, logwidth=4, legend=False):
+    def _plot_well_zlog(self, view, ax, bba, zonelogname, logwidth=4, legend=False):
         """Plot the zone log as colored segments."""
-        if zonelogname not in df.columns:
+        if zonelogname not in view:
             return
 
-        zomin = 0
-        zomax = 0
-
-        try:
-            zomin = int(df[zonelogname].min())
-            zomax = int(df[zonelogname].max())
-        except ValueError:
+        zones = view[zonelogname]
+        if np.isnan(zones).all():
             self._showok = False
             return
 
+        zomin = int(np.nanmin(zones))
+        zomax = int(np.nanmax(zones))
+
         logger.debug("ZOMIN, ZOMAX %s %s ?", zomin, zomax)  # used for what?
 
         zshift = 0
@@ -541,7 +584,7 @@ class XSection(BasePlot):
 
         fillnavalue = (0.9, 0.9, 0.9)
         segments, segments_colors = self._line_segments_colors(
-            df, idx_zshift, ctable, zonelogname, fillnavalue
+            view, idx_zshift, ctable, zonelogname, fillnavalue
         )
 
         lc = mc.LineCollection(
@@ -551,7 +594,7 @@ class XSection(BasePlot):
         ax.add_collection(lc)
 
         if legend:
-            zrecord = self._well.get_logrecord(zonelogname)
+            zrecord = _wellstore.well_columns(self._well).logrecord(zonelogname)
             zrecord = {val: zname for val, zname in zrecord.items() if val >= 0}
 
             zcolors = {}
@@ -562,18 +605,18 @@ class XSection(BasePlot):
 
             self._drawproxylegend(ax, bba, items=zcolors, title="Zonelog")
 
-    def _plot_well_faclog(self, df, ax, bba, facieslogname, logwidth=9, legend=True):
+    def _plot_well_faclog(self, view, ax, bba, facieslogname, logwidth=9, legend=True):
         """Plot the facies log as colored segments.
 
         Args:
-            df (dataframe): The Well dataframe.
+            view (WellView): The well rows to plot.
             ax (axes): The ax plot object.
             bba: Bounding box
             facieslogname (str): name of the facies log.
             logwidth (int): Log linewidth.
             legend (bool): Plot log legend?
         """
-        if facieslogname not in df.columns:
+        if facieslogname not in view:
             return
 
         cmap = self.colormap_facies
@@ -582,7 +625,7 @@ class XSection(BasePlot):
 
         fillnavalue = (0, 0, 0, 0)  # transparent
         segments, segments_colors = self._line_segments_colors(
-            df, idx, ctable, facieslogname, fillnavalue
+            view, idx, ctable, facieslogname, fillnavalue
         )
 
         lc = mc.LineCollection(
@@ -592,7 +635,7 @@ class XSection(BasePlot):
         ax.add_collection(lc)
 
         if legend:
-            frecord = self._well.get_logrecord(facieslogname)
+            frecord = _wellstore.well_columns(self._well).logrecord(facieslogname)
             frecord = {val: fname for val, fname in frecord.items() if val >= 0}
 
             fcolors = {}
@@ -606,11 +649,11 @@ class XSection(BasePlot):
 
             self._drawproxylegend(ax, bba, items=fcolors, title="Facies")
 
-    def _plot_well_perflog(self, df, ax, bba, perflogname, logwidth=12, legend=True):
+    def _plot_well_perflog(self, view, ax, bba, perflogname, logwidth=12, legend=True):
         """Plot the perforation log as colored segments.
 
         Args:
-            df (dataframe): The Well dataframe.
+            view (WellView): The well rows to plot.
             ax (axes): The ax plot object.
             zv (ndarray): The numpy Z TVD array.
             bba: Boundinng box
@@ -619,7 +662,7 @@ class XSection(BasePlot):
             logwidth (int): Log linewidth.
             legend (bool): Plot log legend?
         """
-        if perflogname not in df.columns:
+        if perflogname not in view:
             return
 
         cmap = self.colormap_perf
@@ -628,7 +671,7 @@ class XSection(BasePlot):
 
         fillnavalue = (0, 0, 0, 0)  # transparent
         segments, segments_colors = self._line_segments_colors(
-            df, idx, ctable, perflogname, fillnavalue
+            view, idx, ctable, perflogname, fillnavalue
         )
 
         lc = mc.LineCollection(
@@ -638,7 +681,7 @@ class XSection(BasePlot):
         ax.add_collection(lc)
 
         if legend:
-            precord = self._well.get_logrecord(perflogname)
+            precord = _wellstore.well_columns(self._well).logrecord(perflogname)
             precord = {val: pname for val, pname in precord.items() if val >= 0}
 
             pcolors = {}
@@ -650,7 +693,7 @@ class XSection(BasePlot):
             self._drawproxylegend(ax, bba, items=pcolors, title="Perforations")
 
     @staticmethod
-    def _plot_well_crossings(dfr, ax, wcross, names=True, years=False):
+    def _plot_well_crossings(view, ax, wcross, names=True, years=False):
         """Plot well crossing based on dataframe (wcross).
 
         The well crossing coordinates are identified for this well,
@@ -668,7 +711,7 @@ class XSection(BasePlot):
         * Drilled year of crossing well named CYEAR
 
         Args:
-            dfr: Well dataframe
+            view: The well rows (WellView)
             ax: current axis
             wcross: A pandas dataframe with precomputed well crossings
             names: Display the names of the crossed wells
@@ -683,20 +726,16 @@ class XSection(BasePlot):
             5: (-20, 40),
         }
 
-        for index, row in wcross.iterrows():
-            xcoord = row.X_UTME
-            ycoord = row.Y_UTMN
-
-            dfrc = dfr.copy()
+        xv = view["X_UTME"]
+        yv = view["Y_UTMN"]
+        hv = view["R_HLEN"]
 
-            dfrc["DLEN"] = pow(
-                pow(dfrc.X_UTME - xcoord, 2) + pow(dfrc.Y_UTMN - ycoord, 2), 0.5
-            )
-
-            minindx = dfrc.DLEN.idxmin()
+        for index, row in wcross.iterrows():
+            # the closest point on this well
+            hpos = hv[np.nanargmin(np.hypot(xv - row.X_UTME, yv - row.Y_UTMN))]
 
             ax.scatter(
-                dfrc.R_HLEN[minindx],
+                hpos,
                 row.Z_TVDSS,
                 marker="o",
                 color="black",
@@ -704,7 +743,7 @@ class XSection(BasePlot):
                 zorder=300,
             )
             ax.scatter(
-                dfrc.R_HLEN[minindx],
+                hpos,
                 row.Z_TVDSS,
                 marker="o",
                 color="orange",
@@ -725,7 +764,7 @@ class XSection(BasePlot):
                 ax.annotate(
                     text,
                     size=6,
-                    xy=(dfrc.R_HLEN[minindx], row.Z_TVDSS),
+                    xy=(hpos, row.Z_TVDSS),
                     xytext=placings[modulo],
                     textcoords="offset points",
                     arrowprops={
@@ -754,8 +793,15 @@ class XSection(BasePlot):
             handlelength=2,
         )
 
-    def _drawlegend(self, ax, bba, title=None):
+    def _drawlegend(self, ax, bba, title=None, proxies=None):
+        handles, labels = ax.get_legend_handles_labels()
+        if proxies:
+            handles += proxies
+            labels += [proxy.get_label() for proxy in proxies]
+
         leg = ax.legend(
+            handles,
+            labels,
             loc="upper left",
             bbox_to_anchor=bba,
             prop={"size": self._legendsize},
@@ -794,6 +840,7 @@ class XSection(BasePlot):
 
         return ax, bba
 
+    @drawmethod
     def plot_cube(
         self,
         colormap="seismic",
@@ -802,9 +849,15 @@ class XSection(BasePlot):
         alpha=0.7,
         interpolation="gaussian",
         sampling="nearest",
+        smoothing=None,
+        dtype="float32",
+        composite=False,
     ):
         """Plot a cube backdrop.
 
+        The sampled (and smoothed) sections are cached per cube, so plotting the
+        same well again does not sample the cube again.
+
         Args:
             colormap (ColorMap): Name of color map (default 'seismic')
             vmin (float): Minimum value in plot.
@@ -814,6 +867,15 @@ class XSection(BasePlot):
                 documentation on this. Also gaussianN is allowed, where
                 N = 1..9.
             sampling (str): 'nearest' (default) or 'trilinear' (more precise)
+            smoothing: Gaussian smoothing of the section, as sigma in cells, either
+                one value or a (trace, depth) pair. Overrides gaussianN.
+            dtype (str): Data type of the image, 'float32' (default), 'float64', or
+                'uint8' or 'uint16' to quantize the values between vmin and vmax.
+            composite: If True, or the dpi of the saved figure, the backdrop is
+                colored here and composited with the other composited backdrops
+                into one image, made at the pixel size of the plot. This is
+                faster to save, and smaller in vector formats. The image is
+                resampled as 'nearest', ignoring interpolation.
 
         Raises:
             ValueError: No cube is loaded
@@ -829,12 +891,20 @@ class XSection(BasePlot):
 
         zinc = self._cube.zinc / 2.0
 
-        zvv = self._cube.get_randomline(
+        sigma = _backdrop.gaussian_sigma(interpolation, smoothing)
+        if sigma is not None:
+            interpolation = "none"
+        elif "gaussian" in interpolation:  # gaussian without N, as in matplotlib
+            interpolation = "gaussian"
+
+        zvv = _backdrop.cube_section(
+            self._cube,
             self.fence,
             zmin=self._zmin,
             zmax=self._zmax,
             zincrement=zinc,
             sampling=sampling,
+            sigma=sigma,
         )
 
         h1, h2, v1, v2, arr = zvv
@@ -844,30 +914,24 @@ class XSection(BasePlot):
                 colormap = "seismic"
             self._colormap_cube = self.define_any_colormap(colormap)
 
-        if "gaussian" in interpolation:  # allow gaussian3 etc
-            nnv = interpolation[-1]
-            try:
-                nnv = int(nnv)
-                arr = scipy_gaussianfilter(arr, nnv)
-                interpolation = "none"
-            except ValueError:
-                interpolation = "gaussian"
+        arr, norm = _backdrop.backdrop_image(arr, dtype, vmin=vmin, vmax=vmax)
 
-        img = ax.imshow(
+        img, _ = self._plot_backdrop(
+            ax,
             arr,
+            (h1, h2, v2, v1),
             cmap=self._colormap_cube,
-            interpolation=interpolation,
-            vmin=vmin,
-            vmax=vmax,
-            extent=(h1, h2, v2, v1),
-            aspect="auto",
+            norm=norm or Normalize(vmin=vmin, vmax=vmax),
             alpha=alpha,
+            interpolation=interpolation,
+            composite=composite,
         )
 
         # steer this?
         if self._colorlegend_cube:
-            self._fig.colorbar(img, ax=ax)
+            self._backdrop_colorbar(ax, img, alpha)
 
+    @drawmethod
     def plot_grid3d(
         self,
         colormap="rainbow",
@@ -876,21 +940,36 @@ class XSection(BasePlot):
         alpha=0.7,
         zinc=0.5,
         interpolation="auto",
+        dtype="float32",
+        composite=False,
+        layer=None,
     ):
         """Plot a sampled grid with gridproperty backdrop.
 
+        With several grid properties, each is plotted as a layer, and one layer is
+        shown at a time, see show_grid_layer(). The cells along the fence are found
+        once for all the properties.
+
         Args:
             colormap (ColorMap): Name of color map (default 'rainbow')
-            vmin (float): Minimum value in plot.
-            vmax (float); Maximum value in plot
+            vmin (float): Minimum value in plot, or a dict of values per layer.
+            vmax (float); Maximum value in plot, or a dict of values per layer.
             alpha (float): Alpha blending number beween 0 and 1.
             zinc (float): Sampling vertically, default is 0.5
             interpolation (str): Interpolation for plotting, cf. matplotlib
                 documentation on this. "auto" uses "nearest" for discrete
                 parameters and "antialiased" for floats.
+            dtype (str): Data type of the image, 'float32' (default), 'float64', or
+                'uint8' or 'uint16' to quantize the values between vmin and vmax.
+            composite: If True, or the dpi of the saved figure, the backdrop is
+                colored here and composited with the other composited backdrops
+                into one image, made at the pixel size of the plot. This is
+                faster to save, and smaller in vector formats. The image is
+                resampled as 'nearest', ignoring interpolation.
+            layer (str): The name of the layer shown, default is the first.
 
         Raises:
-            ValueError: No grid or gridproperty is loaded
+            ValueError: No grid or gridproperty is loaded, or no such layer
 
         """
         if self.fence is None:
@@ -899,44 +978,137 @@ class XSection(BasePlot):
         if self._grid is None or self._gridproperty is None:
             raise ValueError("Ask for plot of grid, but no grid is loaded")
 
-        ax, _bba = self._currentax(axisname="main")
-
-        zvv = self._grid.get_randomline(
-            self.fence,
-            self._gridproperty,
-            zmin=self._zmin,
-            zmax=self._zmax,
-            zincrement=zinc,
-        )
+        if layer is None:
+            layer = self.grid_layers[0]
+        elif layer not in self._gridproperties:
+            raise ValueError(
+                f"No grid layer {layer}, the layers are {self.grid_layers}"
+            )
 
-        h1, h2, v1, v2, arr = zvv
+        ax, _bba = self._currentax(axisname="main")
 
         if self._colormap_grid is None:
             if colormap is None:
                 colormap = "rainbow"
             self._colormap_grid = self.define_any_colormap(colormap)
 
-        if interpolation == "auto":
-            if self._gridproperty.isdiscrete:
-                interpolation = "nearest"
-            else:
-                interpolation = "antialiased"
+        for name, gridproperty in self._gridproperties.items():
+            zvv = _backdrop.grid_section(
+                self._grid,
+                gridproperty,
+                self.fence,
+                zmin=self._zmin,
+                zmax=self._zmax,
+                zincrement=zinc,
+                dtype=np.float64 if dtype == "float64" else np.float32,
+            )
 
-        img = ax.imshow(
-            arr,
-            cmap=self._colormap_grid,
-            vmin=vmin,
-            vmax=vmax,
-            extent=(h1, h2, v2, v1),
-            aspect="auto",
-            alpha=alpha,
-            interpolation=interpolation,
-        )
+            h1, h2, v1, v2, arr = zvv
+
+            layerinterp = interpolation
+            if interpolation == "auto":
+                layerinterp = "nearest" if gridproperty.isdiscrete else "antialiased"
+
+            lvmin = vmin.get(name) if isinstance(vmin, dict) else vmin
+            lvmax = vmax.get(name) if isinstance(vmax, dict) else vmax
+            arr, norm = _backdrop.backdrop_image(arr, dtype, vmin=lvmin, vmax=lvmax)
+
+            self._gridlayers[name] = self._plot_backdrop(
+                ax,
+                arr,
+                (h1, h2, v2, v1),
+                cmap=self._colormap_grid,
+                norm=norm or Normalize(vmin=lvmin, vmax=lvmax),
+                alpha=alpha,
+                interpolation=layerinterp,
+                composite=composite,
+                visible=name == layer,
+            )
 
-        # steer this?
         if self._colorlegend_grid:
-            self._fig.colorbar(img, ax=ax)
+            self._gridcolorbar = self._backdrop_colorbar(
+                ax, self._gridlayers[layer][0], alpha
+            )
 
+    def show_grid_layer(self, name):
+        """Show the layer of a grid property, and hide the other grid layers.
+
+        The figure is then saved once per layer, e.g.::
+
+            xsect.plot_grid3d()
+            ...
+            for name in xsect.grid_layers:
+                xsect.show_grid_layer(name)
+                xsect.savefig(f"{name}.png", last=False)
+
+        Args:
+            name (str): The name of the layer, see grid_layers.
+
+        Raises:
+            ValueError: No such layer is plotted
+        """
+        if name not in self._gridlayers:
+            raise ValueError(f"No grid layer {name} is plotted")
+
+        for lname, (img, index) in self._gridlayers.items():
+            if index is None:
+                img.set_visible(lname == name)
+            else:
+                self._composite.composite.set_visible(index, lname == name)
+        if self._composite is not None:
+            self._composite.update_layers()
+
+        if self._gridcolorbar is not None:
+            alpha = self._gridcolorbar.alpha
+            self._gridcolorbar.remove()
+            self._gridcolorbar = self._backdrop_colorbar(
+                self._ax1["main"], self._gridlayers[name][0], alpha
+            )
+
+    def _plot_backdrop(
+        self, ax, arr, extent, cmap, norm, alpha, interpolation, composite, visible=True
+    ):
+        """Plot a cube or grid section as an image, or add it to the composite.
+
+        Returns:
+            The image, or a mappable for the composite layer, and the index of the
+            composite layer (None if not composited).
+        """
+        if not composite:
+            img = ax.imshow(
+                arr,
+                cmap=cmap,
+                norm=norm,
+                extent=extent,
+                aspect="auto",
+                alpha=alpha,
+                interpolation=interpolation,
+            )
+            img.set_visible(visible)
+            return img, None
+
+        if self._composite is None:
+            dpi = self._fig.dpi if composite is True else composite
+            bbox = ax.get_window_extent()
+            shape = [
+                max(round(size * dpi / self._fig.dpi), 1)
+                for size in (bbox.height, bbox.width)
+            ]
+            self._composite = _backdrop.CompositeImage(ax, _backdrop.Composite(shape))
+            ax.add_image(self._composite)
+
+        index = self._composite.composite.add(arr, extent, cmap, norm, alpha=alpha)
+        if not visible:
+            self._composite.composite.set_visible(index, False)
+        self._composite.update_layers()
+        return ScalarMappable(norm=norm, cmap=cmap), index
+
+    def _backdrop_colorbar(self, ax, img, alpha):
+        norm = img.norm
+        ticks = norm.colorbar_ticks() if hasattr(norm, "colorbar_ticks") else {}
+        return self._fig.colorbar(img, ax=ax, alpha=alpha, **ticks)
+
+    @drawmethod
     def plot_surfaces(
         self,
         fill=False,
@@ -952,7 +1124,12 @@ class XSection(BasePlot):
         axisname="main",
         gridlines=False,
     ):
-        """Input a surface list (ordered from top to base) , and plot them."""
+        """Input a surface list (ordered from top to base) , and plot them.
+
+        A colormap given here is only used for this call. With more surfaces than
+        colors in the colormap, the colors are cycled or resampled, see
+        get_any_colormap_as_table().
+        """
         if self.fence is None:
             return
 
@@ -969,10 +1146,13 @@ class XSection(BasePlot):
         if legendtitle is None:
             legendtitle = self._legendtitle
 
+        # the colormap is for this call only, the one of the instance is kept
         if colormap is None:
-            colormap = self._colormap
+            cmap = self._colormap
+        elif isinstance(colormap, Colormap):
+            cmap = colormap
         else:
-            self.define_colormap(colormap)
+            cmap = self.define_any_colormap(colormap)
 
         nlen = len(surfaces)
 
@@ -994,14 +1174,22 @@ class XSection(BasePlot):
 
             slegend = surfacenames
 
-        if nlen > self._colormap.N:
-            raise ValueError(
-                f"Too few colors in color table ({self._colormap.N}) "
-                f"vs number of surfaces ({nlen})"
+        if nlen > cmap.N:
+            logger.info(
+                "More surfaces (%s) than colors in color table (%s), the colors are "
+                "cycled or resampled",
+                nlen,
+                cmap.N,
             )
 
         # sample the horizon to the fence:
-        colortable = self.get_colormap_as_table()
+        colortable = self.get_any_colormap_as_table(cmap, nlen)
+        proxies = None
+        if fill:
+            proxies = self._fill_zones(
+                ax, surfaces, colortable, slegend, linewidth, linestyle
+            )
+
         for i in range(nlen):
             usecolor = colortable[i]
             if onecolor:
@@ -1028,27 +1216,12 @@ class XSection(BasePlot):
                     ax.plot(
                         hfence[:, 0], hfence[:, 1], linewidth=0.3 * linewidth, c=xcol
                     )
-            else:
-                # need copy() .. why?? found by debugging...
-                hfence1 = surfaces[i].get_randomline(self.fence).copy()
-                x1 = hfence1[:, 0]
-                y1 = hfence1[:, 1]
-                if i < (nlen - 1):
-                    hfence2 = surfaces[i + 1].get_randomline(self.fence).copy()
-                    y2 = hfence2[:, 1]
-                else:
-                    y2 = y1.copy()
-
-                ax.plot(
-                    x1, y1, linewidth=0.1 * linewidth, linestyle=linestyle, c="black"
-                )
-                ax.fill_between(x1, y1, y2, facecolor=colortable[i], label=slegend[i])
 
         # invert min,max to invert the Y axis
         ax.set_ylim([self._zmax, self._zmin])
 
         if legend:
-            self._drawlegend(ax, bba, title=legendtitle)
+            self._drawlegend(ax, bba, title=legendtitle, proxies=proxies)
 
         if axisname != "main":
             ax.set_yticklabels([])
@@ -1058,6 +1231,44 @@ class XSection(BasePlot):
         if axisname == "main" and gridlines:
             ax.grid(color="grey", linewidth=0.2)
 
+    def _fill_zones(self, ax, surfaces, colors, names, linewidth, linestyle):
+        """Fill the zones between the surfaces, and draw the surfaces as thin lines.
+
+        The zones are one collection of polygons, and the lines one collection, so
+        the number of artists does not grow with the number of zones. The zone below
+        the last surface has no thickness, and is only in the legend.
+
+        Returns:
+            The legend proxies of the zones.
+        """
+        lines = [surf.get_randomline(self.fence) for surf in surfaces]
+        hlen = np.asarray(lines[0][:, 0], dtype=np.float64)
+        depths = np.array([line[:, 1] for line in lines], dtype=np.float64)
+
+        polygons, zones = _overlay.fill_polygons(hlen, depths)
+        colors = np.asarray(colors)
+        ax.add_collection(
+            mc.PolyCollection(
+                polygons, facecolors=colors[zones], edgecolors="none", linewidths=0
+            )
+        )
+        ax.add_collection(
+            mc.LineCollection(
+                [np.column_stack((hlen, depth)) for depth in depths],
+                linewidths=0.1 * linewidth,
+                linestyles=linestyle,
+                colors="black",
+                capstyle="projecting",
+            )
+        )
+        ax.autoscale_view()
+
+        return [
+            Patch(facecolor=color, edgecolor="none", linewidth=0, label=name)
+            for color, name in zip(colors, names)
+        ]
+
+    @drawmethod
     def plot_md_data(
         self,
         data=None,
@@ -1077,12 +1288,11 @@ class XSection(BasePlot):
         """
         ax, _ = self._currentax(axisname="main")
 
-        well = self._well
         data_well = data.copy()
-        data_well = data_well.loc[data_well["WELL"] == well.xwellname]
+        data_well = data_well.loc[data_well["WELL"] == self._well.xwellname]
         del data_well["WELL"]
 
-        md_start = well.get_dataframe(copy=False)["MDEPTH"].iloc[0]
+        md_start = self._get_wellview()["MDEPTH"][0]
         data_well["R_HLEN"] = data_well["MDEPTH"]
         data_well["R_HLEN"] = data_well["R_HLEN"].subtract(md_start)
 
@@ -1099,12 +1309,14 @@ class XSection(BasePlot):
             **kwargs,
         )
 
+    @drawmethod
     def plot_wellmap(self, otherwells=None, expand=1):
         """Plot well map as local view, optionally with nearby wells.
 
         Args:
-            otherwells (list of Polygons): List of surrounding wells to plot,
-                these wells are repr as Polygons instances, one per well.
+            otherwells (list): Surrounding wells to plot, as a list of Polygons
+                instances (one per well), or of Well instances, or a Wells
+                instance. This well is skipped, if included.
             expand (float): Plot axis expand factor (default is 1); larger
                 values may be used if other wells are plotted.
 
@@ -1113,10 +1325,10 @@ class XSection(BasePlot):
         ax = self._ax2
 
         if self.fence is not None:
-            xwellarray = self._well.get_dataframe(copy=False)["X_UTME"].values
-            ywellarray = self._well.get_dataframe(copy=False)["Y_UTMN"].values
+            xwellarray = self._get_wellview()["X_UTME"]
+            ywellarray = self._get_wellview()["Y_UTMN"]
 
-            ax.plot(xwellarray, ywellarray, linewidth=4, c="cyan")
+            (wline,) = ax.plot(xwellarray, ywellarray, linewidth=4, c="cyan")
 
             ax.plot(self.fence[:, 0], self.fence[:, 1], linewidth=1, c="black")
             ax.annotate("A", xy=(self.fence[0, 0], self.fence[0, 1]), fontsize=8)
@@ -1130,21 +1342,85 @@ class XSection(BasePlot):
 
             ax.set_xlim(left - (expand - 1.0) * xdiff, right + (expand - 1.0) * xdiff)
             ax.set_ylim(bottom - (expand - 1.0) * ydiff, top + (expand - 1.0) * ydiff)
+
+            if self._simplify:
+                # simplify when the view is known; the view is kept as is
+                idx = self._simplified_index(
+                    ax, np.column_stack((xwellarray, ywellarray))
+                )
+                wline.set_data(xwellarray[idx], ywellarray[idx])
+
         if otherwells:
-            for poly in otherwells:
-                if not isinstance(poly, xtgeo.Polygons):
-                    warnings.warn(
-                        f"<otherw> not a Polygons instance, but a {type(poly)}",
-                        UserWarning,
-                    )
-                    continue
-                if poly.name == self._well.xwellname:
-                    continue
-                xwp = poly.get_dataframe(copy=False)[poly.xname].values
-                ywp = poly.get_dataframe(copy=False)[poly.yname].values
-                ax.plot(xwp, ywp, linewidth=1, c="grey")
-                ax.annotate(poly.name, xy=(xwp[-1], ywp[-1]), color="grey", size=5)
+            names, paths, ends, bboxes = self._otherwell_paths(otherwells)
+
+            if not paths:
+                return
+
+            labels = np.arange(len(paths))
+            if self.fence is not None:
+                # the view is given by this well, so skip what is outside
+                extent = _overlay.axes_extent(ax)
+                labels = np.flatnonzero(_overlay.visible_points(*ends.T, extent))
+                paths, _ = _overlay.cull_parts(paths, extent, bboxes=bboxes, clip=True)
+                paths = self._simplified(ax, paths)
+
+            ax.add_collection(
+                mc.LineCollection(paths, linewidths=1, colors="grey"),
+                autolim=self.fence is None,
+            )
+            if self.fence is None:
+                ax.autoscale_view()
+
+            for idx in labels:
+                ax.annotate(names[idx], xy=tuple(ends[idx]), color="grey", size=5)
+
+    def _otherwell_paths(self, otherwells):
+        """Return names, XY paths, last points and bounding boxes of other wells.
 
+        Wells are packed in one array (reused for a series of plots of the same
+        wells), while polygons are taken one by one. The bounding boxes are None
+        for polygons.
+        """
+        if isinstance(otherwells, xtgeo.Wells):
+            otherwells = otherwells.wells
+
+        if all(isinstance(well, xtgeo.Well) for well in otherwells):
+            packed = _wellstore.packed_wells(otherwells)
+            index = [
+                idx
+                for idx, name in enumerate(packed.names)
+                if name != self._well.xwellname
+            ]
+            return (
+                [packed.names[idx] for idx in index],
+                packed.parts(index),
+                packed.ends[index],
+                packed.bboxes[index],
+            )
+
+        names = []
+        paths = []
+        for poly in otherwells:
+            if not isinstance(poly, xtgeo.Polygons):
+                warnings.warn(
+                    f"<otherw> not a Polygons instance, but a {type(poly)}",
+                    UserWarning,
+                )
+                continue
+            if poly.name == self._well.xwellname:
+                continue
+            dfr = poly.get_dataframe(copy=False)
+            if dfr.empty:
+                continue
+            names.append(poly.name)
+            paths.append(
+                np.column_stack((dfr[poly.xname].values, dfr[poly.yname].values))
+            )
+
+        ends = np.array([path[-1] for path in paths]).reshape(-1, 2)
+        return names, paths, ends, None
+
+    @drawmethod
     def plot_map(self):
         """Plot well location map as an overall view (with field outline)."""
         if self.fence is None:
@@ -1154,17 +1430,36 @@ class XSection(BasePlot):
             return
 
         ax = self._ax3
-        if self.fence is not None:
-            xp = self._outline.get_dataframe(copy=False)["X_UTME"].values
-            yp = self._outline.get_dataframe(copy=False)["Y_UTMN"].values
-            ip = self._outline.get_dataframe(copy=False)["POLY_ID"].values
+        dfr = self._outline.get_dataframe(copy=False)
+        outlines, _ = _overlay.split_parts(
+            dfr["POLY_ID"].values, dfr["X_UTME"].values, dfr["Y_UTMN"].values
+        )
 
-            ax.plot(self._fence[:, 0], self._fence[:, 1], linewidth=3, c="red")
+        ax.plot(self._fence[:, 0], self._fence[:, 1], linewidth=3, c="red")
 
-            for i in range(int(ip.min()), int(ip.max()) + 1):
-                xpc = xp.copy()[ip == i]
-                ypc = yp.copy()[ip == i]
-                if len(xpc) > 1:
-                    ax.plot(xpc, ypc, linewidth=0.3, c="black")
+        outlines = [part for part in outlines if len(part) > 1]
+        lcoll = mc.LineCollection(outlines, linewidths=0.3, colors="black")
+        ax.add_collection(lcoll)
+        ax.autoscale_view()
+        ax.set_aspect("equal", "datalim")
 
-            ax.set_aspect("equal", "datalim")
+        if self._simplify:
+            # the overview is given by the outline, so simplify when it is set
+            lcoll.set_segments(self._simplified(ax, outlines))
+
+
+def _grid_properties(gridproperty) -> dict:
+    """The grid properties as a dict by name, from one, a list or a dict."""
+    if gridproperty is None:
+        return {}
+    if isinstance(gridproperty, dict):
+        return dict(gridproperty)
+    if not isinstance(gridproperty, (list, tuple)):
+        gridproperty = [gridproperty]
+
+    properties = {prop.name: prop for prop in gridproperty}
+    if len(properties) < len(gridproperty):
+        raise ValueError(
+            "The grid properties must have different names, or be given as a dict"
+        )
+    return properties
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import logging
 
-import matplotlib.patches as mplp
 import matplotlib.pyplot as plt
 import numpy as np
 import numpy.ma as ma
 from matplotlib import ticker
+from matplotlib.collections import LineCollection, PolyCollection
 
-from .baseplot import BasePlot
+from . import _overlay, _wellstore
+from .baseplot import BasePlot, drawmethod
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,7 @@ class Map(BasePlot):
     # Functions methods (public)
     # =========================================================================
 
+    @drawmethod
     def plot_surface(
         self,
         surf,
@@ -148,6 +150,7 @@ class Map(BasePlot):
         plt.gca().set_aspect("equal", adjustable="box")
         self.colormap = keepcolor
 
+    @drawmethod
     def plot_faults(
         self,
         fpoly,
@@ -156,9 +159,13 @@ class Map(BasePlot):
         edgecolor="k",
         alpha=0.7,
         linewidth=0.8,
+        cull=False,
     ):
         """Plot the faults.
 
+        All faults are drawn as one collection, which is much faster than one
+        polygon artist per fault when there are many faults.
+
         Args:
             fpoly (object): A XTGeo Polygons object
             idname (str): Name of column which has the faults ID
@@ -166,49 +173,75 @@ class Map(BasePlot):
             edgecolor (c): Edge color according to Matplotlib_
             alpha (float): Degree of opacity
             linewidth (float): Line width
+            cull (bool): If True, faults outside the current map extent are skipped.
 
         .. _Matplotlib: http://matplotlib.org/api/colors_api.html
         """
-        aff = fpoly.get_dataframe(copy=False).groupby(idname)
+        dfr = fpoly.get_dataframe(copy=False)
 
-        for name, _group in aff:
-            # make a dataframe sorted on faults (groupname)
-            myfault = aff.get_group(name)
+        faults, bboxes = _overlay.split_parts(
+            dfr[idname].values, dfr["X_UTME"].values, dfr["Y_UTMN"].values
+        )
 
-            # make a list [(X,Y) ...];
-            af = list(zip(myfault["X_UTME"].values, myfault["Y_UTMN"].values))
+        if cull:
+            extent = _overlay.axes_extent(self._ax)
+            faults, _ = _overlay.cull_parts(faults, extent, bboxes=bboxes)
 
-            px = mplp.Polygon(af, alpha=alpha, color=color, ec=edgecolor, lw=linewidth)
+        faults = self._simplified(self._ax, faults)
 
-            if px.get_closed():
-                self._ax.add_artist(px)
-            else:
-                IOError(f"A polygon is not closed: {px}")
+        px = PolyCollection(
+            faults,
+            closed=True,
+            facecolors=color,
+            edgecolors=edgecolor,
+            linewidths=linewidth,
+            alpha=alpha,
+        )
+        self._ax.add_collection(px, autolim=False)
 
-    def plot_polygons(self, fpoly, idname="POLY_ID", color="k", linewidth=0.8):
+    @drawmethod
+    def plot_polygons(
+        self, fpoly, idname="POLY_ID", color="k", linewidth=0.8, cull=False, clip=False
+    ):
         """Plot a polygons instance.
 
+        All polygons are drawn as one line collection, with one legend entry.
+
         Args:
             fpoly (object): A XTGeo Polygons object
             idname (str): Name of column which has the faults ID
             color (c): Line color model c according to Matplotlib_
             linewidth (float): Line width
+            cull (bool): If True, polygons outside the current map extent are
+                skipped, and the map extent is kept as is.
+            clip (bool): If True, also skip the parts of polygons outside the
+                current map extent. Implies cull.
 
         .. _Matplotlib: http://matplotlib.org/api/colors_api.html
         """
-        aff = fpoly.get_dataframe(copy=False).groupby(idname)
+        dfr = fpoly.get_dataframe(copy=False)
 
-        for _name, group in aff:
-            # make a dataframe sorted on groupname
-            pname = fpoly.name
+        lines, bboxes = _overlay.split_parts(
+            dfr[idname].values, dfr[fpoly.xname].values, dfr[fpoly.yname].values
+        )
+
+        cull = cull or clip
+        if cull:
+            extent = _overlay.axes_extent(self._ax)
+            lines, _ = _overlay.cull_parts(lines, extent, bboxes=bboxes, clip=clip)
 
-            xarr = group[fpoly.xname].values
-            yarr = group[fpoly.yname].values
+        lines = self._simplified(self._ax, lines)
 
-            self._ax.plot(xarr, yarr, label=pname, lw=linewidth, color=color)
-            self._ax.legend()
+        lcoll = LineCollection(
+            lines, colors=color, linewidths=linewidth, label=fpoly.name
+        )
+        self._ax.add_collection(lcoll, autolim=not cull)
+        if not cull:
+            self._ax.autoscale_view()
+        self._ax.legend()
 
-    def plot_points(self, points):
+    @drawmethod
+    def plot_points(self, points, cull=False):
         """Plot a points set on the map.
 
         This can be be useful e.g. for plotting the underlying point set
@@ -216,28 +249,189 @@ class Map(BasePlot):
 
         Args:
             points (Points): A XTGeo Points object X Y VALUE
+            cull (bool): If True, points outside the current map extent are
+                skipped, and the map extent is kept as is.
 
         """
         # This function is "in prep"
 
         dataframe = points.get_dataframe(copy=False)
 
-        self._ax.scatter(
-            dataframe["X_UTME"].values, dataframe["Y_UTMN"].values, marker="x"
-        )
+        xval = dataframe["X_UTME"].values
+        yval = dataframe["Y_UTMN"].values
+
+        if cull:
+            extent = _overlay.axes_extent(self._ax)
+            inside = _overlay.visible_points(xval, yval, extent)
+            xval = xval[inside]
+            yval = yval[inside]
 
-    def plot_wells(self, wells):
+        self._ax.scatter(xval, yval, marker="x")
+
+        if cull:
+            self._ax.set_xlim(extent[:2])
+            self._ax.set_ylim(extent[2:])
+
+    @drawmethod
+    def plot_wells(self, wells, labelspacing=None, cull=False, clip=False):
         """Plot wells on the map.
 
+        All well paths are drawn as one line collection, colored by the color
+        cycle (axes.prop_cycle), continued after the lines of the axes.
+
         Args:
             wells (Wells): A XTGeo Wells object (contains a number of Well
                 instances).
+            labelspacing (float): Minimum distance (in points) between well
+                name labels; labels closer than this are skipped. Default is
+                None, which labels all wells.
+            cull (bool): If True, wells outside the current map extent are
+                skipped, and the map extent is kept as is.
+            clip (bool): If True, also skip the parts of well paths outside the
+                current map extent. Implies cull.
 
         """
-        for well in wells.wells:
-            dataframe = well.get_dataframe(copy=False)
+        if not wells.wells:
+            return
+
+        packed = _wellstore.packed_wells(wells.wells)
+        paths = packed.parts()
+        ends = packed.ends
+
+        # continue the color cycle after the lines of the axes, as one plot() call
+        # per well would
+        cycle = plt.rcParams["axes.prop_cycle"].by_key().get("color", ["C0"])
+        offset = len(self._ax.lines)
+        colors = [cycle[(offset + idx) % len(cycle)] for idx in range(len(paths))]
+        keep = np.arange(len(paths))
+
+        cull = cull or clip
+        if cull:
+            extent = _overlay.axes_extent(self._ax)
+            pieces, index = _overlay.cull_parts(
+                paths, extent, bboxes=packed.bboxes, clip=clip
+            )
+            colors = [colors[idx] for idx in index]
+            keep = np.flatnonzero(_overlay.visible_points(*ends.T, extent))
+            paths = pieces
+
+        paths = self._simplified(self._ax, paths)
+
+        self._ax.add_collection(LineCollection(paths, colors=colors), autolim=not cull)
+        if not cull:
+            self._ax.autoscale_view()
+
+        if labelspacing and len(keep) > 1:
+            self._ax.apply_aspect()
+            pixels = self._ax.transData.transform(ends[keep])
+            mindist = labelspacing * self._fig.dpi / 72
+            keep = keep[_overlay.decimate_labels(pixels, mindist)]
+
+        for idx in keep:
+            self._ax.annotate(wells.wells[idx].name, xy=tuple(ends[idx]))
+
+    @drawmethod
+    def animate_surfaces(
+        self,
+        surfaces,
+        filename,
+        minvalue=None,
+        maxvalue=None,
+        colormap=None,
+        labels=None,
+        fps=5,
+        dpi=None,
+    ):
+        """Write an animation (e.g. time-lapse) of surfaces sharing one geometry.
+
+        The map image is made once from the first surface, and only the values
+        are replaced for the next frames. Use canvas() first to get title etc.
+
+        Args:
+            surfaces (list): List of XTGeo RegularSurface objects, same topology.
+            filename (str): Output file, typically .mp4 or .gif. If ffmpeg is
+                not present, a .gif will be made instead.
+            minvalue (float): Minimum level color scale (default: from all data)
+            maxvalue (float): Maximum level color scale (default: from all data)
+            colormap: Color map to use, e.g. 'rainbow' or an rmscol file
+            labels (list of str): Frame labels, default is surface names.
+            fps (int): Frames per second.
+            dpi (float): Resolution, default is the figure resolution.
+
+        Returns:
+            The file name actually written.
+        """
+        if not surfaces:
+            raise ValueError("No surfaces to animate")
+
+        first = surfaces[0]
+        for surf in surfaces[1:]:
+            if not first.compare_topology(surf, strict=False):
+                raise ValueError(f"Surface <{surf.name}> differs in topology")
+
+        if self._fig is None:
+            self.canvas()
+
+        if labels is None:
+            labels = [surf.name for surf in surfaces]
+
+        if minvalue is None:
+            minvalue = min(surf.values.min() for surf in surfaces)
+        if maxvalue is None:
+            maxvalue = max(surf.values.max() for surf in surfaces)
+
+        cmap = self.colormap if colormap is None else self.define_any_colormap(colormap)
+
+        if abs(first.rotation) > 0.001:
+            # geometry is made once, values are updated on the mesh per frame
+            xi, yi = first.get_xy_values(asmasked=False)
+            im = self._ax.pcolormesh(
+                xi,
+                yi,
+                first.values,
+                cmap=cmap,
+                vmin=minvalue,
+                vmax=maxvalue,
+                shading="nearest",
+            )
+
+            def _frame_values(surf):
+                return surf.values
+
+            update_data = im.set_array
+        else:
+            xmin = first.xori - 0.5 * first.xinc
+            xmax = first.xori + (first.ncol - 0.5) * first.xinc
+            if first.yflip > 0:
+                ymin = first.yori - 0.5 * first.yinc
+                ymax = first.yori + (first.nrow - 0.5) * first.yinc
+            else:
+                ymin = first.yori - (first.nrow - 0.5) * first.yinc
+                ymax = first.yori + 0.5 * first.yinc
+
+            def _frame_values(surf):
+                # values are (ncol, nrow) with rows along increasing y for yflip 1
+                return surf.values.T if surf.yflip > 0 else surf.values.T[::-1, :]
+
+            im = self._ax.imshow(
+                _frame_values(first),
+                cmap=cmap,
+                vmin=minvalue,
+                vmax=maxvalue,
+                origin="lower",
+                extent=(xmin, xmax, ymin, ymax),
+                interpolation="nearest",
+            )
+            update_data = im.set_data
+
+        self._fig.colorbar(im)
+        self._ax.set_aspect("equal", adjustable="box")
+        label = self._ax.text(
+            0.02, 0.98, "", transform=self._ax.transAxes, ha="left", va="top"
+        )
+
+        def _update(frame):
+            update_data(_frame_values(surfaces[frame]))
+            label.set_text(labels[frame])
 
-            xval = dataframe["X_UTME"].values
-            yval = dataframe["Y_UTMN"].values
-            self._ax.plot(xval, yval)
-            self._ax.annotate(well.name, xy=(xval[-1], yval[-1]))
+        return self._save_animation(_update, len(surfaces), filename, fps=fps, dpi=dpi)
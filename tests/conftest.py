@@ -1,7 +1,10 @@
 import os
 import pathlib
 
+import numpy as np
+import pandas as pd
 import pytest
+import xtgeo
 
 
 def pytest_configure(config):
@@ -27,6 +30,15 @@ def pytest_addoption(parser):
         action="store_true",
         default=False,
     )
+    parser.addoption(
+        "--bench-scale",
+        help="size of the synthetic data in tests/test_benchmarks: 'small' (default, "
+        "quick), 'medium', or 'large' which mirrors the largest production cases "
+        "and needs several GB of memory.",
+        action="store",
+        choices=("small", "medium", "large"),
+        default="small",
+    )
 
 
 @pytest.fixture(name="generate_plot")
@@ -50,3 +62,37 @@ def fixure_testdir():
     relative_path_default = "../xtgeo-testdata"
 
     return pathlib.Path(os.environ.get("XTGEO_TESTDIR", relative_path_default))
+
+
+def _make_well(xval, yval, zval, name="W", mdval=None, logs=None, **kwargs):
+    """A synthetic well along the given coordinates, where x and y may be scalars.
+
+    Args:
+        mdval: The MDEPTH log, or True to use zval as measured depth.
+        logs: More logs, as a dict of log name and values.
+        kwargs: Given to xtgeo.Well, e.g. zonelogname, wlogtypes and wlogrecords.
+    """
+    zval = np.asarray(zval, dtype=np.float64)
+    columns = {
+        "X_UTME": np.broadcast_to(xval, zval.shape).astype(np.float64),
+        "Y_UTMN": np.broadcast_to(yval, zval.shape).astype(np.float64),
+        "Z_TVDSS": zval,
+    }
+    if mdval is not None:
+        columns["MDEPTH"] = zval if mdval is True else np.asarray(mdval)
+    columns.update(logs or {})
+
+    return xtgeo.Well(
+        rkb=0,
+        xpos=columns["X_UTME"][0],
+        ypos=columns["Y_UTMN"][0],
+        wname=name,
+        df=pd.DataFrame(columns),
+        **kwargs,
+    )
+
+
+@pytest.fixture(name="make_well", scope="session")
+def fixture_make_well():
+    """Factory for synthetic wells: make_well(xval, yval, zval, name="W", ...)."""
+    return _make_well
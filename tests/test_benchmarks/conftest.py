@@ -0,0 +1,221 @@
+"""Synthetic data for the benchmarks, made in memory at a selectable scale.
+
+The scale is given with ``pytest --bench-scale=small|medium|large``; 'small' is
+quick enough for CI, while 'large' mirrors the largest production cases.
+"""
+
+import tracemalloc
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+import xtgeo
+
+SCALES = {
+    "small": {
+        "well_samples": 1_000,
+        "nwells": 3,
+        "surface_nodes": 100,
+        "cube_nodes": (50, 50, 100),
+        "grid_cells": (20, 20, 10),
+        "polygon_vertices": 1_000,
+    },
+    "medium": {
+        "well_samples": 100_000,
+        "nwells": 10,
+        "surface_nodes": 1_000,
+        "cube_nodes": (200, 200, 400),
+        "grid_cells": (100, 100, 50),
+        "polygon_vertices": 100_000,
+    },
+    "large": {
+        "well_samples": 1_000_000,
+        "nwells": 30,
+        "surface_nodes": 10_000,
+        "cube_nodes": (400, 400, 1000),
+        "grid_cells": (250, 250, 100),
+        "polygon_vertices": 1_000_000,
+    },
+}
+
+# the synthetic field, in meters
+FIELD_ORIGIN = (460000.0, 5930000.0)
+FIELD_SIZE = 5000.0
+TOP_DEPTH = 1500.0
+NSURFACES = 4
+SURFACE_SPACING = 50.0
+
+
+def make_field_well(make_well, name, nsamples, seed=0):
+    """A deviated well through the field, with zone and facies logs."""
+    rng = np.random.default_rng(seed)
+    tval = np.linspace(0.0, 1.0, nsamples)
+
+    azimuth = rng.uniform(0, 2 * np.pi)
+    xstart, ystart = rng.uniform(0.2, 0.8, 2) * FIELD_SIZE + FIELD_ORIGIN
+    reach = 0.3 * FIELD_SIZE * tval**2
+
+    xval = xstart + reach * np.cos(azimuth)
+    yval = ystart + reach * np.sin(azimuth)
+    zval = 1000.0 + 800.0 * tval
+    steps = np.sqrt(np.diff(xval) ** 2 + np.diff(yval) ** 2 + np.diff(zval) ** 2)
+    mdval = np.concatenate(([0.0], np.cumsum(steps)))
+
+    zone = np.clip((zval - TOP_DEPTH) // SURFACE_SPACING + 1, 0, NSURFACES)
+    facies = np.floor(tval * nsamples / 50) % 3
+
+    return make_well(
+        xval,
+        yval,
+        zval,
+        name=name,
+        mdval=mdval,
+        logs={"ZONELOG": zone, "FACIES": facies},
+        mdlogname="MDEPTH",
+        zonelogname="ZONELOG",
+        wlogtypes={"ZONELOG": "DISC", "FACIES": "DISC", "MDEPTH": "CONT"},
+        wlogrecords={
+            "ZONELOG": {izn: f"Zone{izn}" for izn in range(NSURFACES + 1)},
+            "FACIES": {0: "Shale", 1: "Sand", 2: "Coal"},
+            "MDEPTH": None,
+        },
+    )
+
+
+def make_surface(nodes, depth, name="Surface"):
+    """A smooth, undulating depth surface covering the field."""
+    inc = FIELD_SIZE / (nodes - 1)
+    xcoord = np.linspace(0.0, 2 * np.pi, nodes)
+    values = depth + 20.0 * np.outer(np.sin(2 * xcoord), np.cos(3 * xcoord))
+
+    surf = xtgeo.RegularSurface(
+        ncol=nodes,
+        nrow=nodes,
+        xori=FIELD_ORIGIN[0],
+        yori=FIELD_ORIGIN[1],
+        xinc=inc,
+        yinc=inc,
+        values=values,
+    )
+    surf.name = name
+    return surf
+
+
+def make_polygons(nvertices, npolygons=20):
+    """Closed, wiggly polygons (e.g. faults or outlines) spread over the field."""
+    per_polygon = max(nvertices // npolygons, 4)
+    angle = np.linspace(0.0, 2 * np.pi, per_polygon)
+    radius = 0.04 * FIELD_SIZE * (1.0 + 0.2 * np.sin(25 * angle))
+
+    frames = []
+    for ipol in range(npolygons):
+        xcenter = FIELD_ORIGIN[0] + (ipol % 5 + 0.5) * FIELD_SIZE / 5
+        ycenter = FIELD_ORIGIN[1] + (ipol // 5 + 0.5) * FIELD_SIZE / 4
+        frames.append(
+            pd.DataFrame(
+                {
+                    "X_UTME": xcenter + radius * np.cos(angle),
+                    "Y_UTMN": ycenter + radius * np.sin(angle),
+                    "Z_TVDSS": TOP_DEPTH,
+                    "POLY_ID": ipol,
+                }
+            )
+        )
+    return xtgeo.Polygons(pd.concat(frames, ignore_index=True))
+
+
+@pytest.fixture(name="scale", scope="session")
+def fixture_scale(request):
+    """The sizes of the synthetic data."""
+    return SCALES[request.config.getoption("--bench-scale")]
+
+
+@pytest.fixture(name="wells", scope="session")
+def fixture_wells(scale, make_well):
+    return [
+        make_field_well(make_well, f"W{iwell}", scale["well_samples"], seed=iwell)
+        for iwell in range(scale["nwells"])
+    ]
+
+
+@pytest.fixture(name="surfaces", scope="session")
+def fixture_surfaces(scale):
+    return [
+        make_surface(
+            scale["surface_nodes"], TOP_DEPTH + isrf * SURFACE_SPACING, f"S{isrf}"
+        )
+        for isrf in range(NSURFACES)
+    ]
+
+
+@pytest.fixture(name="cube", scope="session")
+def fixture_cube(scale):
+    ncol, nrow, nlay = scale["cube_nodes"]
+    rng = np.random.default_rng(1)
+    return xtgeo.Cube(
+        ncol=ncol,
+        nrow=nrow,
+        nlay=nlay,
+        xori=FIELD_ORIGIN[0],
+        yori=FIELD_ORIGIN[1],
+        zori=1000.0,
+        xinc=FIELD_SIZE / ncol,
+        yinc=FIELD_SIZE / nrow,
+        zinc=1000.0 / nlay,
+        values=rng.standard_normal((ncol, nrow, nlay), dtype=np.float32),
+    )
+
+
+@pytest.fixture(name="grid", scope="session")
+def fixture_grid(scale):
+    """A box grid over the field, with a porosity property."""
+    ncol, nrow, nlay = scale["grid_cells"]
+    grid = xtgeo.create_box_grid(
+        (ncol, nrow, nlay),
+        origin=(*FIELD_ORIGIN, TOP_DEPTH - 50.0),
+        increment=(FIELD_SIZE / ncol, FIELD_SIZE / nrow, 300.0 / nlay),
+    )
+    rng = np.random.default_rng(2)
+    poro = xtgeo.GridProperty(
+        grid, name="PORO", values=rng.uniform(0.05, 0.35, (ncol, nrow, nlay))
+    )
+    return grid, poro
+
+
+@pytest.fixture(name="polygons", scope="session")
+def fixture_polygons(scale):
+    return make_polygons(scale["polygon_vertices"])
+
+
+@pytest.fixture(name="measure")
+def fixture_measure(benchmark):
+    """Time a function with pytest-benchmark, and record its peak memory.
+
+    The function is called with the result of setup() (if given) as its single
+    argument, so that e.g. a fresh figure can be made outside the timing. The
+    peak memory of one extra call, traced by tracemalloc, is stored as
+    'peak_memory_mb' in the benchmark's extra_info, so it is saved and compared
+    along with the timings.
+    """
+
+    def _measure(func, setup=None, rounds=3):
+        def _prepare():
+            return ((setup(),), {}) if setup else None
+
+        args = (setup(),) if setup else ()
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            plt.close("all")
+        benchmark.extra_info["peak_memory_mb"] = round(peak / 1e6, 2)
+
+        try:
+            return benchmark.pedantic(func, setup=_prepare, rounds=rounds)
+        finally:
+            plt.close("all")
+
+    return _measure
@@ -0,0 +1,25 @@
+"""Benchmarks for Grid3DSlice, on synthetic data."""
+
+import pytest
+
+from xtgeoviz.plot import Grid3DSlice
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_bench_grid3dslice_layer(measure, grid):
+    mygrid, poro = grid
+
+    def _setup():
+        layslice = Grid3DSlice()
+        layslice.canvas(title="Benchmark")
+        return layslice
+
+    measure(
+        lambda layslice: layslice.plot_gridslice(
+            mygrid, prop=poro, mode="layer", index=mygrid.nlay // 2
+        ),
+        setup=_setup,
+    )
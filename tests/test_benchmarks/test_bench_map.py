@@ -0,0 +1,49 @@
+"""Benchmarks for Map, incl. overlays, and quickplot, on synthetic data."""
+
+import pytest
+import xtgeo
+
+from xtgeoviz.plot import Map
+from xtgeoviz.plot.quickplot import quickplot
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+
+def _map_with_surface(surface):
+    mymap = Map()
+    mymap.canvas(title="Benchmark")
+    mymap.plot_surface(surface)
+    return mymap
+
+
+def test_bench_map_plot_surface(measure, surfaces):
+    def _setup():
+        mymap = Map()
+        mymap.canvas(title="Benchmark")
+        return mymap
+
+    measure(lambda mymap: mymap.plot_surface(surfaces[0]), setup=_setup)
+
+
+@pytest.mark.parametrize("overlay", ["plot_faults", "plot_polygons"])
+def test_bench_map_plot_overlay(measure, surfaces, polygons, overlay):
+    measure(
+        lambda mymap: getattr(mymap, overlay)(polygons),
+        setup=lambda: _map_with_surface(surfaces[0]),
+    )
+
+
+def test_bench_map_plot_wells(measure, surfaces, wells):
+    measure(
+        lambda mymap: mymap.plot_wells(xtgeo.Wells(wells)),
+        setup=lambda: _map_with_surface(surfaces[0]),
+    )
+
+
+def test_bench_quickplot(measure, surfaces, tmp_path):
+    measure(
+        lambda _: quickplot(surfaces[0], filename=tmp_path / "quick.png"),
+        setup=lambda: None,
+    )
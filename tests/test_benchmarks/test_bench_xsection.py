@@ -0,0 +1,102 @@
+"""Benchmarks for the XSection plot methods, on synthetic data."""
+
+import pytest
+import xtgeo
+
+from xtgeoviz.plot import XSection, _backdrop
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+ZMIN, ZMAX = 1000, 1900
+
+PLOT_METHODS = {
+    "plot_cube": lambda xsect, _: xsect.plot_cube(),
+    "plot_grid3d": lambda xsect, _: xsect.plot_grid3d(),
+    "plot_surfaces": lambda xsect, _: xsect.plot_surfaces(fill=True),
+    "plot_well": lambda xsect, _: xsect.plot_well(
+        zonelogname="ZONELOG", facieslogname="FACIES"
+    ),
+    "plot_map": lambda xsect, _: xsect.plot_map(),
+    "plot_wellmap": lambda xsect, others: xsect.plot_wellmap(
+        otherwells=others, expand=2
+    ),
+}
+
+
+@pytest.fixture(name="otherwells")
+def fixture_otherwells(wells):
+    """The other wells, as Polygons as in the xsectplot frontend."""
+    return [
+        xtgeo.Polygons(
+            well.get_dataframe()[["X_UTME", "Y_UTMN", "Z_TVDSS"]].assign(POLY_ID=0),
+            name=well.name,
+        )
+        for well in wells[1:]
+    ]
+
+
+@pytest.fixture(name="make_xsection")
+def fixture_make_xsection(wells, surfaces, cube, grid, polygons):
+    def _make_xsection():
+        xsect = XSection(
+            zmin=ZMIN,
+            zmax=ZMAX,
+            well=wells[0],
+            surfaces=surfaces,
+            cube=cube,
+            grid=grid[0],
+            gridproperty=grid[1],
+            outline=polygons,
+            colormap="random40",
+        )
+        xsect.canvas(title="Benchmark")
+        return xsect
+
+    return _make_xsection
+
+
+def test_bench_xsection_init(measure, make_xsection):
+    """Setting up the cross section, including the fence along the well."""
+    measure(lambda _: make_xsection(), setup=lambda: None)
+
+
+@pytest.mark.parametrize("method", PLOT_METHODS)
+def test_bench_xsection_plot(measure, make_xsection, otherwells, method):
+    measure(lambda xsect: PLOT_METHODS[method](xsect, otherwells), setup=make_xsection)
+
+
+def test_bench_xsection_savefig(measure, make_xsection, otherwells, tmp_path):
+    """A complete cross section, rendered to file."""
+
+    def _setup():
+        xsect = make_xsection()
+        for plot in PLOT_METHODS.values():
+            plot(xsect, otherwells)
+        return xsect
+
+    measure(lambda xsect: xsect.savefig(tmp_path / "xsect.png"), setup=_setup)
+
+
+@pytest.mark.parametrize(
+    "dtype, composite",
+    [("float64", False), ("float32", False), ("uint8", False), ("float32", True)],
+)
+def test_bench_xsection_backdrops(measure, make_xsection, tmp_path, dtype, composite):
+    """The cube and grid backdrops rendered to file, per data type of the images.
+
+    Compare the peak memory of the data types, and separate images with one
+    composited image; the cube sections are not cached.
+    """
+
+    def _setup():
+        _backdrop.clear()
+        return make_xsection()
+
+    def _plot(xsect):
+        xsect.plot_cube(dtype=dtype, composite=composite)
+        xsect.plot_grid3d(dtype=dtype, composite=composite)
+        xsect.savefig(tmp_path / "backdrops.png")
+
+    measure(_plot, setup=_setup)
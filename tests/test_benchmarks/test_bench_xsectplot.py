@@ -0,0 +1,32 @@
+"""Benchmark for the xsectplot frontend, end-to-end on synthetic data."""
+
+import pytest
+
+from xtgeoviz import xsectplot
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_bench_xsectplot(measure, wells, surfaces, cube, tmp_path):
+    """One cross section plot per well, written as PNG files."""
+    inputs = {
+        "wells": {"objects": wells, "zonelog": "ZONELOG", "facieslog": "FACIES"},
+        "surfaces": {"primary": {"objects": surfaces}},
+        "cube": cube,
+    }
+    psettings = {"design": {"zrange": [1000, 1900]}}
+    outputs = {"plotfolder": str(tmp_path), "format": "png"}
+
+    measure(
+        lambda _: xsectplot(
+            inputdata=inputs,
+            plotsettings=psettings,
+            output=outputs,
+            verbosity="silent",
+        ),
+        setup=lambda: None,
+        rounds=1,
+    )
+    assert len(list(tmp_path.glob("*.png"))) == len(wells)
@@ -0,0 +1,56 @@
+"""Test that importing xtgeoviz is fast, and that heavy libraries are loaded lazily."""
+
+import subprocess
+import sys
+
+import pytest
+
+import xtgeoviz
+import xtgeoviz.plot
+
+# generous, as the import time varies much on CI machines; eager loading of
+# matplotlib, scipy and xtgeo takes several seconds
+IMPORT_TIME_BUDGET = 1.0
+
+HEAVY_MODULES = ("matplotlib", "scipy", "pandas", "xtgeo")
+
+
+def _run_python(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_is_lazy():
+    """A bare import shall not load the heavy libraries."""
+    code = (
+        "import sys, xtgeoviz, xtgeoviz.plot; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert _run_python(code) == ""
+
+
+def test_import_time():
+    """Best of a few imports, to be robust against a busy machine."""
+    code = (
+        "import time; t0 = time.perf_counter(); import xtgeoviz; "
+        "print(time.perf_counter() - t0)"
+    )
+    best = min(float(_run_python(code)) for _ in range(3))
+    assert best < IMPORT_TIME_BUDGET
+
+
+def test_lazy_attributes():
+    """The public names are loaded on first access."""
+    assert callable(xtgeoviz.quickplot)
+    assert callable(xtgeoviz.xsectplot)
+    assert xtgeoviz.xsectplotting.xsectplot is xtgeoviz.xsectplot
+    assert xtgeoviz.plot.XSection.__name__ == "XSection"
+    assert {"Map", "Grid3DSlice", "XSection"} <= set(dir(xtgeoviz.plot))
+
+    with pytest.raises(AttributeError, match="no attribute 'nosuchthing'"):
+        _ = xtgeoviz.nosuchthing
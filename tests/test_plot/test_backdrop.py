@@ -0,0 +1,300 @@
+"""Test the cube and grid backdrop sections and smoothing."""
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+import scipy.ndimage
+import xtgeo
+from matplotlib.colors import Normalize
+
+from xtgeoviz.plot import _backdrop
+
+
+@pytest.fixture(name="cube")
+def fixture_cube():
+    values = np.random.RandomState(0).randn(20, 20, 40).astype(np.float32)
+    return xtgeo.Cube(
+        ncol=20, nrow=20, nlay=40, xinc=25, yinc=25, zinc=4, zori=1000, values=values
+    )
+
+
+@pytest.fixture(name="fence")
+def fixture_fence():
+    xyz = np.array([[10.0, 10.0, 1000.0], [300.0, 200.0, 1000.0], [450.0, 450.0, 0]])
+    step = np.hypot(*np.diff(xyz[:, :2], axis=0, prepend=xyz[:1, :2]).T)
+    return np.column_stack([xyz, step.cumsum(), step])
+
+
+def test_gaussian_sigma():
+    """Sigma (depth, trace) from the interpolation and smoothing."""
+    assert _backdrop.gaussian_sigma("gaussian3") == (3.0, 3.0)
+    assert _backdrop.gaussian_sigma("gaussian") is None
+    assert _backdrop.gaussian_sigma("bilinear") is None
+    assert _backdrop.gaussian_sigma("gaussian3", smoothing=(2, 5)) == (5.0, 2.0)
+    assert _backdrop.gaussian_sigma("bilinear", smoothing=1.5) == (1.5, 1.5)
+    assert _backdrop.gaussian_sigma("gaussian3", smoothing=0) is None
+
+    with pytest.raises(ValueError, match="must be >= 0"):
+        _backdrop.gaussian_sigma("none", smoothing=(1, -1))
+
+
+@pytest.mark.parametrize("sigma", [2, (1.0, 3.0), (12.0, 0.0), 20])
+def test_gaussian_smooth(sigma):
+    """The smoothing is as the scipy gaussian filter, and keeps float32."""
+    arr = np.random.RandomState(1).randn(150, 60).astype(np.float32)
+
+    result = _backdrop.gaussian_smooth(arr, sigma)
+    assert result.dtype == np.float32
+
+    expected = scipy.ndimage.gaussian_filter(arr.astype(np.float64), sigma)
+    np.testing.assert_allclose(result, expected, atol=1e-5)
+
+
+def test_cube_section_cached(cube, fence, monkeypatch):
+    """Sections are sampled once per fence and settings, also when smoothed."""
+    _backdrop.clear()
+    calls = []
+    method = cube.get_randomline
+
+    def _counted(*args, **kwargs):
+        calls.append(kwargs)
+        return method(*args, **kwargs)
+
+    monkeypatch.setattr(cube, "get_randomline", _counted)
+
+    h1, h2, v1, v2, arr = _backdrop.cube_section(cube, fence, 1000, 1100, 2.0)
+    assert arr.dtype == np.float32
+    assert not arr.flags.writeable
+    assert (v1, v2) == (1000, 1100)
+    assert h1 < h2
+
+    smoothed = _backdrop.cube_section(cube, fence, 1000, 1100, 2.0, sigma=(2.0, 1.0))
+    assert len(calls) == 1
+    np.testing.assert_allclose(
+        smoothed[4], _backdrop.gaussian_smooth(arr, (2.0, 1.0)), atol=1e-6
+    )
+    assert (
+        _backdrop.cube_section(cube, fence, 1000, 1100, 2.0, sigma=(2.0, 1.0))[4]
+        is smoothed[4]
+    )
+
+    _backdrop.cube_section(cube, fence.copy(), 1000, 1100, 2.0)
+    assert len(calls) == 1
+    _backdrop.cube_section(cube, fence, 1000, 1200, 2.0)
+    assert len(calls) == 2
+
+    # new values for the cube are new sections
+    cube.values = cube.values * 2.0
+    new = _backdrop.cube_section(cube, fence, 1000, 1100, 2.0)
+    assert len(calls) == 3
+    np.testing.assert_allclose(new[4], arr * 2.0)
+
+
+def test_grid_section_cached(monkeypatch):
+    """The cells along a fence are found once, and properties taken from them."""
+    _backdrop.clear()
+    xyz = np.column_stack([np.linspace(-40, 520, 30), np.linspace(20, 480, 30)])
+    step = np.hypot(*np.diff(xyz, axis=0, prepend=xyz[:1]).T)
+    fence = np.column_stack([xyz, np.full(30, 1000.0), step.cumsum(), step])
+    grid = xtgeo.create_box_grid(
+        (10, 10, 5), origin=(0.0, 0.0, 1000.0), increment=(50.0, 50.0, 10.0)
+    )
+    rng = np.random.RandomState(2)
+    poro = xtgeo.GridProperty(grid, name="PORO", values=rng.rand(10, 10, 5))
+    facies = xtgeo.GridProperty(
+        grid,
+        name="FACIES",
+        values=np.ma.masked_less(rng.randint(0, 4, (10, 10, 5)), 1),
+        discrete=True,
+    )
+    expected = [
+        grid.get_randomline(fence, prop, zmin=990, zmax=1060, zincrement=2.0)
+        for prop in (poro, facies)
+    ]
+
+    calls = []
+    method = grid.get_randomline
+
+    def _counted(*args, **kwargs):
+        calls.append(kwargs)
+        return method(*args, **kwargs)
+
+    monkeypatch.setattr(grid, "get_randomline", _counted)
+
+    hashes = []
+    generate_hash = grid.generate_hash
+
+    def _hashed(*args, **kwargs):
+        hashes.append(kwargs)
+        return generate_hash(*args, **kwargs)
+
+    monkeypatch.setattr(grid, "generate_hash", _hashed)
+
+    for prop, exp in zip((poro, facies), expected):
+        *limits, arr = _backdrop.grid_section(grid, prop, fence, 990, 1060, 2.0)
+        assert arr.dtype == np.float32
+        assert limits == list(exp[:4])
+        np.testing.assert_array_equal(arr, exp[4].astype(np.float32))
+    assert len(calls) == 1
+
+    arr = _backdrop.grid_section(grid, poro, fence, 990, 1060, 2.0, np.float64)[4]
+    np.testing.assert_array_equal(arr, expected[0][4])
+    assert len(calls) == 1
+
+    _backdrop.grid_section(grid, poro, fence, 990, 1060, 1.0)
+    assert len(calls) == 2
+
+    # the geometry is hashed once per grid (xtgeo hashes it in get_randomline too)
+    nhashes = len(hashes)
+    _backdrop.grid_section(grid, facies, fence, 990, 1060, 1.0)
+    assert len(calls) == 2
+    assert len(hashes) == nhashes
+
+    # another grid is a new search
+    moved = xtgeo.create_box_grid(
+        (10, 10, 5), origin=(0.0, 0.0, 1005.0), increment=(50.0, 50.0, 10.0)
+    )
+    arr = _backdrop.grid_section(moved, poro, fence, 990, 1060, 2.0, np.float64)[4]
+    exp = moved.get_randomline(fence, poro, zmin=990, zmax=1060, zincrement=2.0)
+    np.testing.assert_array_equal(arr, exp[4])
+    assert not np.array_equal(arr, expected[0][4], equal_nan=True)
+
+    other = xtgeo.GridProperty(ncol=5, nrow=5, nlay=5, name="OTHER")
+    with pytest.raises(ValueError, match="does not fit"):
+        _backdrop.grid_section(grid, other, fence, 990, 1060, 2.0)
+
+
+def test_backdrop_image_float32():
+    """Float sections are kept, or converted, as float32."""
+    arr = np.linspace(0.0, 1.0, 12).reshape(3, 4)
+    image, norm = _backdrop.backdrop_image(arr)
+    assert image.dtype == np.float32
+    assert norm is None
+
+    arr32 = arr.astype(np.float32)
+    assert _backdrop.backdrop_image(arr32)[0] is arr32
+
+    with pytest.raises(ValueError, match="not one of"):
+        _backdrop.backdrop_image(arr, dtype="int8")
+
+
+@pytest.mark.parametrize("dtype", ["uint8", "uint16"])
+def test_backdrop_image_quantized(dtype):
+    """Quantized codes give the colors of the values, and undefined are masked."""
+    arr = np.random.RandomState(2).uniform(-0.5, 0.5, (30, 20)).astype(np.float32)
+    arr[0, 0] = np.nan
+
+    image, norm = _backdrop.backdrop_image(arr, dtype=dtype, vmin=-0.4, vmax=0.4)
+    assert image.dtype == dtype
+    assert isinstance(image, np.ma.MaskedArray)
+    assert image.mask.sum() == 1 and image.mask[0, 0]
+
+    expected = Normalize(vmin=-0.4, vmax=0.4, clip=True)(arr)
+    step = 1.0 / np.iinfo(dtype).max
+    np.testing.assert_allclose(norm(image), expected, atol=step / 2 + 1e-6)
+    np.testing.assert_allclose(
+        norm.values(image)[1:], np.clip(arr, -0.4, 0.4)[1:], atol=step
+    )
+    ticks = norm.colorbar_ticks()
+    assert ticks["format"](ticks["ticks"][0], 0) == "-0.4"
+    np.testing.assert_allclose(norm.values(ticks["ticks"][[0, -1]]), [-0.4, 0.4])
+
+    # default range is the range of the values
+    image, norm = _backdrop.backdrop_image(arr, dtype=dtype)
+    assert norm.value_range == (np.nanmin(arr), np.nanmax(arr))
+    assert image.min() == 0 and image.max() == np.iinfo(dtype).max
+
+
+def test_colorize():
+    """The colors are as from the colormap, with under, over and bad colors."""
+    cmap = matplotlib.colormaps["viridis"].with_extremes(under="black", over="red")
+    arr = np.array([[-1.0, 0.0, 0.3], [1.0, 2.0, np.nan]], dtype=np.float32)
+    norm = Normalize(vmin=0.0, vmax=1.0)
+
+    rgba = _backdrop.colorize(arr, cmap, norm, alpha=0.5)
+    # the alpha is multiplied with the alpha of the colors, as for images
+    expected = cmap(norm(np.ma.masked_invalid(arr)), bytes=True)
+    expected[..., 3] = np.rint(expected[..., 3] * 0.5)
+    np.testing.assert_array_equal(rgba, expected)
+    assert tuple(rgba[0, 0]) == (0, 0, 0, 128)
+    assert tuple(rgba[1, 1]) == (255, 0, 0, 128)
+    assert rgba[1, 2, 3] == 0
+
+    norm = Normalize()
+    _backdrop.colorize(arr, cmap, norm)
+    assert (norm.vmin, norm.vmax) == (-1.0, 2.0)
+
+
+def test_composite():
+    """Layers are composited over each other, on the pixels of the image."""
+    cmap = matplotlib.colors.ListedColormap(["red", "blue"])
+    norm = Normalize(vmin=0.0, vmax=1.0)
+    red = np.zeros((2, 2))
+    blue = np.ones((1, 1))
+
+    composite = _backdrop.Composite((4, 8))
+    composite.add(red, (0.0, 10.0, 100.0, 0.0), cmap, norm)
+    # a reversed extent is a flipped image, as in imshow
+    composite.add(blue, (20.0, 10.0, 50.0, 0.0), cmap, norm, alpha=0.5)
+
+    image, extent = composite.render()
+    assert extent == composite.extent == (0.0, 20.0, 100.0, 0.0)
+    assert image.shape == (4, 8, 4)
+    assert tuple(image[0, 0]) == (255, 0, 0, 255)
+    assert tuple(image[3, 7]) == (0, 0, 0, 0)
+    assert tuple(image[1, 5]) == (0, 0, 255, 128)
+
+    composite.add(blue, (0.0, 20.0, 100.0, 0.0), cmap, norm, alpha=0.5)
+    image, _ = composite.render()
+    assert tuple(image[0, 0]) == (127, 0, 128, 255)
+    assert tuple(image[3, 7]) == (0, 0, 255, 128)
+
+    # hidden layers are not composited, but keep the extent
+    version = composite.version
+    composite.set_visible(2, False)
+    assert composite.version != version
+    image, extent = composite.render()
+    assert extent == (0.0, 20.0, 100.0, 0.0)
+    assert tuple(image[0, 0]) == (255, 0, 0, 255)
+    assert tuple(image[3, 7]) == (0, 0, 0, 0)
+
+
+def test_composite_image():
+    """The composited image is rendered when drawn."""
+    fig, ax = plt.subplots()
+    composite = _backdrop.Composite((10, 20))
+    image = _backdrop.CompositeImage(ax, composite)
+    ax.add_image(image)
+
+    cmap = matplotlib.colormaps["viridis"]
+    composite.add(np.arange(6.0).reshape(2, 3), (0, 30, 20, 10), cmap, Normalize())
+    image.update_layers()
+    assert image.get_extent() == [0.0, 30.0, 20.0, 10.0]
+
+    fig.canvas.draw()
+    assert image.get_array().shape == (10, 20, 4)
+    plt.close(fig)
+
+
+def test_composite_image_view():
+    """The view and its orientation are as imshow of the last layer gives."""
+    arr = np.arange(6.0).reshape(2, 3)
+    cmap = matplotlib.colormaps["viridis"]
+    extents = [(-100.0, 900.0, 20.0, 10.0), (800.0, 0.0, 20.0, 10.0)]
+
+    fig, (ax1, ax2) = plt.subplots(2)
+    for extent in extents:
+        ax1.imshow(arr, extent=extent, aspect="auto")
+
+    composite = _backdrop.Composite((10, 20))
+    image = _backdrop.CompositeImage(ax2, composite)
+    ax2.add_image(image)
+    for extent in extents:
+        composite.add(arr, extent, cmap, Normalize())
+        image.update_layers()
+
+    assert ax2.get_xlim() == ax1.get_xlim() == (800.0, 0.0)
+    assert ax2.get_ylim() == ax1.get_ylim()
+    assert image.get_extent() == [-100.0, 900.0, 20.0, 10.0]
+    plt.close(fig)
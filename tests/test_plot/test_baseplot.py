@@ -1,10 +1,12 @@
 """Test the baseplot module and class."""
 
+import os
+
 import matplotlib
 import pytest
 from matplotlib.testing.decorators import image_comparison
 
-from xtgeoviz.plot.baseplot import BasePlot
+from xtgeoviz.plot.baseplot import BasePlot, _cached_colormap
 
 
 @pytest.mark.skip(reason="Graphical compare testing immature")
@@ -34,3 +36,106 @@ def test_colormap():
     assert myplot.get_colormap_as_table()[1] == pytest.approx((0.0, 0.0, 0.0, 1))
     assert myplot.get_colormap_as_table()[8] == pytest.approx((0.8, 0.196, 0.6, 1.0))
     assert xtgeomap.name == "xtgeo"
+
+
+def test_colormap_as_table_ncolors():
+    """More colors than in the map are cycled for listed maps, else resampled."""
+    listed = matplotlib.colors.ListedColormap(["red", "green", "blue"])
+    table = BasePlot.get_any_colormap_as_table(listed, 7)
+    assert len(table) == 7
+    assert table[3] == table[0] == (1.0, 0.0, 0.0, 1.0)
+    assert table[6] == table[0]
+    assert BasePlot.get_any_colormap_as_table(listed, 2) == table[:2]
+
+    xtgeomap = BasePlot.define_any_colormap("xtgeo")
+    table = BasePlot.get_any_colormap_as_table(xtgeomap, 3 * xtgeomap.N)
+    assert len(table) == 3 * xtgeomap.N
+    assert len(set(table)) > xtgeomap.N
+    assert table[0] == BasePlot.get_any_colormap_as_table(xtgeomap)[0]
+    assert BasePlot.get_any_colormap_as_table(xtgeomap, 3 * xtgeomap.N) == table
+
+
+def test_simplify_settings():
+    """Test the settings for line simplification."""
+
+    myplot = BasePlot()
+    assert myplot.simplify is None
+    assert myplot.simplify_units == "pixels"
+
+    myplot.simplify = 0.5
+    myplot.simplify_units = "data"
+    assert myplot.simplify == 0.5
+
+    with pytest.raises(ValueError, match="cannot be negative"):
+        myplot.simplify = -1
+    with pytest.raises(ValueError, match="must be 'pixels' or 'data'"):
+        myplot.simplify_units = "inch"
+
+
+def test_colormap_cache(tmp_path):
+    """Test that colormaps are cached, and that a changed file is read again."""
+
+    cmap1 = BasePlot.define_any_colormap("xtgeo")
+    hits = _cached_colormap.cache_info().hits
+    cmap2 = BasePlot.define_any_colormap("xtgeo")
+    assert _cached_colormap.cache_info().hits == hits + 1
+    assert BasePlot.get_any_colormap_as_table(
+        cmap2
+    ) == BasePlot.get_any_colormap_as_table(cmap1)
+
+    # each call gives a copy, so changing one does not leak into the next plot
+    assert cmap2 is not cmap1
+    cmap1.set_bad("red")
+    bad = BasePlot.define_any_colormap("xtgeo").get_bad()
+    assert tuple(bad) != matplotlib.colors.to_rgba("red")
+
+    hits = _cached_colormap.cache_info().hits
+    BasePlot.define_any_colormap("xtgeo", colorlist=[2, 1])
+    BasePlot.define_any_colormap("xtgeo", colorlist=(2, 1))
+    assert _cached_colormap.cache_info().hits == hits + 1
+
+    cfile = tmp_path / "some.rmscolor"
+    cfile.write_text("ColorMap.color( = 255 0 0\nColorMap.color( = 0 0 255\n")
+    cmap1 = BasePlot.define_any_colormap(str(cfile))
+    assert BasePlot.get_any_colormap_as_table(cmap1)[0] == (1.0, 0.0, 0.0, 1.0)
+
+    cfile.write_text("ColorMap.color( = 0 255 0\nColorMap.color( = 0 0 255\n")
+    os.utime(cfile, ns=(0, os.stat(cfile).st_mtime_ns + 10**9))
+    cmap2 = BasePlot.define_any_colormap(str(cfile))
+    assert BasePlot.get_any_colormap_as_table(cmap2)[0] == (0.0, 1.0, 0.0, 1.0)
+
+
+def test_draw_hooks(tmp_path):
+    """Test hooks called before and after the draw methods."""
+
+    events = []
+    myplot = BasePlot()
+    myplot.add_hook(events.append)
+
+    myplot.canvas(title="Hooked")
+    myplot._ax.plot([0, 1, 2], [0, 1, 0])  # drawn outside a draw method
+    myplot.savefig(tmp_path / "hooked.png")
+
+    assert [(evt.name, evt.phase) for evt in events] == [
+        ("canvas", "start"),
+        ("canvas", "end"),
+        ("savefig", "start"),
+        ("savefig", "end"),
+    ]
+    assert events[1].artists > 0
+    assert events[1].elapsed >= 0.0
+    assert events[3].points == 0
+
+    myplot.remove_hook(events.append)
+    BasePlot.add_global_hook(events.append)
+    try:
+        other = BasePlot()
+        other.canvas()
+        with pytest.raises(ValueError, match="Format"):
+            other.savefig(tmp_path / "wrong.xyz", fformat="xyz")
+    finally:
+        BasePlot.remove_global_hook(events.append)
+        other.close()
+
+    assert isinstance(events[-1].error, ValueError)
+    assert len(events) == 8
@@ -0,0 +1,113 @@
+"""Test the cache of well fences."""
+
+import numpy as np
+import pytest
+
+from xtgeoviz.plot import fencecache, precompute_fences
+
+
+@pytest.fixture(name="cache", autouse=True)
+def fixture_cache():
+    """An empty cache, reset to the defaults after the test."""
+    fencecache.clear()
+    yield fencecache
+    fencecache.configure(maxsize=fencecache.FENCE_CACHE_SIZE, folder="")
+    fencecache.clear()
+
+
+@pytest.fixture(name="fence_well")
+def fixture_fence_well(make_well):
+    """Make a straight, deviated well starting at xstart."""
+
+    def _well(name, xstart=0.0):
+        return make_well(
+            xstart + np.linspace(0.0, 800.0, 100),
+            np.linspace(0.0, 300.0, 100),
+            np.linspace(1000.0, 2000.0, 100),
+            name=name,
+        )
+
+    return _well
+
+
+def _count_calls(monkeypatch, well):
+    calls = []
+    method = well.get_fence_polyline
+
+    def _counted(**kwargs):
+        calls.append(kwargs)
+        return method(**kwargs)
+
+    monkeypatch.setattr(well, "get_fence_polyline", _counted)
+    return calls
+
+
+def test_fence_cached(monkeypatch, fence_well):
+    """The fence is computed once per trajectory and parameters."""
+    well = fence_well("W1")
+    expected = well.get_fence_polyline(sampling=20, nextend=5, tvdmin=1200.0)
+    calls = _count_calls(monkeypatch, well)
+
+    fence = fencecache.get_fence(well, tvdmin=1200.0)
+    np.testing.assert_array_equal(fence, expected)
+    fence[:] = 0.0  # a copy is returned, the cache is not changed
+
+    np.testing.assert_array_equal(fencecache.get_fence(well, tvdmin=1200), expected)
+    assert len(calls) == 1
+
+    # the same trajectory in another well object is found in the cache
+    np.testing.assert_array_equal(
+        fencecache.get_fence(fence_well("W2"), tvdmin=1200.0), expected
+    )
+
+    fencecache.get_fence(well, tvdmin=1300.0)
+    assert len(calls) == 2
+
+    # changing the trajectory is a new fence
+    dfr = well.get_dataframe()
+    dfr["X_UTME"] += 10.0
+    well.set_dataframe(dfr)
+    fence = fencecache.get_fence(well, tvdmin=1200.0)
+    assert len(calls) == 3
+    np.testing.assert_allclose(fence[:, 0], expected[:, 0] + 10.0)
+
+
+def test_fence_cache_lru_and_folder(monkeypatch, tmp_path, fence_well):
+    """The least recently used fences are removed, and reloaded from the folder."""
+    fencecache.configure(maxsize=1, folder=str(tmp_path))
+    well = fence_well("W1")
+    calls = _count_calls(monkeypatch, well)
+
+    fencecache.get_fence(well)
+    fencecache.get_fence(well, tvdmin=1500.0)
+    assert len(list(tmp_path.glob("fence_*.npy"))) == 2
+
+    fencecache.configure(folder="")
+    fencecache.get_fence(well)
+    assert len(calls) == 3
+
+    fencecache.configure(folder=str(tmp_path))
+    fencecache.clear()
+    fencecache.get_fence(well)
+    fencecache.get_fence(well, tvdmin=1500.0)
+    assert len(calls) == 3
+
+    # no fence is possible below the well
+    assert fencecache.get_fence(well, tvdmin=3000.0) is False
+    fencecache.clear()
+    assert fencecache.get_fence(well, tvdmin=3000.0) is False
+    assert len(calls) == 4
+
+
+def test_precompute_fences(monkeypatch, fence_well):
+    """Fences are computed in parallel, with zmin per well."""
+    wells = [fence_well(f"W{iwell}", xstart=iwell * 1000.0) for iwell in range(4)]
+    calls = [_count_calls(monkeypatch, well) for well in wells]
+
+    precompute_fences(wells, tvdmin=[1100.0, 1200.0, 1300.0, 1400.0], max_workers=2)
+    assert [len(wcalls) for wcalls in calls] == [1, 1, 1, 1]
+    assert calls[2][0]["tvdmin"] == 1300.0
+
+    for well, zmin in zip(wells, [1100.0, 1200.0, 1300.0, 1400.0]):
+        fencecache.get_fence(well, tvdmin=zmin)
+    assert [len(wcalls) for wcalls in calls] == [1, 1, 1, 1]
@@ -1,6 +1,7 @@
 import os
 import pathlib
 
+import numpy as np
 import pytest
 import xtgeo
 
@@ -39,3 +40,23 @@ def test_slice_simple_layer(tmpdir, show_plot, generate_plot):
         if generate_plot:
             layslice.savefig(os.path.join(tmpdir, "layerslice_" + str(lay) + ".png"))
         layslice.close()
+
+
+def test_animate_layer(tmp_path):
+    """Animation of a layer for a series of properties, as a GIF."""
+    mygrid = xtgeo.create_box_grid((4, 3, 2))
+
+    props = []
+    for i in range(3):
+        props.append(
+            xtgeo.GridProperty(
+                mygrid, name="SWAT", date=20200101 + i * 10000, values=np.full(24, i)
+            )
+        )
+
+    layslice = Grid3DSlice()
+    layslice.canvas(title="Restart")
+    layslice.animate_gridslice(mygrid, props, tmp_path / "restart.gif", index=2)
+    layslice.close()
+
+    assert (tmp_path / "restart.gif").is_file()
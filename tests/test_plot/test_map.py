@@ -1,6 +1,9 @@
 import pathlib
 from os.path import join
 
+import matplotlib
+import numpy as np
+import pandas as pd
 import xtgeo
 
 from xtgeoviz.plot import Map
@@ -89,3 +92,71 @@ def test_perm_logarithmic_map(tmpdir, generate_plot):
         myplot.savefig(join(tmpdir, "permx_normal.png"), last=True)
     else:
         myplot.close()
+
+
+def test_animate_surfaces(tmp_path):
+    """Animation of surfaces, as a GIF."""
+
+    surfaces = []
+    for i in range(3):
+        surf = xtgeo.RegularSurface(
+            ncol=20, nrow=10, xinc=25, yinc=25, values=np.arange(200) + i * 100
+        )
+        surf.name = f"T{i}"
+        surfaces.append(surf)
+
+    myplot = Map()
+    myplot.canvas(title="Time lapse")
+    result = myplot.animate_surfaces(surfaces, tmp_path / "tlapse.gif", fps=2)
+    myplot.close()
+
+    assert result == str(tmp_path / "tlapse.gif")
+    assert (tmp_path / "tlapse.gif").is_file()
+
+
+def test_plot_wells_color_cycle(make_well):
+    """The wells continue the color cycle of the map axes."""
+    wells = [
+        make_well(
+            np.linspace(0.0, 100.0, 10) + 100.0 * iwell,
+            np.linspace(0.0, 100.0, 10),
+            np.linspace(1000.0, 1100.0, 10),
+            name=f"W{iwell}",
+            mdval=True,
+        )
+        for iwell in range(3)
+    ]
+
+    myplot = Map()
+    myplot.canvas()
+    myplot._ax.plot([0.0, 1.0], [0.0, 1.0])
+    myplot.plot_wells(xtgeo.Wells(wells))
+
+    colors = myplot._ax.collections[-1].get_colors()
+    expected = matplotlib.colors.to_rgba_array(["C1", "C2", "C3"])
+    np.testing.assert_allclose(colors, expected)
+    myplot.close()
+
+
+def test_plot_points_cull_aspect():
+    """Culling keeps points in the view widened by an equal aspect."""
+    myplot = Map()
+    myplot.canvas()
+    myplot._ax.set_aspect("equal", adjustable="datalim")
+    myplot._ax.plot([0.0, 100.0], [0.0, 100.0])
+
+    points = xtgeo.Points(
+        pd.DataFrame(
+            {
+                "X_UTME": [50.0, 120.0, 500.0],
+                "Y_UTMN": [50.0, 50.0, 50.0],
+                "Z_TVDSS": [0.0, 0.0, 0.0],
+            }
+        )
+    )
+    myplot.plot_points(points, cull=True)
+
+    # the view is widened in x by the aspect, so the second point is visible
+    offsets = myplot._ax.collections[-1].get_offsets()
+    assert offsets.tolist() == [[50.0, 50.0], [120.0, 50.0]]
+    myplot.close()
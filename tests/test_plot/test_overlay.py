@@ -0,0 +1,118 @@
+"""Test the private overlay helpers."""
+
+import numpy as np
+
+import xtgeoviz.plot._overlay as ov
+
+
+def test_split_parts():
+    """Split coordinates per id, also when ids are not sorted."""
+    ids = np.array([2, 2, 0, 0, 0, 2])
+    xarr = np.array([20.0, 21.0, 0.0, 1.0, 2.0, 22.0])
+    yarr = np.array([5.0, 6.0, 1.0, 1.0, 1.0, 7.0])
+
+    parts, bboxes = ov.split_parts(ids, xarr, yarr)
+
+    assert len(parts) == 2
+    assert parts[0].tolist() == [[0.0, 1.0], [1.0, 1.0], [2.0, 1.0]]
+    assert parts[1].tolist() == [[20.0, 5.0], [21.0, 6.0], [22.0, 7.0]]
+    assert bboxes.tolist() == [[0.0, 2.0, 1.0, 1.0], [20.0, 22.0, 5.0, 7.0]]
+
+
+def test_visible_parts():
+    """Bounding boxes overlapping a view, also for an inverted axis."""
+    bboxes = np.array([[0.0, 2.0, 0.0, 2.0], [10.0, 12.0, 10.0, 12.0]])
+
+    assert ov.visible_parts(bboxes, (1.0, 5.0, 1.0, 5.0)).tolist() == [True, False]
+    assert ov.visible_parts(bboxes, (15.0, 11.0, 5.0, 20.0)).tolist() == [False, True]
+
+
+def test_decimate_labels():
+    """Labels closer than the given distance are skipped."""
+    points = np.array([[0.0, 0.0], [1.0, 1.0], [30.0, 0.0], [31.0, 2.0], [90.0, 90.0]])
+
+    assert ov.decimate_labels(points, 20).tolist() == [0, 2, 4]
+    assert ov.decimate_labels(points, None).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_clip_line():
+    """Clip a line leaving and re-entering the view, keeping crossing segments."""
+    line = np.array(
+        [[-5.0, 5.0], [-1.0, 5.0], [5.0, 5.0], [15.0, 5.0], [20.0, 5.0], [5.0, 6.0]]
+    )
+
+    pieces = ov.clip_line(line, (0.0, 10.0, 0.0, 10.0))
+
+    assert [piece.tolist() for piece in pieces] == [
+        [[-1.0, 5.0], [5.0, 5.0], [15.0, 5.0]],
+        [[20.0, 5.0], [5.0, 6.0]],
+    ]
+
+
+def test_cull_parts():
+    """Cull parts outside the view, and keep track of where the pieces come from."""
+    parts = [
+        np.array([[0.0, 0.0], [1.0, 1.0]]),
+        np.empty((0, 2)),
+        np.array([[50.0, 50.0], [51.0, 51.0]]),
+        np.array([[-5.0, 1.0], [5.0, 1.0], [5.0, 20.0], [5.0, 30.0]]),
+    ]
+    extent = (0.0, 10.0, 0.0, 10.0)
+
+    kept, index = ov.cull_parts(parts, extent)
+    assert index.tolist() == [0, 3]
+    assert len(kept[1]) == 4
+
+    kept, index = ov.cull_parts(parts, extent, clip=True)
+    assert index.tolist() == [0, 3]
+    assert kept[1].tolist() == [[-5.0, 1.0], [5.0, 1.0], [5.0, 20.0]]
+
+
+def test_simplify_line():
+    """Douglas-Peucker keeps corners, and vertices that are asked to be kept."""
+    xarr = np.linspace(0.0, 20.0, 21)
+    yarr = np.where(xarr <= 10.0, 0.0, xarr - 10.0)
+    yarr[5] = 0.01
+    xy = np.column_stack((xarr, yarr))
+
+    assert ov.simplify_line(xy, 0.1).tolist() == [0, 10, 20]
+    assert ov.simplify_line(xy, 0.001).tolist() == [0, 4, 5, 6, 10, 20]
+    assert ov.simplify_line(xy, None).tolist() == list(range(21))
+
+    keep = ov.change_points(np.where(xarr < 3.0, 1, 2))
+    assert np.flatnonzero(keep).tolist() == [2, 3]
+    assert ov.simplify_line(xy, 0.1, keep=keep).tolist() == [0, 2, 3, 10, 20]
+
+
+def test_change_points_nan():
+    """NaN to NaN in logs is not a change."""
+    log = np.array([np.nan, np.nan, 1.0, 1.0, np.nan])
+
+    assert ov.change_points(log).tolist() == [False, True, True, True, True]
+
+
+def test_fill_polygons():
+    """The zone polygons are as the polygons of fill_between, split at NaN."""
+    import matplotlib.pyplot as plt
+
+    xarr = np.arange(8.0)
+    depths = np.array(
+        [
+            [0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0],
+            [5.0, 5.0, np.nan, 6.0, 6.0, 6.0, 6.0, 6.0],
+            [9.0, 9.0, 9.0, 9.0, 9.0, 9.0, np.nan, 9.0],
+        ]
+    )
+    polygons, zones = ov.fill_polygons(xarr, depths)
+    assert zones.tolist() == [0, 0, 1, 1, 1]
+
+    fig, ax = plt.subplots()
+    expected = [
+        ax.fill_between(xarr, depths[izone], depths[izone + 1]).get_paths()
+        for izone in range(2)
+    ]
+    plt.close(fig)
+    expected = [path.vertices[:-1] for paths in expected for path in paths]
+    assert len(polygons) == len(expected)
+    for polygon, vertices in zip(polygons, expected):
+        np.testing.assert_array_equal(polygon, vertices)
@@ -0,0 +1,70 @@
+"""Test the private profiling module."""
+
+import csv
+import json
+import tracemalloc
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from xtgeoviz.plot import _profiling
+from xtgeoviz.plot.baseplot import BasePlot
+
+
+@_profiling.profiled
+def _allocate(nbytes):
+    return np.ones(nbytes, dtype=np.uint8).sum()
+
+
+def test_profiler_inactive():
+    """Without an active profiler, stages and decorated functions just run."""
+    assert _profiling.active() is None
+    with _profiling.stage("nothing"):
+        assert _allocate(10) == 10
+
+
+def test_profiler_stages(tmp_path):
+    """Nested stages, with peak memory and written reports."""
+    profiler = _profiling.Profiler(tracemem=True)
+
+    with _profiling.profiling(profiler):
+        assert _profiling.active() is profiler
+        with _profiling.stage("outer"):
+            profiler.well = "W1"
+            _allocate(5_000_000)
+            _allocate(1_000_000)
+
+    assert _profiling.active() is None
+    assert not tracemalloc.is_tracing()
+
+    stages = [rec["stage"] for rec in profiler.records]
+    assert stages == ["_allocate", "_allocate", "outer"]
+    peaks = [rec["peak_memory_mb"] for rec in profiler.records]
+    assert peaks[0] >= 5.0
+    assert 1.0 <= peaks[1] < 5.0
+    assert peaks[2] >= peaks[0]
+
+    summary = profiler.summary()
+    assert summary["_allocate"]["count"] == 2
+
+    jsonfile, csvfile = profiler.write(str(tmp_path), prefix="x_")
+    assert jsonfile.endswith("x_profile.json")
+    with open(jsonfile, encoding="utf-8") as stream:
+        assert json.load(stream)["summary"]["outer"]["count"] == 1
+    with open(csvfile, encoding="utf-8") as stream:
+        rows = list(csv.DictReader(stream))
+    assert rows[0]["well"] == "W1"
+
+
+def test_profiler_draw_hook():
+    """The active profiler times each draw method once, as a draw hook."""
+    profiler = _profiling.Profiler()
+    myplot = BasePlot()
+
+    with _profiling.profiling(profiler):
+        myplot.canvas(title="Profiled")
+    myplot.canvas(title="Not profiled")
+    plt.close("all")
+
+    assert [rec["stage"] for rec in profiler.records] == ["canvas"]
+    assert not BasePlot._global_hooks
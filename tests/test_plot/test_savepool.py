@@ -0,0 +1,97 @@
+"""Test saving figures in the background with SavePool."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.backends.backend_svg import FigureCanvasSVG
+
+from xtgeoviz.plot import SavePool
+
+
+def _figure():
+    fig, ax = plt.subplots(figsize=(3, 2))
+    ax.plot([0, 1, 2], [2, 0, 1], color="red")
+    ax.set_title("Pool")
+    return fig
+
+
+def test_savepool_png_as_direct_save(tmp_path):
+    """The background encoded PNG has the same pixels as a direct save."""
+    direct = tmp_path / "direct.png"
+    pooled = tmp_path / "pooled.png"
+
+    fig = _figure()
+    fig.savefig(direct, format="png", dpi=50)
+    plt.close(fig)
+
+    with SavePool(max_workers=2) as pool:
+        pool.submit(_figure(), pooled, dpi=50)
+        paths, errors = pool.join()
+
+    assert paths == [str(pooled)]
+    assert not errors
+    np.testing.assert_array_equal(plt.imread(direct), plt.imread(pooled))
+
+
+@pytest.mark.parametrize("fformat", ["tif", "tiff", "jpg", "jpeg"])
+def test_savepool_format_aliases(tmp_path, fformat):
+    """The aliases of raster formats are written as by savefig."""
+    direct = tmp_path / f"direct.{fformat}"
+    pooled = tmp_path / f"pooled.{fformat}"
+
+    fig = _figure()
+    fig.savefig(direct, format=fformat, dpi=50)
+    plt.close(fig)
+
+    with SavePool(max_workers=1) as pool:
+        pool.submit(_figure(), pooled, fformat=fformat, dpi=50)
+        paths, errors = pool.join()
+
+    assert paths == [str(pooled)]
+    assert not errors
+    if fformat.startswith("tif"):
+        np.testing.assert_array_equal(plt.imread(direct), plt.imread(pooled))
+    else:
+        assert plt.imread(pooled).shape[:2] == plt.imread(direct).shape[:2]
+
+
+def test_savepool_keeps_canvas(tmp_path):
+    """A figure of another backend is rendered with Agg, and keeps its canvas."""
+    fig = _figure()
+    canvas = FigureCanvasSVG(fig)
+
+    with SavePool(max_workers=1) as pool:
+        pool.submit(fig, tmp_path / "svgcanvas.png", close=False)
+        paths, _ = pool.join()
+
+    assert paths == [str(tmp_path / "svgcanvas.png")]
+    assert fig.canvas is canvas
+    plt.close(fig)
+
+
+def test_savepool_vector_format(tmp_path):
+    """Vector formats are encoded at once, and written in the background."""
+    fig = _figure()
+    with SavePool(max_workers=1, max_pending=1) as pool:
+        pool.submit(fig, tmp_path / "a.svg", fformat="svg", close=False)
+        pool.submit(fig, tmp_path / "b.pdf", fformat="pdf")
+        paths, _ = pool.join()
+
+    assert len(paths) == 2
+    assert (tmp_path / "a.svg").read_text().lstrip().startswith("<?xml")
+    assert (tmp_path / "b.pdf").read_bytes().startswith(b"%PDF")
+
+
+def test_savepool_errors(tmp_path):
+    """Failed writes are reported by join(), not raised in the thread."""
+    missing = tmp_path / "nofolder" / "plot.png"
+    with SavePool() as pool:
+        pool.submit(_figure(), missing)
+        pool.submit(_figure(), tmp_path / "ok.png")
+        paths, errors = pool.join()
+
+    assert paths == [str(tmp_path / "ok.png")]
+    assert list(errors) == [str(missing)]
+
+    with pytest.raises(ValueError, match="at least 1"):
+        SavePool(max_workers=0)
@@ -0,0 +1,110 @@
+"""Test the private columnar well store."""
+
+import gc
+import weakref
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import xtgeoviz.plot._wellstore as ws
+
+
+@pytest.fixture(name="zoned_well")
+def fixture_zoned_well(make_well):
+    """Make a well along x and y, with a discrete zone log."""
+
+    def _well(name, xval, yval):
+        return make_well(
+            xval,
+            yval,
+            np.linspace(1000.0, 2000.0, len(xval)),
+            name=name,
+            logs={"ZONE": np.ones(len(xval))},
+            wlogtypes={"ZONE": "DISC"},
+            wlogrecords={"ZONE": {1: "Upper"}},
+        )
+
+    return _well
+
+
+def test_well_columns(zoned_well):
+    """Columns are views of the dataframe, cached until it is replaced."""
+    well = zoned_well("W1", [0.0, 1.0, 2.0], [0.0, 0.0, 1.0])
+
+    columns = ws.well_columns(well)
+    assert ws.well_columns(well) is columns
+    assert len(columns) == 3
+    assert "ZONE" in columns
+    assert columns["X_UTME"].tolist() == [0.0, 1.0, 2.0]
+    assert columns["X_UTME"].flags["C_CONTIGUOUS"]
+    assert np.shares_memory(
+        columns["X_UTME"], well.get_dataframe(copy=False)["X_UTME"].to_numpy()
+    )
+    assert columns.logrecord("ZONE") == {1: "Upper"}
+
+    well.set_dataframe(well.get_dataframe().iloc[:2])
+    assert ws.well_columns(well) is not columns
+    assert len(ws.well_columns(well)) == 2
+
+
+def test_packed_wells(zoned_well):
+    """Wells packed in one array, with offsets, last points and bounding boxes."""
+    wells = [
+        zoned_well("A", [0.0, 1.0, 2.0], [0.0, 5.0, 1.0]),
+        zoned_well("B", [10.0, 12.0], [3.0, 4.0]),
+    ]
+    packed = ws.PackedWells(wells)
+
+    assert len(packed) == 2
+    assert packed.names == ["A", "B"]
+    assert packed.offsets.tolist() == [0, 3, 5]
+    assert packed.part(1)[:, 0].tolist() == [10.0, 12.0]
+    assert [part.shape for part in packed.parts()] == [(3, 2), (2, 2)]
+    assert packed.ends.tolist() == [[2.0, 1.0], [12.0, 4.0]]
+    assert packed.bboxes.tolist() == [[0.0, 2.0, 0.0, 5.0], [10.0, 12.0, 3.0, 4.0]]
+
+    assert ws.packed_wells(wells) is ws.packed_wells(wells)
+    assert ws.packed_wells(wells[:1]) is not ws.packed_wells(wells)
+
+
+def test_packed_wells_released(zoned_well):
+    """The last packed wells are reused, but not kept when the wells are gone."""
+    wells = [zoned_well("A", [0.0, 1.0], [0.0, 1.0])]
+    packed = ws.packed_wells(wells)
+    assert ws.packed_wells(list(wells)) is packed
+
+    released = weakref.ref(packed)
+    del wells, packed
+    gc.collect()
+    assert released() is None
+
+
+def test_wellview():
+    """The rows below zmin as arrays, with relative length from the first row."""
+    dfr = pd.DataFrame(
+        {
+            "X_UTME": [0.0, 3.0, 6.0, 6.0, 9.0],
+            "Y_UTMN": [0.0, 4.0, 8.0, 8.0, 12.0],
+            "Z_TVDSS": [900.0, 1000.0, 1100.0, 1200.0, 1300.0],
+            "ZONE": [1.0, 1.0, 2.0, np.nan, 2.0],
+        }
+    )
+    before = dfr.copy()
+
+    view = ws.WellView(dfr, zmin=950.0)
+    assert len(view) == 4
+    assert "ZONE" in view
+    assert "R_HLEN" in view
+    assert "FACIES" not in view
+    assert view["R_HLEN"].tolist() == [0.0, 5.0, 5.0, 10.0]
+    assert view["ZONE"] is view["ZONE"]
+
+    subset = view.take([0, 3])
+    assert subset["R_HLEN"].tolist() == [0.0, 10.0]
+    assert subset["Z_TVDSS"].tolist() == [1000.0, 1300.0]
+
+    pd.testing.assert_frame_equal(dfr, before)
+
+    # all rows in view: the columns are not copied
+    assert np.shares_memory(ws.WellView(dfr)["Z_TVDSS"], dfr["Z_TVDSS"].to_numpy())
@@ -2,9 +2,13 @@ import glob
 import pathlib
 from os.path import join
 
+import matplotlib
+import numpy as np
+import pandas as pd
+import pytest
 import xtgeo
 
-from xtgeoviz.plot import XSection
+from xtgeoviz.plot import XSection, _backdrop, fencecache
 
 TPATH = pathlib.Path("../xtgeo-testdata")
 
@@ -24,6 +28,159 @@ def test_xsection_init():
     assert xsect.pagesize == "A4"
 
 
+def test_plot_well_keeps_well(make_well):
+    """Plotting a well does not change it, so it can be plotted again."""
+    zval = np.linspace(1000.0, 2000.0, 200)
+    well = make_well(
+        np.linspace(0.0, 1000.0, 200),
+        500.0,
+        zval,
+        mdval=True,
+        logs={"ZONELOG": np.where(zval < 1500.0, 1.0, 2.0)},
+        zonelogname="ZONELOG",
+        wlogtypes={"ZONELOG": "DISC"},
+        wlogrecords={"ZONELOG": {1: "Upper", 2: "Lower"}},
+    )
+    before = well.get_dataframe()
+
+    for zmin in (1500.0, 1200.0):
+        xsect = XSection(zmin=zmin, zmax=2100.0, well=well)
+        xsect.canvas()
+        xsect.plot_well(zonelogname="ZONELOG")
+        segments = xsect._ax1["well"].collections[-1].get_segments()
+        assert min(seg[:, 1].min() for seg in segments) > zmin
+        xsect.close()
+
+    pd.testing.assert_frame_equal(well.get_dataframe(), before)
+
+
+def test_plot_surfaces_fill_collections(make_well):
+    """The zone fills and lines are two collections, whatever the number of zones."""
+    well = make_well(
+        np.linspace(100.0, 900.0, 50),
+        500.0,
+        np.linspace(1000.0, 1500.0, 50),
+        mdval=True,
+    )
+    surfaces = [
+        xtgeo.RegularSurface(
+            ncol=20, nrow=20, xinc=50.0, yinc=50.0, values=1000.0 + 20.0 * isurf
+        )
+        for isurf in range(25)
+    ]
+    for isurf, surf in enumerate(surfaces):
+        surf.name = f"S{isurf}"
+
+    xsect = XSection(zmin=950.0, zmax=1550.0, well=well, surfaces=surfaces)
+    xsect.canvas()
+    xsect.plot_surfaces(fill=True)
+
+    ax = xsect._ax1["main"]
+    polys, lines = ax.collections
+    assert len(polys.get_paths()) == 24
+    assert len(lines.get_segments()) == 25
+    assert not ax.lines
+    legend = ax.get_legend()
+    assert [text.get_text() for text in legend.get_texts()] == [
+        surf.name for surf in surfaces
+    ]
+
+    # a colormap of the call is cycled, and does not change the one of the plot
+    colormap = xsect.colormap
+    xsect.plot_surfaces(
+        fill=True,
+        colormap=matplotlib.colors.ListedColormap(["red", "green", "blue"]),
+        axisname="second",
+        legend=False,
+    )
+    assert xsect.colormap is colormap
+    colors = xsect._ax1["second"].collections[0].get_facecolors()
+    np.testing.assert_array_equal(colors[3], colors[0])
+    np.testing.assert_array_equal(colors[0], (1.0, 0.0, 0.0, 1.0))
+    xsect.close()
+
+
+@pytest.mark.parametrize("composite", [False, True])
+def test_plot_grid3d_layers(composite, monkeypatch, make_well):
+    """Several grid properties are layers, sampled from the same cells."""
+    _backdrop.clear()
+    fencecache.clear()
+    grid = xtgeo.create_box_grid(
+        (20, 20, 10), origin=(0.0, 0.0, 1000.0), increment=(50.0, 50.0, 10.0)
+    )
+    rng = np.random.RandomState(3)
+    properties = [
+        xtgeo.GridProperty(grid, name=name, values=rng.rand(20, 20, 10) * scale)
+        for name, scale in (("PORO", 0.3), ("PERM", 1000.0))
+    ]
+    well = make_well(
+        np.linspace(100.0, 900.0, 100),
+        np.linspace(200.0, 700.0, 100),
+        np.linspace(1000.0, 1100.0, 100),
+        mdval=True,
+    )
+
+    calls = []
+    method = grid.get_randomline
+
+    def _counted(*args, **kwargs):
+        calls.append(kwargs)
+        return method(*args, **kwargs)
+
+    monkeypatch.setattr(grid, "get_randomline", _counted)
+
+    xsect = XSection(
+        zmin=990.0, zmax=1110.0, well=well, grid=grid, gridproperty=properties
+    )
+    assert xsect.grid_layers == ["PORO", "PERM"]
+    xsect.canvas()
+    xsect.plot_grid3d(vmin={"PERM": 0.0}, layer="PERM", composite=composite)
+    assert len(calls) == 1
+
+    ax = xsect._ax1["main"]
+    if composite:
+        assert len(ax.images) == 1
+        xsect._fig.canvas.draw()
+        perm = ax.images[0].get_array().copy()
+        xsect.show_grid_layer("PORO")
+        xsect._fig.canvas.draw()
+        assert not np.array_equal(ax.images[0].get_array(), perm)
+    else:
+        poro, perm = ax.images
+        assert perm.get_visible() and not poro.get_visible()
+        assert perm.norm.vmin == 0.0
+        xsect.show_grid_layer("PORO")
+        assert poro.get_visible() and not perm.get_visible()
+
+    with pytest.raises(ValueError, match="No grid layer"):
+        xsect.show_grid_layer("NTG")
+    xsect.close()
+
+
+def test_plot_wellmap_polygons(make_well):
+    """Other wells as polygons are drawn and labelled; empty ones are skipped."""
+    well = make_well(
+        np.linspace(100.0, 900.0, 50), 500.0, np.linspace(1000.0, 1500.0, 50)
+    )
+    other = xtgeo.Polygons([(0.0, 0.0, 0.0, 0), (100.0, 100.0, 0.0, 0)])
+    other.name = "OTHER"
+    empty = xtgeo.Polygons(
+        pd.DataFrame({"X_UTME": [], "Y_UTMN": [], "Z_TVDSS": [], "POLY_ID": []})
+    )
+    empty.name = "EMPTY"
+
+    xsect = XSection(zmin=950.0, zmax=1550.0, well=well)
+    xsect.canvas()
+    xsect.plot_wellmap(otherwells=[empty, other])
+
+    ax = xsect._ax2
+    assert len(ax.collections[-1].get_paths()) == 1
+    labels = [text.get_text() for text in ax.texts]
+    assert labels[-1] == "OTHER"
+    assert "EMPTY" not in labels
+    xsect.close()
+
+
 def test_simple_plot(tmpdir, show_plot, generate_plot):
     """Test as simple XSECT plot."""
 
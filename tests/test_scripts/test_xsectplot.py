@@ -1,11 +1,27 @@
 """Module for testing stand-alone scripts and/or entrypoints functions."""
 
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import numpy as np
 import pytest
 import xtgeo
 
 from xtgeoviz import xsectplot
-from xtgeoviz.frontends._xsectplotting_config import config_defaults, data_merge
-from xtgeoviz.frontends.xsectplotting import _Xsections, _XsectSettings
+from xtgeoviz.frontends import _xsectplotting_config as _cfg
+from xtgeoviz.frontends._xsectplotting_config import (
+    config_defaults,
+    data_merge,
+    validate_config,
+)
+from xtgeoviz.frontends._xsectplotting_load import summarize_wells
+from xtgeoviz.frontends._xsectplotting_manifest import Manifest
+from xtgeoviz.frontends.xsectplotting import (
+    _select_backend,
+    _Xsections,
+    _XsectSettings,
+)
 
 # testdata (xtgeo-testdata), relative to testdir
 WELLSET1 = "wells/drogon/1"
@@ -55,6 +71,173 @@ def test_xsectplotting_config_dict_merge_shall_fail():
         _ = data_merge(dictresult, userinput)
 
 
+def test_xsectplotting_validate_config():
+    """Test validation of the config, before any data are loaded."""
+
+    config = config_defaults(as_yaml=False)
+    assert validate_config(config) == []
+
+    # the format is as for matplotlib, in any case
+    upper = data_merge(config, {"output": {"format": "PNG"}})
+    assert validate_config(upper) == []
+    pset = _XsectSettings()
+    pset.update_plotsettings(upper)
+    assert pset.output_format == "png"
+
+    update = {
+        "plotsettings": {
+            "design": {"zrange": [2000, 1000], "simplify": -1, "composite": "yes"},
+            "cube": {"smoothing": [2, -1], "dtype": "int8"},
+        },
+        "output": {"format": "svgx"},
+        "input": {"grid": {"property": {"name": ["PORO", "PORO"]}}},
+    }
+    problems = validate_config(data_merge(config, update), check_paths=True)
+    assert len(problems) == 8
+    assert "input.wells needs either 'objects' or 'folder'" in problems
+
+
+def test_xsectplot_check_mode(tmp_path):
+    """Test the --check mode, which shall not import the plotting stack."""
+
+    (tmp_path / "wells").mkdir()
+    (tmp_path / "wells" / "some.rmswell").touch()
+    cfg = tmp_path / "xsect.yaml"
+    cfg.write_text(f"input:\n    wells:\n        folder: {tmp_path / 'wells'}\n")
+
+    code = (
+        "import sys; from xtgeoviz import xsectplot; "
+        f"xsectplot(['--config', {str(cfg)!r}, '--check']); "
+        "print([m for m in ('matplotlib', 'xtgeo', 'pandas') if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().endswith("[]")
+
+    cfg.write_text("input:\n    wells:\n        folder: /nosuch/folder\n")
+    with pytest.raises(SystemExit, match="does not exist"):
+        xsectplot(["--config", str(cfg), "--check"])
+
+
+def test_select_backend_keeps_pyplot_backend(monkeypatch):
+    """Test that the backend of a pyplot in use is only switched when forced."""
+    import matplotlib
+    import matplotlib.pyplot  # noqa: F401
+
+    calls = []
+    monkeypatch.setattr(matplotlib, "use", calls.append)
+
+    _select_backend("agg")
+    assert calls == []
+
+    _select_backend("agg", force=True)
+    assert calls == ["agg"]
+
+
+def test_xsectplot_manifest(tmp_path):
+    """Test the fingerprints of the manifest used for incremental plotting."""
+
+    wfiles = [tmp_path / "w1.rmswell", tmp_path / "w2.rmswell"]
+    for wfile in wfiles:
+        wfile.write_text(wfile.name)
+    surf = tmp_path / "top.gri"
+    surf.write_text("surface")
+
+    app = SimpleNamespace(
+        config={"input": {"wells": {"zonelog": "Zone"}}},
+        wells={
+            "wlist": [SimpleNamespace(name="W1"), SimpleNamespace(name="W2")],
+            "files": [str(wfile) for wfile in wfiles],
+        },
+        inputfiles=[str(surf)],
+    )
+    pset = _XsectSettings(design_zrange={"W1": (1000, 1500), "W2": (1200, 1600)})
+    plotfile = tmp_path / "W1.png"
+    plotfile.touch()
+
+    manifest = Manifest(str(tmp_path / "manifest.json"))
+    first = [manifest.fingerprint(app, pset, iwell) for iwell in range(2)]
+    assert first[0] != first[1]
+    assert not manifest.unchanged(str(plotfile), first[0])
+    manifest.record(str(plotfile), first[0])
+    manifest.write()
+
+    # a new run, where only the settings of W2 and a setting not plotted change
+    pset.design_zrange["W2"] = (1300, 1600)
+    pset.output_savethreads = 0
+    manifest = Manifest(str(tmp_path / "manifest.json"))
+    second = [manifest.fingerprint(app, pset, iwell) for iwell in range(2)]
+    assert second[0] == first[0]
+    assert second[1] != first[1]
+    assert manifest.unchanged(str(plotfile), second[0])
+
+    # changing a shared input file changes all
+    surf.write_text("changed surface")
+    manifest = Manifest(str(tmp_path / "manifest.json"))
+    assert not manifest.unchanged(str(plotfile), manifest.fingerprint(app, pset, 0))
+
+    # inputs given as objects have no fingerprint
+    app.inputfiles.append(None)
+    manifest = Manifest(str(tmp_path / "manifest.json"))
+    assert manifest.fingerprint(app, pset, 0) is None
+
+
+def test_xsects_summary_and_smart_zranges(make_well):
+    """Test the summary tables made at load, and the smart zranges using them."""
+
+    def _well(name, xpos):
+        return make_well(
+            xpos + np.linspace(0.0, 300.0, 50),
+            500.0,
+            np.linspace(1000.0, 1900.0, 50),
+            name=name,
+        )
+
+    # surfaces dipping along x, from 1200 to 1400 and 1600 to 1800
+    xval = np.linspace(0.0, 1.0, 101)
+    surfaces = [
+        xtgeo.RegularSurface(
+            ncol=101,
+            nrow=101,
+            xinc=20.0,
+            yinc=20.0,
+            values=np.repeat((depth + 200.0 * xval)[:, np.newaxis], 101, axis=1),
+        )
+        for depth in (1200.0, 1600.0)
+    ]
+
+    inputs = {
+        "wells": {"objects": [_well("EAST", 1500.0), _well("WEST", 100.0)]},
+        "surfaces": {"primary": {"objects": surfaces}},
+    }
+    xsect = _Xsections(inputdata=inputs, psettings={"design": {"zrange": "smart2"}})
+    xsect.load_wells()
+    xsect.load_surfaces()
+
+    wells = xsect.summary["wells"]
+    assert list(wells.index) == ["EAST", "WEST"]
+    assert wells.loc["WEST", ["xmin", "xmax", "zmin", "zmax"]].tolist() == [
+        100.0,
+        400.0,
+        1000.0,
+        1900.0,
+    ]
+    assert xsect.summary["primary"]["zmax"].tolist() == pytest.approx([1400, 1800])
+
+    assert _cfg._config_smart0_zrange(xsect.summary["primary"]) == [1190, 1810]
+
+    xsect.config_complete()
+    zrange = xsect.config["plotsettings"]["design"]["zrange"]
+    assert zrange == {"EAST": [1340.0, 1790.0], "WEST": [1200.0, 1650.0]}
+
+    # wells of the same name are taken one by one
+    twins = [_well("TWIN", 100.0), _well("TWIN", 100.0)]
+    summary = dict(xsect.summary, wells=summarize_wells(twins))
+    zrange = _cfg._config_smart2_zrange(twins, surfaces, summary)
+    assert zrange == {"TWIN": [1200.0, 1650.0]}
+
+
 def test_xsects_settings_class():
     """Test the internal XsectsSettings dataclass class."""
 
@@ -100,6 +283,33 @@ def test_xsects_input_load_surfaces(testdir):
         assert sname in surfnames
 
 
+def test_xsects_input_load_grid(tmp_path):
+    """Test loading a grid with properties, where a grid already read is kept."""
+    grid = xtgeo.create_box_grid((4, 3, 2))
+    grid.to_file(tmp_path / "grid.roff")
+    poro = xtgeo.GridProperty(grid, name="PORO", values=np.linspace(0.1, 0.3, 24))
+    poro.to_file(tmp_path / "poro.roff", name="PORO")
+
+    inputs = {
+        "grid": {
+            "geometry": str(tmp_path / "grid.roff"),
+            "property": {"file": str(tmp_path / "poro.roff"), "name": "PORO"},
+        },
+    }
+    xapp = _Xsections(inputdata=inputs)
+    xapp.load_grid()
+    assert xapp.grid.dimensions == (4, 3, 2)
+    assert xapp.gridproperty.name == "PORO"
+
+    # the grid read for the surfaces is not read once more
+    xapp.config["input"]["surfaces"]["fromgrid"] = str(tmp_path / "grid.roff")
+    xapp.config["input"]["grid"]["property"]["name"] = ["PORO"]
+    loaded = xapp.grid
+    xapp.load_grid()
+    assert xapp.grid is loaded
+    assert list(xapp.gridproperty) == ["PORO"]
+
+
 def test_xsectplot_function(testdir, tmp_path):
     """Make plots using python input."""
 
@@ -135,6 +345,37 @@ def test_xsectplot_function(testdir, tmp_path):
     assert myplot.is_file()
 
 
+def test_xsectplot_function_pdfjoin(testdir, tmp_path):
+    """Make one PDF file, with a page per well."""
+
+    inputs = {
+        "wells": {
+            "folder": str(testdir / WELLSET1),
+            "wildcard": "55_33-A-[14]*",
+            "zonelog": "Zone",
+        },
+        "surfaces": {
+            "primary": {
+                "folder": str(testdir / SURFACESET1),
+                "wildcard": "*",
+            },
+        },
+    }
+    outputs = {
+        "plotfolder": str(tmp_path),
+        "format": "pdf",
+        "pdfjoin": "all.pdf",
+    }
+
+    xsectplot(
+        inputdata=inputs,
+        plotsettings={"design": {"zrange": [1550, 1750]}},
+        output=outputs,
+    )
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["all.pdf"]
+    assert b"/Count 2" in (tmp_path / "all.pdf").read_bytes()
+
+
 def test_xsectplot_function_input_objectlists(testdir, tmp_path):
     """Make plots using python input, where wells and surfaces are preloaded."""
 
@@ -188,7 +429,12 @@ def test_xsectplot_function_input_objectlists(testdir, tmp_path):
     assert myplot.is_file()
 
 
-def test_xsectplot_function_include_cube(testdir, tmp_path):
+@pytest.mark.parametrize(
+    "cubesettings",
+    [{}, {"smoothing": [2, 1], "dtype": "uint16"}],
+    ids=["default", "smoothed_uint16"],
+)
+def test_xsectplot_function_include_cube(testdir, tmp_path, cubesettings):
     """Make plots using python input, where wells and surfaces are preloaded."""
 
     wells = ["55_33-A-4.rmswell"]
@@ -242,6 +488,7 @@ def test_xsectplot_function_include_cube(testdir, tmp_path):
         "cube": {
             "range": [-0.33, 0.33],
             "sampling": "trilinear",
+            **cubesettings,
         },
     }
 